@@ -0,0 +1,60 @@
+"""
+Compare two benchmark result files (see benchmarks/run.py).
+
+Usage:
+    python -m benchmarks.compare baseline.json current.json --threshold 0.10
+
+Prints the median change per (benchmark, size) and exits with status 1
+if anything got slower than the threshold allows.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load_results(path: str) -> dict:
+    """Return {(name, size): result} from a results file."""
+    with open(path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    return {(r["name"], r["size"]): r for r in report["results"]}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """Return rows of (name, size, old_ms, new_ms, change, regressed)."""
+    rows = []
+    for key in sorted(baseline.keys() & current.keys()):
+        old = baseline[key]["median_ms"]
+        new = current[key]["median_ms"]
+        change = (new - old) / old if old else 0.0
+        rows.append((*key, old, new, change, change > threshold))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs.")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="relative slowdown that counts as a regression (default 0.10)"
+    )
+    args = parser.parse_args(argv)
+
+    rows = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+
+    regressions = 0
+    for name, size, old, new, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        regressions += regressed
+        print(
+            f"{name:<32} size={size:<8} {old:10.3f} → {new:10.3f} ms "
+            f"({change:+.1%}){flag}"
+        )
+
+    print(f"\n{len(rows)} compared, {regressions} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,498 @@
+"""
+Headless benchmark suite.
+
+Measures the data layer (loading, sampling, AI response parsing) and
+full view flows (a 20-question quiz session, opening a flashcard deck)
+against synthetic banks of increasing size, and writes the results as
+JSON for comparison between commits.
+
+Usage (from the project root):
+    python -m benchmarks.run --out bench.json
+    python -m benchmarks.run --sizes 60 1000 --repeat 10 --only quiz
+    python -m benchmarks.run --full          # includes the 1M bank
+    python -m benchmarks.compare old.json new.json
+"""
+
+import os
+
+# Must be set before Qt is imported anywhere
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import shiboken6
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+import coach.analytics as analytics
+import coach.attempt_log as attempt_log
+import coach.checkpoint as checkpoint
+import data.question_generator as question_generator
+import data.rotation_manager as rotation_manager
+import data.score_manager as score_manager
+import data.shared_bank as shared_bank
+from data.bank_generator import write_bank, generate_quiz_questions, generate_flashcards
+
+
+DEFAULT_SIZES = (60, 1_000, 10_000, 100_000)
+FULL_SIZES = DEFAULT_SIZES + (1_000_000,)
+
+BENCHMARKS = []
+
+
+def benchmark(name: str, ops: int = 1):
+    """
+    Register a benchmark.
+
+    The decorated function receives a BankContext and returns either
+    `run`, `(setup, run)` or `(setup, run, teardown)`. Only `run` is timed;
+    `teardown` runs once after the last repeat. `ops` is the number of
+    operations one `run` performs, used to report per-operation times.
+    """
+    def register(fn):
+        BENCHMARKS.append((name, ops, fn))
+        return fn
+    return register
+
+
+# ======================================================================
+# BANK CONTEXT
+# ======================================================================
+
+class BankContext:
+    """
+    A temporary data folder with synthetic banks of one size,
+    wired into the data layer in place of the shipped JSON files.
+    """
+
+    def __init__(self, size: int, seed: int = 0):
+        self.size = size
+        self._tmp = tempfile.TemporaryDirectory(prefix="coach-bench-")
+        self.quiz_path = os.path.join(self._tmp.name, "quiz_questions.json")
+        self.flashcards_path = os.path.join(self._tmp.name, "flashcards.json")
+        self.best_score_path = os.path.join(self._tmp.name, "quiz_best_score.json")
+        self.analytics_path = os.path.join(self._tmp.name, "quiz_analytics.json")
+        self.rotation_path = os.path.join(self._tmp.name, "flashcard_rotation.json")
+        self.sessions_dir = os.path.join(self._tmp.name, "sessions")
+        self.marathon_log_path = os.path.join(self._tmp.name, "marathon_attempts.jsonl")
+        self.attempt_log_path = os.path.join(self._tmp.name, "quiz_attempts.jsonl")
+        self.shared_dir = os.path.join(self._tmp.name, "shared")
+
+        write_bank(self.quiz_path, generate_quiz_questions(size, seed=seed))
+        write_bank(self.flashcards_path, generate_flashcards(size, seed=seed))
+
+    def __enter__(self):
+        self._saved = (
+            question_generator.QUIZ_QUESTIONS_FILE,
+            question_generator.FLASHCARDS_FILE,
+            score_manager.BEST_SCORE_FILE,
+            analytics.ANALYTICS_FILE,
+            rotation_manager.ROTATION_FILE,
+            checkpoint.CHECKPOINT_DIR,
+            shared_bank.SHARED_DIR,
+            attempt_log.MARATHON_LOG_FILE,
+            attempt_log.ATTEMPT_LOG_FILE,
+        )
+        question_generator.QUIZ_QUESTIONS_FILE = self.quiz_path
+        question_generator.FLASHCARDS_FILE = self.flashcards_path
+        score_manager.BEST_SCORE_FILE = self.best_score_path
+        analytics.ANALYTICS_FILE = self.analytics_path
+        rotation_manager.ROTATION_FILE = self.rotation_path
+        checkpoint.CHECKPOINT_DIR = self.sessions_dir
+        shared_bank.SHARED_DIR = self.shared_dir
+        attempt_log.MARATHON_LOG_FILE = self.marathon_log_path
+        attempt_log.ATTEMPT_LOG_FILE = self.attempt_log_path
+        self.reset_pools()
+        return self
+
+    def __exit__(self, *_exc):
+        (
+            question_generator.QUIZ_QUESTIONS_FILE,
+            question_generator.FLASHCARDS_FILE,
+            score_manager.BEST_SCORE_FILE,
+            analytics.ANALYTICS_FILE,
+            rotation_manager.ROTATION_FILE,
+            checkpoint.CHECKPOINT_DIR,
+            shared_bank.SHARED_DIR,
+            attempt_log.MARATHON_LOG_FILE,
+            attempt_log.ATTEMPT_LOG_FILE,
+        ) = self._saved
+        analytics.reset_shared_stores()
+        self.reset_pools()
+        self._tmp.cleanup()
+
+    @staticmethod
+    def reset_pools():
+        """Forget the cached pools so the next draw reloads them."""
+        question_generator.QUESTION_POOL = []
+        question_generator.FLASHCARD_POOL = []
+        question_generator.ROTATIONS.clear()
+
+
+class _MainMenuStub(QWidget):
+    """Stands in for MainMenuView; views only show/hide it."""
+    username = "bench"
+
+
+def _delete_widgets(*widgets):
+    """Close widgets (not already deleted by Qt) and flush their deferred deletion."""
+    for widget in widgets:
+        if widget is not None and shiboken6.isValid(widget):
+            widget.close()
+            widget.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+# ======================================================================
+# DATA LAYER BENCHMARKS
+# ======================================================================
+
+@benchmark("load_json.quiz")
+def bench_load_json(ctx):
+    return lambda: question_generator.load_json(ctx.quiz_path)
+
+
+@benchmark("load_shared.quiz")
+def bench_load_shared(ctx):
+    """A later process: map the already published bank, decode one question."""
+    from models.quiz_question import QuizQuestion
+
+    def setup():
+        shared_bank.shared_pool(
+            ctx.quiz_path, QuizQuestion.from_dict, lambda: question_generator.load_json(ctx.quiz_path)
+        )
+
+    def run():
+        bank = shared_bank.SharedBank(shared_bank.bank_path(ctx.quiz_path), QuizQuestion.from_dict)
+        return bank[len(bank) // 2]
+
+    return setup, run
+
+
+@benchmark("load_pack.quiz_session")
+def bench_load_pack(ctx):
+    """A cold 20-question session from a content pack: open, rotate, read blocks."""
+    from data import content_pack
+    from models.quiz_question import QuizQuestion
+
+    path = os.path.splitext(ctx.quiz_path)[0] + content_pack.EXTENSION
+    content_pack.write_pack(path, question_generator.load_json(ctx.quiz_path))
+
+    def run():
+        pack = content_pack.ContentPack(path, QuizQuestion.from_dict)
+        rotation = content_pack.BlockRotation(pack)
+        questions = [pack[rotation.pop()] for _ in range(20)]
+        pack.close()
+        return questions
+
+    return run
+
+
+@benchmark("generate_quiz_question.cold")
+def bench_quiz_cold(ctx):
+    return ctx.reset_pools, question_generator.generate_quiz_question
+
+
+@benchmark("generate_quiz_question.warm", ops=100)
+def bench_quiz_warm(ctx):
+    def setup():
+        ctx.reset_pools()
+        question_generator.generate_quiz_question()
+
+    def run():
+        for _ in range(100):
+            question_generator.generate_quiz_question()
+
+    return setup, run
+
+
+@benchmark("generate_quiz_question.topics", ops=100)
+def bench_quiz_topics(ctx):
+    """Multi-topic selection (the three smallest topics), warm."""
+    topics = []
+
+    def setup():
+        ctx.reset_pools()
+        topics[:] = question_generator.topic_facets().topics[-3:]
+        question_generator.generate_quiz_question(topics=topics)
+
+    def run():
+        for _ in range(100):
+            question_generator.generate_quiz_question(topics=topics)
+
+    return setup, run
+
+
+@benchmark("topic_facets.build")
+def bench_topic_facets(ctx):
+    def setup():
+        question_generator.load_question_pool()
+        question_generator.FACETS = None
+
+    return setup, question_generator.topic_facets
+
+
+@benchmark("generate_flashcard")
+def bench_flashcard(ctx):
+    return ctx.reset_pools, question_generator.generate_flashcard
+
+
+@benchmark("draw_flashcard_deck.user", ops=20)
+def bench_flashcard_deck(ctx):
+    """20-card deck continuing a stored per-user rotation (warm pool)."""
+    def setup():
+        question_generator.load_flashcard_pool()
+
+    return setup, lambda: question_generator.draw_flashcard_deck(20, "bench")
+
+
+@benchmark("highlight.flashcard_bank")
+def bench_highlight_bank(ctx):
+    """Background pass: highlight the code of every card in the bank."""
+    from pages.ui import code_highlight
+
+    def setup():
+        code_highlight.clear_cache()
+        question_generator.load_flashcard_pool()
+
+    return setup, lambda: code_highlight.precompute(question_generator.load_flashcard_pool())
+
+
+@benchmark("ai.parse_flashcards", ops=10)
+def bench_ai_parse(ctx):
+    from data.ai_flashcards_generator import parse_flashcards
+    response = _canned_ai_response(ctx, 10)
+    return lambda: parse_flashcards(response)
+
+
+def _canned_ai_response(ctx, amount: int) -> str:
+    """A model response in the expected format, built from the bank."""
+    cards = question_generator.load_json(ctx.flashcards_path)[:amount]
+    return "\n\n".join(
+        f"- question: {card['question']}\n- answer: {card['answer']}"
+        for card in cards
+    )
+
+
+@benchmark("engine.quiz_session", ops=100)
+def bench_engine_session(ctx):
+    """Headless QuizEngine sessions (no Qt), 100 per run."""
+    from coach.engine import QuizEngine
+
+    def run():
+        for _ in range(100):
+            engine = QuizEngine(load_best=lambda: 0, save_best=lambda _score: None)
+            while (question := engine.next_question()) is not None:
+                engine.answer("abcd".index(question.correct))
+            engine.finish()
+
+    return ctx.reset_pools, run
+
+
+# ======================================================================
+# VIEW BENCHMARKS
+# ======================================================================
+
+@benchmark("view.play_quiz_session", ops=1)
+def bench_quiz_session(ctx):
+    from pages import view_manager
+    from pages.play_quiz_view import PlayQuizView
+
+    menu = _MainMenuStub()
+
+    def run():
+        view = PlayQuizView(main_menu=menu)
+        for step in range(view.engine.total_questions):
+            question = view.engine.current_question
+            correct_index = "abcd".index(question.correct.lower())
+
+            # Alternate correct and wrong answers to cover both paths;
+            # events are processed in between so the next question is
+            # prefetched, as it is while the user reads the feedback
+            if step % 2 == 0:
+                view.check_answer(correct_index)
+                QCoreApplication.processEvents()
+                view._continue_after_wait()
+            else:
+                view.check_answer((correct_index + 1) % 4)
+                QCoreApplication.processEvents()
+                view.overlay._finish()
+
+        _delete_widgets(view, view_manager.current_view())
+
+    return ctx.reset_pools, run
+
+
+@benchmark("view.quiz_continue")
+def bench_quiz_continue(ctx):
+    """From "continue" after a correct answer to the next question painted."""
+    from pages.play_quiz_view import PlayQuizView
+
+    menu = _MainMenuStub()
+    state = {"view": None}
+
+    def setup():
+        view = state["view"]
+        if view is None or view.engine.question_counter >= view.engine.total_questions:
+            _delete_widgets(view)
+            ctx.reset_pools()
+            state["view"] = view = PlayQuizView(main_menu=menu)
+            view.show()
+
+        question = view.engine.current_question
+        view.check_answer("abcd".index(question.correct.lower()))
+        QCoreApplication.processEvents()     # the wait: next question prefetched
+
+    def run():
+        view = state["view"]
+        view._continue_after_wait()
+        view.repaint()
+
+    return setup, run, lambda: _delete_widgets(state["view"])
+
+
+@benchmark("view.flashcards_open_deck")
+def bench_flashcards_open(ctx):
+    from pages.flashcards_view import FlashcardsView
+
+    menu = _MainMenuStub()
+
+    def run():
+        view = FlashcardsView(main_menu=menu)
+        _delete_widgets(view)
+
+    return run
+
+
+@benchmark("view.flashcard_fit_text", ops=20)
+def bench_flashcard_fit_text(ctx):
+    """Fit 20 card fronts into the card face, with cold layout caches."""
+    from pages.flashcards_view import FlashcardsView
+    from pages.ui import fit_text_label
+
+    menu = _MainMenuStub()
+    state = {}
+
+    def setup():
+        fit_text_label.clear_caches()
+        if "view" not in state:
+            state["view"] = FlashcardsView(main_menu=menu)
+            state["view"].show()
+            QCoreApplication.processEvents()
+        state["fronts"] = [card.question for card in question_generator.draw_flashcard_deck(20)]
+
+    def run():
+        card = state["view"].card
+        for front in state["fronts"]:
+            card.set_front_text(front)
+            card.front_label.repaint()
+
+    return setup, run, lambda: _delete_widgets(state.get("view"))
+
+
+# ======================================================================
+# RUNNER
+# ======================================================================
+
+def _repeats_for(size: int, repeat: int) -> int:
+    """Big banks take seconds per run; fewer repetitions keep runs sane."""
+    if size >= 100_000:
+        return max(1, repeat // 5)
+    return repeat
+
+
+def run_benchmark(name, ops, fn, ctx, repeat):
+    prepared = fn(ctx)
+    if not isinstance(prepared, tuple):
+        prepared = (None, prepared)
+    setup, run, teardown = (prepared + (None,))[:3]
+
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter_ns()
+        run()
+        samples.append((time.perf_counter_ns() - start) / ops / 1e6)
+
+    if teardown:
+        teardown()
+
+    return {
+        "name": name,
+        "size": ctx.size,
+        "repeat": repeat,
+        "ops": ops,
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "max_ms": max(samples),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", help="bank sizes to run")
+    parser.add_argument("--full", action="store_true", help="include the 1M bank")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="run only benchmarks whose name contains this")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+    selected = [b for b in BENCHMARKS if not args.only or args.only in b[0]]
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    results = []
+    for size in sizes:
+        with BankContext(size, seed=args.seed) as ctx:
+            for name, ops, fn in selected:
+                result = run_benchmark(name, ops, fn, ctx, _repeats_for(size, args.repeat))
+                results.append(result)
+                print(
+                    f"{name:<32} size={size:<8} "
+                    f"median={result['median_ms']:10.3f} ms  min={result['min_ms']:10.3f} ms"
+                )
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.out}")
+
+    del app
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Headless navigation soak test.
+
+Drives the real screens through the view manager, thousands of times:
+menu → quiz setup → quiz (one answer) → menu, menu → flashcards → menu,
+menu → flashcards mode → AI flashcards → menu, and every so often a
+full quiz with "Play Again". Every --every cycles it samples live
+widgets, top-level windows, Python objects and traced memory
+(diagnostics/leaks.py) and prints what grew.
+
+Exits with status 1 if live widgets or top-level windows grew between
+the end of the warm-up and the last cycle.
+
+Usage (from the project root):
+    python -m benchmarks.soak
+    python -m benchmarks.soak --cycles 500 --every 50 --log soak.jsonl
+"""
+
+import os
+
+# Must be set before Qt is imported anywhere
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import sys
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.run import BankContext
+from diagnostics.leaks import LeakTracker
+from pages import view_manager
+from pages.main_menu_view import MainMenuView
+
+
+FULL_QUIZ_EVERY = 50
+
+
+def _settle():
+    QCoreApplication.processEvents()
+
+
+def _answer(view, correct: bool):
+    """Answer the current question and move past the feedback."""
+    question = view.engine.current_question
+    index = "abcd".index(question.correct.lower())
+    if correct:
+        view.check_answer(index)
+        _settle()
+        view._continue_after_wait()
+    else:
+        view.check_answer((index + 1) % 4)
+        _settle()
+        view.overlay._finish()
+
+
+def quiz_round_trip(menu):
+    menu.open_play_quiz()
+    view_manager.current_view().start_quiz()
+    _answer(view_manager.current_view(), correct=True)
+    view_manager.current_view().return_to_menu()
+
+
+def full_quiz(menu):
+    """A whole quiz, "Play Again", one answer, then back to the menu."""
+    menu.open_play_quiz()
+    view_manager.current_view().start_quiz()
+
+    view = view_manager.current_view()
+    for step in range(view.engine.total_questions):
+        _answer(view, correct=step % 2 == 0)
+
+    view_manager.current_view().restart_quiz()
+    _answer(view_manager.current_view(), correct=False)
+    view_manager.current_view().return_to_menu()
+
+
+def flashcards_round_trip(menu):
+    menu.open_flashcards()
+    view_manager.current_view().next_card()
+    view_manager.current_view().return_to_menu()
+
+
+def ai_round_trip(menu):
+    # No generation: that would call the AI service
+    menu.open_flashcards_mode()
+    view_manager.current_view().open_ai_flashcards()
+    view_manager.current_view().return_to_menu()
+
+
+def cycle(menu, number: int):
+    quiz_round_trip(menu)
+    flashcards_round_trip(menu)
+    ai_round_trip(menu)
+    if number % FULL_QUIZ_EVERY == 0:
+        full_quiz(menu)
+    _settle()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cycles", type=int, default=10_000)
+    parser.add_argument("--every", type=int, default=100, help="sample every N cycles")
+    parser.add_argument("--warmup", type=int, default=2, help="samples before the baseline")
+    parser.add_argument("--size", type=int, default=1000, help="synthetic bank size")
+    parser.add_argument("--log", default="", help="append JSON reports to this file")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    with BankContext(args.size):
+        menu = view_manager.keep_view(MainMenuView(username="soak"))
+        view_manager.navigate(None, menu)
+        tracker = LeakTracker(log_path=args.log)
+
+        baseline = None
+        for number in range(1, args.cycles + 1):
+            cycle(menu, number)
+            if number % args.every:
+                continue
+
+            report = tracker.end_cycle()
+            if tracker.cycle == args.warmup:
+                baseline = tracker.previous
+            if report is not None:
+                print(
+                    f"cycle {number:>6}  widgets={report['widgets']:<5} "
+                    f"({report['widgets_delta']:+d})  top-level={report['top_level']} "
+                    f"objects {report['py_objects_delta']:+d}  "
+                    f"traced {report['traced_kb_delta']:+.1f} KiB"
+                    + (f"  grew: {report['grown_classes']}" if report["grown_classes"] else "")
+                )
+
+        view_manager.release_all()
+        _settle()
+
+    if baseline is None or tracker.previous is baseline:
+        print("Too few cycles to compare against the warm-up baseline.")
+        return 0
+
+    from diagnostics.leaks import compare
+    growth = compare(baseline, tracker.previous)
+    leaked = growth["widgets_delta"] > 0 or growth["top_level_delta"] > 0
+    print(
+        f"after warm-up: widgets {growth['widgets_delta']:+d}, "
+        f"top-level {growth['top_level_delta']:+d}, "
+        f"objects {growth['py_objects_delta']:+d}, "
+        f"traced {growth['traced_kb_delta']:+.1f} KiB"
+        + (f", grew: {growth['grown_classes']}" if leaked else "")
+    )
+
+    del app
+    return 1 if leaked else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+coach/adaptive.py
+
+Adaptive question selection: topics the user keeps missing come up
+more often.
+
+- FenwickTree: weighted sampling over topics in O(log n) per draw,
+  with O(log n) weight updates (no rebuild when a weight changes)
+- LazyShuffle: draws distinct indices from range(n) one at a time
+  (a Fisher-Yates shuffle that only touches the positions it uses),
+  so a session never repeats a question and a 100k-question topic
+  costs nothing up front
+- AdaptiveSampler: a draw_question callable for QuizEngine combining
+  the two; its topic weights follow each answer during the session
+"""
+
+import random
+
+from coach.analytics import AnalyticsStore
+from data.question_generator import questions_by_topic
+
+
+# ======================================================================
+# BUILDING BLOCKS
+# ======================================================================
+
+class FenwickTree:
+    """Binary indexed tree over non-negative weights."""
+
+    def __init__(self, weights):
+        self.weights = [float(w) for w in weights]
+        self.size = len(self.weights)
+        self.tree = [0.0] * (self.size + 1)
+
+        # O(n) build: push each node's sum into its parent
+        for i, weight in enumerate(self.weights, 1):
+            self.tree[i] += weight
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[i]
+
+        self._top_bit = 1 << (self.size.bit_length() - 1) if self.size else 0
+
+    @property
+    def total(self) -> float:
+        total, i = 0.0, self.size
+        while i:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def set(self, index: int, weight: float):
+        delta = weight - self.weights[index]
+        self.weights[index] = float(weight)
+
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, target: float) -> int:
+        """Index of the item whose cumulative weight range holds `target`."""
+        index, bit = 0, self._top_bit
+        while bit:
+            nxt = index + bit
+            if nxt <= self.size and self.tree[nxt] <= target:
+                index = nxt
+                target -= self.tree[nxt]
+            bit >>= 1
+
+        # Float rounding can step past the end (or land on a zero weight)
+        if index >= self.size or self.weights[index] <= 0:
+            return max(i for i, w in enumerate(self.weights) if w > 0)
+        return index
+
+    def sample(self, rng: random.Random) -> int:
+        return self.find(rng.random() * self.total)
+
+
+class LazyShuffle:
+    """Distinct random indices from range(n), one per draw, in O(1)."""
+
+    def __init__(self, n: int, rng: random.Random):
+        self.rng = rng
+        self.remaining = n
+        self._swapped = {}
+
+    def draw(self) -> int:
+        if not self.remaining:
+            raise IndexError("LazyShuffle is exhausted")
+
+        last = self.remaining - 1
+        pick = self.rng.randint(0, last)
+        value = self._swapped.get(pick, pick)
+        self._swapped[pick] = self._swapped.pop(last, last)
+        self.remaining = last
+        return value
+
+
+# ======================================================================
+# SAMPLER
+# ======================================================================
+
+def weakness(attempts: int, correct: int) -> float:
+    """Smoothed error rate: unseen topics count as 50% wrong."""
+    return (attempts - correct + 1) / (attempts + 2)
+
+
+class AdaptiveSampler:
+    """
+    Draws quiz questions with topic probability proportional to the
+    user's (smoothed) error rate in that topic. No question repeats
+    until every question has been drawn.
+
+    Pass it as QuizEngine(draw_question=sampler) and feed answers back
+    with observe(attempt) so the weights follow the session.
+    """
+
+    def __init__(self, topic_questions: dict, topic_stats: dict | None = None,
+                 rng: random.Random | None = None):
+        self.rng = rng or random.Random()
+        self.topics = [topic for topic, questions in topic_questions.items() if questions]
+        self.questions = [topic_questions[topic] for topic in self.topics]
+        self._slot = {topic: i for i, topic in enumerate(self.topics)}
+
+        # [attempts, correct] per topic, starting from the user's history
+        topic_stats = topic_stats or {}
+        self.counts = [list(topic_stats.get(topic, (0, 0))) for topic in self.topics]
+
+        self._new_round()
+
+    @classmethod
+    def for_user(cls, user: str, analytics: AnalyticsStore | None = None,
+                 rng: random.Random | None = None, topics=None) -> "AdaptiveSampler":
+        """
+        Sampler over the quiz bank (or the given `topics`),
+        weighted by the user's stored stats.
+        """
+        analytics = analytics or AnalyticsStore.load()
+        topic_stats = {
+            topic: (stats.attempts, stats.correct)
+            for topic, stats in analytics.topics(user).items()
+        }
+
+        topic_questions = questions_by_topic()
+        if topics:
+            topic_questions = {topic: topic_questions.get(topic, []) for topic in topics}
+        return cls(topic_questions, topic_stats, rng)
+
+    def _new_round(self):
+        self.shuffles = [LazyShuffle(len(questions), self.rng) for questions in self.questions]
+        self.tree = FenwickTree(weakness(*counts) for counts in self.counts)
+        self._active = len(self.topics)   # topics with questions left this round
+
+    def weight(self, topic: str) -> float:
+        return self.tree.weights[self._slot[topic]]
+
+    def __call__(self):
+        if not self.topics:
+            raise ValueError("No quiz questions to draw from")
+        if not self._active:
+            self._new_round()
+
+        slot = self.tree.sample(self.rng)
+        shuffle = self.shuffles[slot]
+        question = self.questions[slot][shuffle.draw()]
+        if not shuffle.remaining:
+            self.tree.set(slot, 0.0)
+            self._active -= 1
+        return question
+
+    def observe(self, attempt):
+        """Update the topic weight after an answer (an engine Attempt)."""
+        slot = self._slot.get(attempt.topic)
+        if slot is None:
+            return
+
+        counts = self.counts[slot]
+        counts[0] += 1
+        counts[1] += bool(attempt.correct)
+        if self.shuffles[slot].remaining:
+            self.tree.set(slot, weakness(*counts))
@@ -0,0 +1,268 @@
+"""
+coach/analytics.py
+
+Per-user, per-topic quiz statistics, updated incrementally.
+
+Every answered question updates two running aggregates in O(1): one
+for its topic and one for the user overall (ALL_TOPICS). Nothing is
+recomputed from attempt logs; the aggregates themselves are persisted
+in a compact JSON file (one short list per user and topic):
+
+    {"version": 1, "users": {"Alina": {"Control Flow": [12, 9, 48213.5, 12, 3, 5], ...}}}
+
+Each list is TopicStats.FIELDS in order.
+
+The GUI keeps one store per process (shared_store(), preloaded off the
+GUI thread by main.py) and saves it with save_in_background(), so
+neither the read nor the write stalls a screen as the file grows.
+"""
+
+import json
+import logging
+import os
+import threading
+
+
+ANALYTICS_FILE = os.path.join("data", "quiz_flashcards", "quiz_analytics.json")
+ALL_TOPICS = "*"
+FORMAT_VERSION = 1
+
+logger = logging.getLogger("coach.analytics")
+
+
+class TopicStats:
+    """Running accuracy, latency and streak counters for one topic."""
+
+    FIELDS = ("attempts", "correct", "latency_total_ms", "latency_count",
+              "streak", "best_streak")
+    __slots__ = FIELDS
+
+    def __init__(self, attempts=0, correct=0, latency_total_ms=0.0, latency_count=0,
+                 streak=0, best_streak=0):
+        self.attempts = attempts
+        self.correct = correct
+        self.latency_total_ms = latency_total_ms
+        self.latency_count = latency_count
+        self.streak = streak              # current run of correct answers
+        self.best_streak = best_streak
+
+    def update(self, correct: bool, latency_ms: float | None = None):
+        self.attempts += 1
+        if correct:
+            self.correct += 1
+            self.streak += 1
+            if self.streak > self.best_streak:
+                self.best_streak = self.streak
+        else:
+            self.streak = 0
+
+        if latency_ms is not None:
+            self.latency_total_ms += latency_ms
+            self.latency_count += 1
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct / self.attempts if self.attempts else 0.0
+
+    @property
+    def mean_latency_ms(self) -> float | None:
+        return self.latency_total_ms / self.latency_count if self.latency_count else None
+
+    def to_list(self) -> list:
+        return [self.attempts, self.correct, round(self.latency_total_ms, 1),
+                self.latency_count, self.streak, self.best_streak]
+
+    @classmethod
+    def from_list(cls, values: list) -> "TopicStats":
+        return cls(*values)
+
+    def to_dict(self) -> dict:
+        return {
+            "attempts": self.attempts,
+            "correct": self.correct,
+            "accuracy": self.accuracy,
+            "mean_latency_ms": self.mean_latency_ms,
+            "streak": self.streak,
+            "best_streak": self.best_streak,
+        }
+
+
+class AnalyticsStore:
+    """
+    {user: {topic: TopicStats}} with a small query API.
+    Call save() or save_in_background() to persist (e.g. once at game over).
+    """
+
+    def __init__(self, path: str | None = None, users: dict | None = None):
+        self.path = path or ANALYTICS_FILE
+        self.users = users or {}
+
+        self._lock = threading.Lock()        # `users`, between record() and a background save
+        self._write_lock = threading.Lock()  # one writer of the file at a time
+        self._save_pending = False
+        self._saver = None
+
+    # ======================================================================
+    # PERSISTENCE
+    # ======================================================================
+
+    @classmethod
+    def load(cls, path: str | None = None) -> "AnalyticsStore":
+        """Load the store; a missing or unreadable file gives an empty one."""
+        path = path or ANALYTICS_FILE
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path)
+
+        users = {
+            user: {topic: TopicStats.from_list(values) for topic, values in topics.items()}
+            for user, topics in data.get("users", {}).items()
+        }
+        return cls(path, users)
+
+    def save(self):
+        """Write the store atomically (tmp file + rename)."""
+        with self._lock:
+            data = self._snapshot()
+        self._write(data)
+
+    def save_in_background(self) -> threading.Thread:
+        """
+        save() on a background thread; returns it. Saves requested while
+        one is running are coalesced into a single write after it.
+        """
+        with self._lock:
+            self._save_pending = True
+            if self._saver is None:
+                self._saver = threading.Thread(target=self._run_saves, name="analytics-save")
+                self._saver.start()
+            return self._saver
+
+    def wait_for_save(self):
+        """Block until no background save is pending."""
+        saver = self._saver
+        if saver is not None:
+            saver.join()
+
+    def _run_saves(self):
+        while True:
+            with self._lock:
+                if not self._save_pending:
+                    self._saver = None
+                    return
+                self._save_pending = False
+                data = self._snapshot()
+            try:
+                self._write(data)
+            except Exception:
+                logger.exception("Could not save analytics to %s", self.path)
+
+    def _snapshot(self) -> dict:
+        return {
+            "version": FORMAT_VERSION,
+            "users": {
+                user: {topic: stats.to_list() for topic, stats in topics.items()}
+                for user, topics in self.users.items()
+            },
+        }
+
+    def _write(self, data: dict):
+        with self._write_lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+            os.replace(tmp_path, self.path)
+
+    # ======================================================================
+    # UPDATES
+    # ======================================================================
+
+    def record(self, user: str, topic: str, correct: bool, latency_ms: float | None = None):
+        """Add one answer to the user's topic and overall aggregates."""
+        with self._lock:
+            topics = self.users.get(user)
+            if topics is None:
+                topics = self.users[user] = {}
+
+            for key in (topic, ALL_TOPICS):
+                stats = topics.get(key)
+                if stats is None:
+                    stats = topics[key] = TopicStats()
+                stats.update(correct, latency_ms)
+
+    def record_attempt(self, user: str, attempt):
+        """Record a coach.engine.Attempt."""
+        self.record(user, attempt.topic, attempt.correct, attempt.latency_ms)
+
+    # ======================================================================
+    # QUERIES
+    # ======================================================================
+
+    def topic_stats(self, user: str, topic: str = ALL_TOPICS) -> TopicStats:
+        """Stats for one topic (ALL_TOPICS for the user overall)."""
+        return self.users.get(user, {}).get(topic) or TopicStats()
+
+    def topics(self, user: str) -> dict:
+        """{topic: TopicStats} for every topic the user has answered."""
+        return {topic: stats for topic, stats in self.users.get(user, {}).items()
+                if topic != ALL_TOPICS}
+
+    def weakest_topics(self, user: str, count: int = 3, min_attempts: int = 1) -> list:
+        """[(topic, TopicStats)] with the lowest accuracy first."""
+        ranked = [(topic, stats) for topic, stats in self.topics(user).items()
+                  if stats.attempts >= min_attempts]
+        ranked.sort(key=lambda item: (item[1].accuracy, -item[1].attempts))
+        return ranked[:count]
+
+    def strongest_topics(self, user: str, count: int = 3, min_attempts: int = 1) -> list:
+        """[(topic, TopicStats)] with the highest accuracy first."""
+        ranked = [(topic, stats) for topic, stats in self.topics(user).items()
+                  if stats.attempts >= min_attempts]
+        ranked.sort(key=lambda item: (item[1].accuracy, item[1].attempts), reverse=True)
+        return ranked[:count]
+
+    def summary(self, user: str) -> dict:
+        """Plain-dict view of everything stored for a user."""
+        return {
+            "overall": self.topic_stats(user).to_dict(),
+            "topics": {topic: stats.to_dict() for topic, stats in sorted(self.topics(user).items())},
+        }
+
+
+# ======================================================================
+# PROCESS-WIDE STORE (GUI)
+# ======================================================================
+
+_stores = {}                    # path -> AnalyticsStore
+_stores_lock = threading.Lock()
+
+
+def shared_store(path: str | None = None) -> AnalyticsStore:
+    """The store for `path`, loaded on first use and then kept for the process."""
+    path = path or ANALYTICS_FILE
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = AnalyticsStore.load(path)
+    return store
+
+
+def preload() -> threading.Thread:
+    """
+    shared_store() on a background thread, so the first quiz finds it
+    loaded. Returns the (already started) thread.
+    """
+    thread = threading.Thread(target=shared_store, name="analytics-load", daemon=True)
+    thread.start()
+    return thread
+
+
+def reset_shared_stores():
+    """Wait for background saves and forget every shared store (tests, benchmarks)."""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.wait_for_save()
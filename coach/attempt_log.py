@@ -0,0 +1,79 @@
+"""
+coach/attempt_log.py
+
+Bounded attempt history for quiz sessions.
+
+AttemptLog keeps the last `window` attempts in memory and appends
+older ones to a JSON lines file, one Attempt.to_dict() record per
+line (plus a "user" field), which `python -m coach.grading` can
+read back; close() appends the attempts still in memory. A marathon
+session therefore uses the same memory after ten questions as after
+ten thousand. Fixed-length sessions log to ATTEMPT_LOG_FILE at their
+end, so per-attempt latencies are kept for later analysis.
+"""
+
+import json
+import os
+from collections import deque
+
+
+MARATHON_LOG_FILE = os.path.join("data", "quiz_flashcards", "marathon_attempts.jsonl")
+ATTEMPT_LOG_FILE = os.path.join("data", "quiz_flashcards", "quiz_attempts.jsonl")
+
+
+class AttemptLog:
+    """
+    Drop-in replacement for QuizEngine's attempts list:
+    append(), len() (all attempts, spilled included) and iteration
+    (recent attempts only, oldest first).
+    """
+
+    def __init__(self, window: int = 200, user: str | None = None, path: str | None = None):
+        self.window = window
+        self.user = user
+        self.path = path or MARATHON_LOG_FILE
+        self.recent = deque()
+        self.spilled = 0
+        self.closed = False
+        self._file = None
+
+    def append(self, attempt):
+        self.recent.append(attempt)
+        if len(self.recent) > self.window:
+            self._spill(self.recent.popleft())
+
+    def _spill(self, attempt):
+        self._write(attempt)
+        self.spilled += 1
+
+    def _write(self, attempt):
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+
+        record = attempt.to_dict()
+        if self.user is not None:
+            record["user"] = self.user
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def __len__(self) -> int:
+        return self.spilled + len(self.recent)
+
+    def __iter__(self):
+        return iter(self.recent)
+
+    def __getitem__(self, index):
+        return self.recent[index]
+
+    def close(self):
+        """
+        End of session: append the recent attempts too and close the
+        file. Later calls do nothing; `recent` stays readable.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        for attempt in self.recent:
+            self._write(attempt)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
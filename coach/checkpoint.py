@@ -0,0 +1,177 @@
+"""
+coach/checkpoint.py
+
+Crash-safe checkpoints of a running quiz session, so a quiz cut short
+by a crash or a closed window can be resumed where it stopped.
+
+Each user's session is two small files in CHECKPOINT_DIR:
+- <key>.json  snapshot: settings, counters, drawn question ids,
+              answers and the draw stream's state
+- <key>.log   events since the snapshot, one JSON array per line:
+              ["q", seq, question_id, stream_state]        (drawn)
+              ["a", seq, question_id, selected, correct,
+               latency_ns, timed_out]                      (answered)
+
+Recording an event appends one line and flushes it (no rewrite, well
+under a millisecond). Every COMPACT_EVERY events the log is folded
+into a new snapshot, written to a tmp file and renamed over the old
+one, and the log is truncated. Events carry a sequence number, so a
+crash between the rename and the truncate never applies one twice.
+"""
+
+import hashlib
+import json
+import os
+
+
+CHECKPOINT_DIR = os.path.join("data", "quiz_flashcards", "sessions")
+
+
+def _key(user: str) -> str:
+    return hashlib.blake2b(user.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class SessionCheckpoint:
+    """
+    Snapshot + append log of one user's quiz session.
+
+    `state` holds:
+        user, options (PlayQuizView settings), seq, counter, correct,
+        total, current (unanswered question id or None), drawn (ids),
+        answers ([id, selected, correct, latency_ns, timed_out]),
+        stream (QuestionStream.state() or None)
+    With a `window` (endless sessions) drawn and answers keep only
+    their last `window` entries.
+    """
+
+    COMPACT_EVERY = 32
+
+    def __init__(self, user: str, state: dict):
+        self.user = user
+        self.state = state
+        self.snapshot_path = os.path.join(CHECKPOINT_DIR, _key(user) + ".json")
+        self.log_path = os.path.join(CHECKPOINT_DIR, _key(user) + ".log")
+        self._log = None
+        self._pending = 0
+
+    # ==================================================================
+    # CREATE / LOAD
+    # ==================================================================
+
+    @classmethod
+    def start(cls, user: str, options: dict, window: int | None = None) -> "SessionCheckpoint":
+        """A new session for `user` (replacing any stored one)."""
+        checkpoint = cls(user, {
+            "user": user,
+            "options": options,
+            "window": window,
+            "seq": 0,
+            "counter": 0,
+            "correct": 0,
+            "total": 0,
+            "current": None,
+            "drawn": [],
+            "answers": [],
+            "stream": None,
+        })
+        checkpoint.compact()
+        return checkpoint
+
+    @classmethod
+    def load(cls, user: str) -> "SessionCheckpoint | None":
+        """The user's unfinished session (snapshot + log replayed), or None."""
+        checkpoint = cls(user, {})
+        try:
+            with open(checkpoint.snapshot_path, "r", encoding="utf-8") as f:
+                checkpoint.state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if os.path.exists(checkpoint.log_path):
+            with open(checkpoint.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        break      # torn last line: the crash happened mid-write
+                    if event[1] > checkpoint.state["seq"]:
+                        checkpoint._apply(event)
+        return checkpoint
+
+    # ==================================================================
+    # EVENTS
+    # ==================================================================
+
+    def _apply(self, event: list):
+        state = self.state
+        state["seq"] = event[1]
+
+        if event[0] == "q":
+            state["counter"] += 1
+            state["current"] = event[2]
+            state["stream"] = event[3]
+            self._push(state["drawn"], event[2])
+        else:
+            state["total"] += 1
+            state["correct"] += bool(event[4])
+            state["current"] = None
+            self._push(state["answers"], event[2:])
+
+    def _push(self, items: list, item):
+        """Append, keeping only the last `window` items when one is set."""
+        items.append(item)
+        window = self.state.get("window")
+        if window is not None and len(items) > window:
+            del items[:-window]
+
+    def _append(self, event: list):
+        self._apply(event)
+
+        if self._log is None:
+            self._log = open(self.log_path, "a", encoding="utf-8")
+        self._log.write(json.dumps(event, separators=(",", ":")) + "\n")
+        self._log.flush()
+
+        self._pending += 1
+        if self._pending >= self.COMPACT_EVERY:
+            self.compact()
+
+    def record_draw(self, question_id, stream_state: list | None = None):
+        self._append(["q", self.state["seq"] + 1, question_id, stream_state])
+
+    def record_answer(self, attempt):
+        self._append([
+            "a", self.state["seq"] + 1, attempt.question_id, attempt.selected,
+            int(attempt.correct), attempt.latency_ns, int(attempt.timed_out)
+        ])
+
+    # ==================================================================
+    # FILES
+    # ==================================================================
+
+    def compact(self):
+        """Fold the log into a fresh snapshot (tmp file + rename)."""
+        os.makedirs(CHECKPOINT_DIR, exist_ok=True)
+
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, separators=(",", ":"))
+        os.replace(tmp_path, self.snapshot_path)
+
+        # Already folded in: the log can start over
+        if self._log is not None:
+            self._log.close()
+        self._log = open(self.log_path, "w", encoding="utf-8")
+        self._pending = 0
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def clear(self):
+        """The session ended normally: forget it."""
+        self.close()
+        for path in (self.snapshot_path, self.log_path):
+            if os.path.exists(path):
+                os.remove(path)
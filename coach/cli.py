@@ -0,0 +1,215 @@
+"""
+coach/cli.py
+
+Terminal front-end for the quiz and flashcards (no display needed,
+works over SSH). Run from the project root:
+
+    python -m coach.cli quiz                  # 20-question quiz
+    python -m coach.cli quiz --questions 5
+    python -m coach.cli quiz --user Alina --adaptive   # favour weak topics
+    python -m coach.cli quiz --endless        # marathon, q to finish
+    python -m coach.cli flashcards --cards 10
+    python -m coach.cli simulate --sessions 10000   # engine load test
+"""
+
+import argparse
+import random
+import sys
+import textwrap
+import time
+
+from coach.adaptive import AdaptiveSampler
+from coach.analytics import AnalyticsStore
+from coach import attempt_log
+from coach.attempt_log import AttemptLog
+from coach.engine import LETTERS, FlashcardEngine, QuizEngine, build_flashcard_deck
+from data.question_generator import questions_by_topic, QuestionStream
+from data.score_manager import load_best_score, save_best_score
+
+
+SCORE_MESSAGES = {
+    "improved": "You improved your score!",
+    "matched": "You matched your best score!",
+    "decreased": "Your score decreased - try again!",
+}
+
+WIDTH = 72
+
+
+def _wrap(text: str, indent: str = "") -> str:
+    return textwrap.fill(text, WIDTH, initial_indent=indent, subsequent_indent=indent)
+
+
+def _ask(prompt: str) -> str | None:
+    """Read one line; None on EOF / Ctrl+C so callers can quit cleanly."""
+    try:
+        return input(prompt).strip().lower()
+    except (EOFError, KeyboardInterrupt):
+        print()
+        return None
+
+
+def _read_choice() -> int | None:
+    """Accepts a-d or 1-4; 'q' (or EOF) quits."""
+    while True:
+        choice = _ask("Your answer (a-d, q to quit): ")
+        if choice is None or choice == "q":
+            return None
+        if choice[:1] in LETTERS:
+            return LETTERS.index(choice[:1])
+        if choice in ("1", "2", "3", "4"):
+            return int(choice) - 1
+        print("Please type a, b, c or d.")
+
+
+# ======================================================================
+# COMMANDS
+# ======================================================================
+
+def run_quiz(questions: int, user: str, adaptive: bool = False, time_limit: float | None = None,
+             endless: bool = False):
+    analytics = AnalyticsStore.load()
+    sampler = AdaptiveSampler.for_user(user, analytics) if adaptive else None
+
+    def record_attempt(attempt):
+        analytics.record_attempt(user, attempt)
+        if sampler is not None:
+            sampler.observe(attempt)
+
+    if endless:
+        # Marathon: permutation-backed stream, own best score, bounded history
+        options = {
+            "draw_question": sampler or QuestionStream(),
+            "load_best": lambda: load_best_score("marathon_best"),
+            "save_best": lambda score: save_best_score(score, "marathon_best"),
+            "attempts": AttemptLog(user=user),
+        }
+    else:
+        # Written out at the end, latencies included
+        options = {
+            "draw_question": sampler,
+            "attempts": AttemptLog(user=user, path=attempt_log.ATTEMPT_LOG_FILE),
+        }
+
+    engine = QuizEngine(total_questions=None if endless else questions,
+                        record_attempt=record_attempt,
+                        time_limit_ms=time_limit * 1000 if time_limit else None,
+                        **options)
+
+    while (question := engine.next_question()) is not None:
+        total = "" if endless else f"/{engine.total_questions}"
+        print(f"\nQuestion {engine.question_counter}{total}"
+              f"   [{question.topic}]   {engine.score_text()}")
+        print(_wrap(question.question))
+        for option in question.options:
+            print(_wrap(option, indent="   "))
+        engine.mark_rendered()
+
+        selected = _read_choice()
+        if selected is None and endless and engine.total_count:
+            break
+        if selected is None:
+            print("Quiz aborted.")
+            return
+
+        # Speed round: an answer typed after the countdown is too late
+        if engine.remaining_ms() == 0:
+            result = engine.time_out()
+            print("Time's up!", end=" ")
+        else:
+            result = engine.answer(selected)
+
+        if result.is_correct:
+            print("Correct!")
+        else:
+            print(f"Incorrect. Correct answer: {question.correct}.")
+            if result.explanation:
+                print(_wrap(result.explanation, indent="   "))
+
+    result = engine.finish()
+    analytics.save()
+    engine.attempts.close()
+    print(f"\nQuiz finished. Score: {result.correct} / {result.total}")
+    print(SCORE_MESSAGES[result.outcome])
+
+
+def run_flashcards(cards: int, user: str):
+    deck = FlashcardEngine(build_flashcard_deck(cards, user))
+
+    while not deck.is_finished:
+        card = deck.current
+        print(f"\nCard {deck.counter_text()}")
+        print(_wrap(card.question))
+        if _ask("(press Enter to reveal, q to quit) ") in (None, "q"):
+            return
+        print(_wrap(card.answer, indent="   "))
+        if _ask("(press Enter for the next card, q to quit) ") in (None, "q"):
+            return
+        deck.advance()
+
+    print("\nGreat job! You finished all flashcards!")
+
+
+def run_simulation(sessions: int, questions: int, seed: int, adaptive: bool = False):
+    """
+    Play `sessions` quizzes with random answers as fast as possible.
+    The best score is not touched.
+    """
+    rng = random.Random(seed)
+    total_correct = 0
+
+    start = time.perf_counter()
+    for _ in range(sessions):
+        sampler = AdaptiveSampler(questions_by_topic(), rng=rng) if adaptive else None
+        engine = QuizEngine(
+            total_questions=questions,
+            draw_question=sampler,
+            load_best=lambda: 0,
+            save_best=lambda _score: None,
+            record_attempt=sampler.observe if sampler else None,
+        )
+        while engine.next_question() is not None:
+            engine.answer(rng.randrange(4))
+        total_correct += engine.finish().correct
+    elapsed = time.perf_counter() - start
+
+    print(f"{sessions} sessions × {questions} questions in {elapsed:.3f} s "
+          f"({sessions / elapsed:,.0f} sessions/s, "
+          f"mean score {total_correct / sessions:.2f})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m coach.cli",
+                                     description="Python Interview Coach in the terminal.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    quiz = sub.add_parser("quiz", help="play a multiple-choice quiz")
+    quiz.add_argument("--questions", type=int, default=20)
+    quiz.add_argument("--user", default="User", help="whose topic stats to update")
+    quiz.add_argument("--adaptive", action="store_true", help="favour the user's weak topics")
+    quiz.add_argument("--time-limit", type=float, metavar="SECONDS",
+                      help="speed round: seconds allowed per question")
+    quiz.add_argument("--endless", action="store_true", help="marathon: no question limit")
+
+    flashcards = sub.add_parser("flashcards", help="study premade flashcards")
+    flashcards.add_argument("--cards", type=int, default=20)
+    flashcards.add_argument("--user", default="User", help="whose card rotation to continue")
+
+    simulate = sub.add_parser("simulate", help="load-test the quiz engine")
+    simulate.add_argument("--sessions", type=int, default=1000)
+    simulate.add_argument("--questions", type=int, default=20)
+    simulate.add_argument("--seed", type=int, default=0)
+    simulate.add_argument("--adaptive", action="store_true", help="use the adaptive sampler")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "quiz":
+        run_quiz(args.questions, args.user, args.adaptive, args.time_limit, args.endless)
+    elif args.command == "flashcards":
+        run_flashcards(args.cards, args.user)
+    else:
+        run_simulation(args.sessions, args.questions, args.seed, args.adaptive)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
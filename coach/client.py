@@ -0,0 +1,230 @@
+"""
+coach/client.py
+
+Client adapter for the local quiz service (coach/server.py).
+
+When COACH_SERVER_URL is set, the views draw questions, flashcards and
+best scores from the server instead of the JSON files:
+
+    COACH_SERVER_URL=http://127.0.0.1:8765 python main.py
+
+Each thread keeps one persistent HTTP/1.1 connection. A quiz session
+draws all of its questions in a single request, so playing a quiz
+costs one round trip at the start and two at game over.
+
+If the server cannot be reached (or answers with an error), the
+adapters log a warning and fall back to the local bank for the rest
+of the run instead of failing the screen.
+"""
+
+import http.client
+import json
+import logging
+import os
+import threading
+from functools import partial
+from urllib.parse import quote, urlsplit
+
+from coach.engine import build_flashcard_deck
+from data.question_generator import generate_quiz_question
+from data.score_manager import load_best_score, save_best_score
+from models.flashcards_questions import OpenQuestion
+from models.quiz_question import QuizQuestion
+
+
+SERVER_URL = os.getenv("COACH_SERVER_URL", "")
+
+logger = logging.getLogger("coach.client")
+
+
+class ServiceError(Exception):
+    """The quiz service answered with an error status."""
+
+
+# Server down, slow, or answering garbage (timeouts and refused
+# connections are OSErrors)
+UNAVAILABLE = (OSError, ServiceError, http.client.HTTPException, ValueError)
+
+
+class CoachClient:
+    """Thin JSON client for the quiz service."""
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.timeout = timeout
+        self._local = threading.local()
+
+    # ======================================================================
+    # TRANSPORT
+    # ======================================================================
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _request(self, method: str, path: str, payload=None):
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"} if body else {}
+
+        # Retry once: the server may have closed an idle keep-alive connection
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (ConnectionError, http.client.HTTPException):
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise
+
+        if response.status >= 400:
+            raise ServiceError(f"{method} {path}: {response.status} {data.decode('utf-8', 'replace')}")
+        return json.loads(data)
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ======================================================================
+    # ENDPOINTS
+    # ======================================================================
+
+    def topics(self) -> dict:
+        return self._request("GET", "/topics")
+
+    def draw_questions(self, count: int, topics=None) -> list:
+        data = self._request("POST", "/sessions", {"count": count, "topics": topics})
+        return [QuizQuestion.from_dict(record) for record in data["questions"]]
+
+    def draw_flashcards(self, count: int) -> list:
+        data = self._request("POST", "/decks", {"count": count})
+        return [OpenQuestion.from_dict(record) for record in data["flashcards"]]
+
+    def check_answer(self, question_id: int, selected: str) -> dict:
+        return self._request("POST", "/answers", {"question_id": question_id, "selected": selected})
+
+    def best_score(self, user: str) -> int:
+        return self._request("GET", "/scores/" + quote(user, safe=""))["best_score"]
+
+    def submit_score(self, user: str, score: int) -> dict:
+        return self._request("POST", "/scores", {"user": user, "score": score})
+
+
+# ======================================================================
+# ADAPTERS
+# ======================================================================
+
+_client = None
+_offline = False    # the server failed once: local bank from then on
+
+
+def get_client() -> CoachClient | None:
+    """The shared client, or None when no server is configured (or reachable)."""
+    global _client
+    if _offline:
+        return None
+    if _client is None and SERVER_URL:
+        _client = CoachClient(SERVER_URL)
+    return _client
+
+
+def _go_offline(what: str, exc: Exception):
+    global _offline
+    if not _offline:
+        logger.warning(
+            "Quiz service at %s is unavailable (%s): using the local bank for %s from now on",
+            SERVER_URL, exc, what
+        )
+    _offline = True
+
+
+def _with_fallback(remote, local, what: str):
+    """Call `remote`; if the server is unavailable, `local` (now and from then on)."""
+    def call(*args):
+        if not _offline:
+            try:
+                return remote(*args)
+            except UNAVAILABLE as exc:
+                _go_offline(what, exc)
+        return local(*args)
+
+    return call
+
+
+class RemoteQuestionSource:
+    """
+    draw_question callable for QuizEngine: fetches the whole session
+    up front, then hands the questions out one by one.
+    """
+
+    def __init__(self, client: CoachClient, count: int, topics=None):
+        self.client = client
+        self.count = count
+        self.topics = list(topics) if topics else None
+        self._questions = []
+        self._draw = _with_fallback(
+            self._draw_remote, partial(generate_quiz_question, topics=self.topics), "quiz questions"
+        )
+
+    def _draw_remote(self) -> QuizQuestion:
+        if not self._questions:
+            self._questions = self.client.draw_questions(self.count, self.topics)
+            self._questions.reverse()
+        return self._questions.pop()
+
+    def __call__(self) -> QuizQuestion:
+        return self._draw()
+
+
+def quiz_engine_options(username: str, total_questions: int, topics=None) -> dict:
+    """
+    Extra QuizEngine arguments for the configured backend:
+    empty (local JSON files) unless COACH_SERVER_URL is set.
+    """
+    client = get_client()
+    if client is None:
+        return {}
+
+    return {
+        "draw_question": RemoteQuestionSource(client, total_questions, topics),
+        "load_best": _with_fallback(
+            lambda: client.best_score(username), load_best_score, "best scores"
+        ),
+        "save_best": _with_fallback(
+            lambda score: client.submit_score(username, score), save_best_score, "best scores"
+        ),
+    }
+
+
+def topic_counts() -> dict | None:
+    """{topic: question count} from the server, or None to use the local bank."""
+    client = get_client()
+    if client is None:
+        return None
+    try:
+        return client.topics()
+    except UNAVAILABLE as exc:
+        _go_offline("topics", exc)
+        return None
+
+
+def flashcard_deck(size: int = 20, user: str | None = None) -> list:
+    """A deck of distinct premade flashcards from the configured backend."""
+    client = get_client()
+    if client is None:
+        return build_flashcard_deck(size, user)
+    try:
+        return client.draw_flashcards(size)
+    except UNAVAILABLE as exc:
+        _go_offline("flashcards", exc)
+        return build_flashcard_deck(size, user)
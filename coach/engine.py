@@ -0,0 +1,320 @@
+"""
+coach/engine.py
+
+UI-free session logic shared by the Qt views, the terminal CLI and
+batch tools:
+- QuizEngine: question sequencing, answer checking, scoring and the
+  best-score comparison at game over
+- FlashcardEngine: stepping through a deck of flashcards
+
+Nothing here imports Qt, so sessions can run without a display.
+"""
+
+import time
+
+from data.question_generator import draw_flashcard_deck, generate_quiz_question
+from data.score_manager import load_best_score, save_best_score
+
+
+LETTERS = "abcd"
+
+
+# ======================================================================
+# RESULTS
+# ======================================================================
+
+class Attempt:
+    """
+    One answered question. `latency_ns` runs from the question being on
+    screen (or drawn, without a display) to the answer's input event;
+    a timed-out attempt has selected == "" and the full time limit.
+    """
+
+    __slots__ = ("question_id", "topic", "selected", "correct", "latency_ns", "timed_out")
+
+    def __init__(self, question_id: int, topic: str, selected: str, correct: bool,
+                 latency_ns: int | None = None, timed_out: bool = False):
+        self.question_id = question_id
+        self.topic = topic
+        self.selected = selected
+        self.correct = correct
+        self.latency_ns = latency_ns
+        self.timed_out = timed_out
+
+    @property
+    def latency_ms(self) -> float | None:
+        return None if self.latency_ns is None else self.latency_ns / 1e6
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class AnswerResult:
+    """Outcome of QuizEngine.answer() (selected_index is None on time-out)."""
+
+    def __init__(self, is_correct: bool, selected_index: int | None, correct_index: int | None,
+                 explanation: str | None):
+        self.is_correct = is_correct
+        self.selected_index = selected_index
+        self.correct_index = correct_index   # None if the key is not a/b/c/d
+        self.explanation = explanation
+
+
+class QuizResult:
+    """
+    Final score plus comparison with the stored best score.
+    `outcome` is one of 'improved', 'matched', 'decreased'.
+    """
+
+    def __init__(self, correct: int, total: int, previous_best: int, outcome: str):
+        self.correct = correct
+        self.total = total
+        self.previous_best = previous_best
+        self.outcome = outcome
+
+
+def record_final_score(correct: int, total: int,
+                       load_best=load_best_score, save_best=save_best_score) -> QuizResult:
+    """Compare a final score with the best one and store it if it improved."""
+    previous_best = load_best()
+
+    if correct > previous_best:
+        outcome = "improved"
+        save_best(correct)
+    elif correct == previous_best:
+        outcome = "matched"
+    else:
+        outcome = "decreased"
+
+    return QuizResult(correct, total, previous_best, outcome)
+
+
+# ======================================================================
+# QUIZ
+# ======================================================================
+
+class QuizEngine:
+    """
+    A multiple-choice quiz session.
+
+    State machine:
+        ready ──next_question()──▶ asking ──answer()──▶ answered
+          ▲                                                │
+          └──────────────── next_question() ◀──────────────┘
+        next_question() returns None and moves to 'finished' once
+        `total_questions` have been asked (never if it is None: an
+        endless session); finish() then returns the QuizResult (and
+        updates the best score).
+
+    `attempts` collects every Attempt: a list unless an AttemptLog is
+    passed, which keeps memory bounded in endless sessions.
+
+    `record_attempt`, if given, is called with every Attempt as it is
+    answered (e.g. AnalyticsStore updates). prefetch() may draw the
+    next question early, while the current one is answered; the next
+    next_question() then hands it over without drawing.
+
+    Timing uses one monotonic nanosecond `clock` (perf_counter_ns).
+    With `time_limit_ms` (speed round) each question has a countdown,
+    see remaining_ms() and time_out(). A view calls mark_rendered()
+    once the question is on screen, so latencies and countdowns start
+    from what the user actually sees.
+    """
+
+    READY = "ready"
+    ASKING = "asking"
+    ANSWERED = "answered"
+    FINISHED = "finished"
+
+    def __init__(self, total_questions: int | None = 20, draw_question=None,
+                 load_best=load_best_score, save_best=save_best_score, record_attempt=None,
+                 time_limit_ms: int | None = None, clock=time.perf_counter_ns, attempts=None):
+        self.total_questions = total_questions
+        self.time_limit_ms = time_limit_ms
+        self.clock = clock
+        self.draw_question = draw_question or generate_quiz_question
+        self.load_best = load_best
+        self.save_best = save_best
+        self.record_attempt = record_attempt
+
+        self.state = self.READY
+        self.correct_count = 0
+        self.total_count = 0
+        self.question_counter = 0
+        self.current_question = None
+        self.attempts = attempts if attempts is not None else []
+        self.result = None
+        self._asked_at = None
+        self._prefetched = None
+
+    # --------------------------------------------------------------
+    # Queries
+    # --------------------------------------------------------------
+
+    @property
+    def is_endless(self) -> bool:
+        return self.total_questions is None
+
+    @property
+    def is_finished(self) -> bool:
+        return not self.is_endless and self.question_counter >= self.total_questions
+
+    def score_text(self) -> str:
+        return f"Score: {self.correct_count}/{self.total_count}"
+
+    def remaining_ms(self, now_ns: int | None = None) -> float | None:
+        """Countdown for the current question (None without a time limit)."""
+        if self.time_limit_ms is None or self.state != self.ASKING:
+            return None
+        now_ns = self.clock() if now_ns is None else now_ns
+        return max(0.0, self.time_limit_ms - (now_ns - self._asked_at) / 1e6)
+
+    # --------------------------------------------------------------
+    # Transitions
+    # --------------------------------------------------------------
+
+    def next_question(self):
+        """Draw and return the next question, or None when the quiz is over."""
+        if self.state == self.ASKING:
+            raise RuntimeError("Current question has not been answered yet")
+
+        if self.is_finished:
+            self.state = self.FINISHED
+            self.current_question = None
+            return None
+
+        self.question_counter += 1
+        if self._prefetched is not None:
+            self.current_question, self._prefetched = self._prefetched, None
+        else:
+            self.current_question = self.draw_question()
+        self.state = self.ASKING
+        self._asked_at = self.clock()
+        return self.current_question
+
+    def mark_rendered(self, at_ns: int | None = None):
+        """Restart the current question's clock: it is now on screen."""
+        if self.state == self.ASKING:
+            self._asked_at = self.clock() if at_ns is None else at_ns
+
+    def prefetch(self):
+        """
+        Draw the next question ahead of time (only once the current one
+        is answered, so samplers have seen the attempt). Returns it, or
+        None when no question is left.
+        """
+        if self._prefetched is None and self.state == self.ANSWERED and not self.is_finished:
+            self._prefetched = self.draw_question()
+        return self._prefetched
+
+    def answer(self, selected_index: int, at_ns: int | None = None) -> AnswerResult:
+        """
+        Check the answer for the current question (0-3 → a-d).
+        `at_ns` is the input event's clock() reading (now if omitted).
+        """
+        if self.state != self.ASKING:
+            raise RuntimeError(f"Cannot answer in state '{self.state}'")
+
+        at_ns = self.clock() if at_ns is None else at_ns
+        selected_letter = LETTERS[selected_index]
+        is_correct = self.current_question.is_correct(selected_letter)
+
+        return self._record(selected_letter, is_correct, at_ns - self._asked_at, selected_index)
+
+    def time_out(self) -> AnswerResult:
+        """Speed round: the countdown ran out; the question counts as wrong."""
+        if self.state != self.ASKING:
+            raise RuntimeError(f"Cannot time out in state '{self.state}'")
+
+        latency_ns = int((self.time_limit_ms or 0) * 1_000_000)
+        return self._record("", False, latency_ns, None, timed_out=True)
+
+    def _record(self, selected_letter: str, is_correct: bool, latency_ns: int,
+                selected_index: int | None, timed_out: bool = False) -> AnswerResult:
+        question = self.current_question
+
+        self.total_count += 1
+        if is_correct:
+            self.correct_count += 1
+
+        attempt = Attempt(question.id, question.topic, selected_letter, is_correct,
+                          latency_ns, timed_out)
+        self.attempts.append(attempt)
+        if self.record_attempt is not None:
+            self.record_attempt(attempt)
+        self.state = self.ANSWERED
+
+        correct_letter = question.correct.strip().lower()[:1]
+        correct_index = LETTERS.index(correct_letter) if correct_letter in LETTERS else None
+
+        return AnswerResult(is_correct, selected_index, correct_index, question.explanation)
+
+    def restore(self, question_counter: int, correct_count: int, total_count: int,
+                attempts=(), current_question=None):
+        """
+        Continue a checkpointed session: counters and attempts as they
+        were, asking `current_question` again if it was not answered.
+        """
+        self.question_counter = question_counter
+        self.correct_count = correct_count
+        self.total_count = total_count
+        for attempt in attempts:
+            self.attempts.append(attempt)
+
+        self.current_question = current_question
+        if current_question is not None:
+            self.state = self.ASKING
+            self._asked_at = self.clock()
+        else:
+            self.state = self.ANSWERED if question_counter else self.READY
+
+    def finish(self) -> QuizResult:
+        """End the session and compare with (and maybe update) the best score."""
+        if self.result is None:
+            self.state = self.FINISHED
+            self.result = record_final_score(
+                self.correct_count, self.total_count, self.load_best, self.save_best
+            )
+        return self.result
+
+
+# ======================================================================
+# FLASHCARDS
+# ======================================================================
+
+def build_flashcard_deck(size: int = 20, user: str | None = None) -> list:
+    """
+    Draw a deck of `size` distinct premade flashcards; with a `user`,
+    continuing their rotation through the whole bank.
+    """
+    return draw_flashcard_deck(size, user)
+
+
+class FlashcardEngine:
+    """Steps through a deck of OpenQuestion cards."""
+
+    def __init__(self, cards: list):
+        self.cards = cards
+        self.current_index = 0
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.current_index >= len(self.cards)
+
+    @property
+    def current(self):
+        return None if self.is_finished else self.cards[self.current_index]
+
+    def counter_text(self) -> str:
+        """Text like '3/20' ('0/0' for an empty deck)."""
+        if not self.cards:
+            return "0/0"
+        return f"{min(self.current_index + 1, len(self.cards))}/{len(self.cards)}"
+
+    def advance(self) -> bool:
+        """Move to the next card. Returns False once the deck is done."""
+        self.current_index += 1
+        return not self.is_finished
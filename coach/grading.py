@@ -0,0 +1,227 @@
+"""
+coach/grading.py
+
+Batch (re)grading of logged quiz attempts with NumPy.
+
+The answer key is turned into lookup arrays indexed by question id
+(correct option as 0-3, topic as a small int), so grading a million
+attempts is a few array operations instead of a million calls to
+QuizQuestion.is_correct(). Per-topic totals come out of the same pass
+via np.bincount.
+
+Selected answers follow is_correct(): surrounding whitespace and case
+are ignored and only the first letter counts ('B', ' b)', 'b. text').
+
+Regrade archived attempts (JSON lines with question_id and selected,
+e.g. Attempt.to_dict() records) after fixing the answer key:
+
+    python -m coach.grading attempts.jsonl
+    python -m coach.grading attempts.jsonl --bank data/quiz_flashcards/quiz_questions.json --json
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+from data.question_generator import QUIZ_QUESTIONS_FILE, load_json
+
+
+LETTERS = "abcd"
+NO_ANSWER = 255      # key code for ids without a usable a-d answer
+NO_SELECTION = -1    # selection code for answers that are not a-d / 0-3
+
+
+class GradeReport:
+    """
+    Result of AnswerKey.grade_report():
+    - correct:   bool array, one entry per attempt (False for unknown ids)
+    - known:     bool array, True where the question id is in the key
+    - per_topic: {topic: {"attempts", "correct", "accuracy"}}
+    - no_key:    attempts on questions whose key has no usable answer
+                 (always graded False)
+    """
+
+    def __init__(self, correct, known, per_topic: dict, no_key: int = 0):
+        self.correct = correct
+        self.known = known
+        self.per_topic = per_topic
+        self.no_key = no_key
+
+    @property
+    def attempts(self) -> int:
+        return int(self.known.sum())
+
+    @property
+    def correct_count(self) -> int:
+        return int(self.correct.sum())
+
+    @property
+    def unknown(self) -> int:
+        return int(self.known.size - self.known.sum())
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct_count / self.attempts if self.attempts else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "attempts": self.attempts,
+            "correct": self.correct_count,
+            "accuracy": self.accuracy,
+            "unknown_ids": self.unknown,
+            "no_key": self.no_key,
+            "per_topic": self.per_topic,
+        }
+
+
+class AnswerKey:
+    """Correct answers and topics of a quiz bank, as arrays indexed by id."""
+
+    def __init__(self, records: list):
+        max_id = max((record["id"] for record in records), default=0)
+
+        self.topics = sorted({record["topic"] for record in records})
+        topic_codes = {topic: code for code, topic in enumerate(self.topics)}
+
+        self.correct_codes = np.full(max_id + 1, NO_ANSWER, dtype=np.uint8)
+        self.topic_codes = np.full(max_id + 1, -1, dtype=np.int32)
+
+        for record in records:
+            letter = str(record["correct"]).strip().lower()
+            if len(letter) == 1 and letter in LETTERS:
+                self.correct_codes[record["id"]] = LETTERS.index(letter)
+            self.topic_codes[record["id"]] = topic_codes[record["topic"]]
+
+    @classmethod
+    def from_file(cls, path: str = QUIZ_QUESTIONS_FILE) -> "AnswerKey":
+        return cls(load_json(path))
+
+    # ======================================================================
+    # GRADING
+    # ======================================================================
+
+    def _known(self, ids):
+        in_range = (ids >= 0) & (ids < self.topic_codes.size)
+        known = np.zeros(ids.size, dtype=bool)
+        known[in_range] = self.topic_codes[ids[in_range]] >= 0
+        return known
+
+    def grade(self, question_ids, selected):
+        """
+        Bool array: is each selected answer correct?
+        `selected` holds letters/strings or 0-3 option indices.
+        Unknown question ids, keys without a usable answer and
+        selections outside a-d / 0-3 all grade as False.
+        """
+        ids = np.asarray(question_ids, dtype=np.int64)
+        codes = selected_codes(selected)
+        if codes.shape != ids.shape:
+            raise ValueError(f"{ids.size} question ids but {codes.size} answers")
+
+        known = self._known(ids)
+        keys = self.correct_codes[ids[known]]
+        correct = np.zeros(ids.size, dtype=bool)
+        correct[known] = (keys == codes[known]) & (keys != NO_ANSWER)
+        return correct
+
+    def grade_report(self, question_ids, selected) -> GradeReport:
+        """Grade a batch and aggregate it per topic in one pass."""
+        ids = np.asarray(question_ids, dtype=np.int64)
+        correct = self.grade(ids, selected)
+        known = self._known(ids)
+
+        topics = self.topic_codes[ids[known]]
+        attempts = np.bincount(topics, minlength=len(self.topics))
+        hits = np.bincount(topics, weights=correct[known], minlength=len(self.topics))
+
+        per_topic = {
+            topic: {
+                "attempts": int(attempts[code]),
+                "correct": int(hits[code]),
+                "accuracy": float(hits[code] / attempts[code]),
+            }
+            for code, topic in enumerate(self.topics)
+            if attempts[code]
+        }
+        no_key = int((self.correct_codes[ids[known]] == NO_ANSWER).sum())
+        return GradeReport(correct, known, per_topic, no_key)
+
+
+def selected_codes(selected):
+    """
+    Convert selected answers to option codes (0-3 for a-d, NO_SELECTION
+    for answers that cannot be correct), vectorized.
+    """
+    array = np.asarray(selected)
+
+    if array.dtype.kind in "iu":
+        return np.where((array >= 0) & (array < 4), array, NO_SELECTION).astype(np.int64)
+
+    if array.dtype.kind == "S":
+        array = array.astype("U")
+    elif array.dtype.kind != "U":
+        array = array.astype(str)
+
+    # Single characters (the common case for logged attempts) need no strip
+    if array.dtype.itemsize > 4:
+        array = np.char.strip(array)
+    first = array.astype("U1").view(np.uint32).astype(np.int64)
+
+    first = np.where((first >= ord("A")) & (first <= ord("D")), first + 32, first)
+    codes = first - ord("a")
+    return np.where((codes >= 0) & (codes < 4), codes, NO_SELECTION)
+
+
+# ======================================================================
+# CLI
+# ======================================================================
+
+def load_attempts(path: str):
+    """(question ids, selected, stored correct flags or None) from a JSON-lines log."""
+    ids, selected, stored = [], [], []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            attempt = json.loads(line)
+            ids.append(attempt["question_id"])
+            selected.append(attempt["selected"])
+            stored.append(attempt.get("correct"))
+
+    has_stored = bool(stored) and None not in stored
+    return (np.array(ids, dtype=np.int64), np.array(selected, dtype=str),
+            np.array(stored, dtype=bool) if has_stored else None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regrade logged quiz attempts.")
+    parser.add_argument("attempts", help="JSON-lines file with question_id and selected")
+    parser.add_argument("--bank", default=QUIZ_QUESTIONS_FILE, help="answer key (quiz bank)")
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args(argv)
+
+    ids, selected, stored = load_attempts(args.attempts)
+    report = AnswerKey.from_file(args.bank).grade_report(ids, selected)
+
+    summary = report.to_dict()
+    if stored is not None:
+        summary["changed"] = int((report.correct != stored)[report.known].sum())
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    for topic, info in sorted(summary["per_topic"].items(), key=lambda kv: kv[1]["accuracy"]):
+        print(f"{topic:<40} {info['correct']:>9}/{info['attempts']:<9} {info['accuracy']:7.1%}")
+    print(f"{'Total':<40} {summary['correct']:>9}/{summary['attempts']:<9} {summary['accuracy']:7.1%}")
+    if summary["unknown_ids"]:
+        print(f"{summary['unknown_ids']} attempt(s) reference unknown question ids")
+    if summary["no_key"]:
+        print(f"{summary['no_key']} attempt(s) are on questions without a usable answer key")
+    if "changed" in summary:
+        print(f"{summary['changed']} attempt(s) grade differently than when logged")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,452 @@
+"""
+coach/server.py
+
+Optional local HTTP/JSON quiz service, so many app instances can share
+one warm process instead of each reading the JSON files from a shared
+drive.
+
+Stdlib only: asyncio streams with HTTP/1.1 keep-alive, an in-memory
+indexed question bank, pre-serialized (ETag-cached) responses for the
+read-only endpoints, and a small pool of SQLite connections for scores.
+
+Run from the project root:
+
+    python -m coach.server --port 8765 --db scores.sqlite3
+
+and point the app at it:
+
+    COACH_SERVER_URL=http://127.0.0.1:8765 python main.py
+
+Endpoints (all JSON):
+    GET  /health
+    GET  /topics                       {topic: question count}
+    GET  /questions                    the whole quiz bank
+    GET  /questions/<id>
+    GET  /flashcards                   the whole flashcard bank
+    POST /sessions   {count, topics?}  draw `count` distinct questions
+    POST /decks      {count}           draw `count` distinct flashcards
+    POST /answers    {question_id, selected}
+    GET  /scores/<user>
+    POST /scores     {user, score}     compare + store best score
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import queue
+import random
+import sqlite3
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
+
+from data.question_generator import (
+    FLASHCARDS_FILE, QUIZ_QUESTIONS_FILE, load_json
+)
+from models.quiz_question import QuizQuestion
+
+
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 1024 * 1024
+KEEP_ALIVE_TIMEOUT = 30
+
+REASONS = {
+    200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ======================================================================
+# QUESTION BANK
+# ======================================================================
+
+class QuestionBank:
+    """Quiz questions and flashcards indexed by id and topic."""
+
+    def __init__(self, quiz_records: list, flashcard_records: list):
+        self.quiz_records = quiz_records
+        self.flashcard_records = flashcard_records
+
+        self.by_id = {record["id"]: record for record in quiz_records}
+        self.ids_by_topic = {}
+        for record in quiz_records:
+            self.ids_by_topic.setdefault(record["topic"], []).append(record["id"])
+        self.all_ids = list(self.by_id)
+
+    @classmethod
+    def load(cls, quiz_path: str = QUIZ_QUESTIONS_FILE,
+             flashcards_path: str = FLASHCARDS_FILE) -> "QuestionBank":
+        return cls(load_json(quiz_path), load_json(flashcards_path))
+
+    def topic_counts(self) -> dict:
+        return {topic: len(ids) for topic, ids in self.ids_by_topic.items()}
+
+    def draw(self, count: int, topics=None) -> list:
+        if not topics:
+            ids = self.all_ids
+        else:
+            ids = []
+            for topic in topics:
+                if topic not in self.ids_by_topic:
+                    raise HTTPError(404, f"No quiz questions found for topic: {topic}")
+                ids.extend(self.ids_by_topic[topic])
+        chosen = random.sample(ids, min(count, len(ids)))
+        return [self.by_id[question_id] for question_id in chosen]
+
+    def draw_flashcards(self, count: int) -> list:
+        return random.sample(self.flashcard_records, min(count, len(self.flashcard_records)))
+
+
+# ======================================================================
+# SCORE STORE (pooled SQLite)
+# ======================================================================
+
+class SQLitePool:
+    """
+    A fixed set of SQLite connections shared by a thread pool of the
+    same size, so blocking database calls never run on the event loop.
+    """
+
+    def __init__(self, path: str, size: int = 4):
+        self._connections = queue.Queue()
+        for _ in range(size):
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._connections.put(conn)
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="sqlite")
+
+    def _call(self, fn, args):
+        conn = self._connections.get()
+        try:
+            return fn(conn, *args)
+        finally:
+            self._connections.put(conn)
+
+    async def run(self, fn, *args):
+        """Run fn(connection, *args) on a pooled connection."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args)
+
+    def close(self):
+        self._executor.shutdown()
+        while not self._connections.empty():
+            self._connections.get().close()
+
+
+class ScoreStore:
+    """Best score per user."""
+
+    def __init__(self, pool: SQLitePool):
+        self.pool = pool
+
+    @staticmethod
+    def create_schema(path: str):
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS best_scores ("
+                " user TEXT PRIMARY KEY,"
+                " best_score INTEGER NOT NULL)"
+            )
+
+    @staticmethod
+    def _get(conn, user: str) -> int:
+        row = conn.execute(
+            "SELECT best_score FROM best_scores WHERE user = ?", (user,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _submit(conn, user: str, score: int) -> dict:
+        """Same comparison as coach.engine.record_final_score, atomically."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            previous = ScoreStore._get(conn, user)
+            if score > previous:
+                outcome = "improved"
+                conn.execute(
+                    "INSERT INTO best_scores (user, best_score) VALUES (?, ?) "
+                    "ON CONFLICT(user) DO UPDATE SET best_score = excluded.best_score",
+                    (user, score),
+                )
+            elif score == previous:
+                outcome = "matched"
+            else:
+                outcome = "decreased"
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return {"previous_best": previous, "outcome": outcome}
+
+    async def get(self, user: str) -> int:
+        return await self.pool.run(self._get, user)
+
+    async def submit(self, user: str, score: int) -> dict:
+        return await self.pool.run(self._submit, user, score)
+
+
+# ======================================================================
+# HTTP SERVICE
+# ======================================================================
+
+class CachedResponse:
+    """A pre-serialized JSON body with its ETag."""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, payload):
+        self.body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.etag = '"' + hashlib.blake2b(self.body, digest_size=12).hexdigest() + '"'
+
+
+class QuizService:
+    """Routes requests to the bank and score store."""
+
+    def __init__(self, bank: QuestionBank, scores: ScoreStore):
+        self.bank = bank
+        self.scores = scores
+
+        # Read-only endpoints are serialized once
+        self._cache = {
+            "/topics": CachedResponse(bank.topic_counts()),
+            "/questions": CachedResponse(bank.quiz_records),
+            "/flashcards": CachedResponse(bank.flashcard_records),
+            "/health": CachedResponse({"status": "ok", "questions": len(bank.by_id)}),
+        }
+        self._question_cache = {}
+
+    # --------------------------------------------------------------
+    # Routing
+    # --------------------------------------------------------------
+
+    async def handle(self, method: str, path: str, body: dict | None):
+        """Return a CachedResponse, or a payload to serialize."""
+        if method == "GET":
+            cached = self._cache.get(path)
+            if cached is not None:
+                return cached
+            if path.startswith("/questions/"):
+                return self._question(path.rsplit("/", 1)[1])
+            if path.startswith("/scores/"):
+                user = unquote(path.split("/", 2)[2])
+                return {"user": user, "best_score": await self.scores.get(user)}
+            raise HTTPError(404, f"No such endpoint: {path}")
+
+        if method == "POST":
+            body = body or {}
+            if path == "/sessions":
+                count = _int_field(body, "count", default=20, minimum=0)
+                topics = body.get("topics") or ([body["topic"]] if body.get("topic") else None)
+                if topics is not None and not (
+                    isinstance(topics, list) and all(isinstance(topic, str) for topic in topics)
+                ):
+                    raise HTTPError(400, "Field 'topics' must be a list of topic names")
+                return {"questions": self.bank.draw(count, topics)}
+            if path == "/decks":
+                count = _int_field(body, "count", default=20, minimum=0)
+                return {"flashcards": self.bank.draw_flashcards(count)}
+            if path == "/answers":
+                return self._check_answer(body)
+            if path == "/scores":
+                user = str(body.get("user") or "User")
+                return await self.scores.submit(user, _int_field(body, "score"))
+            raise HTTPError(404, f"No such endpoint: {path}")
+
+        raise HTTPError(405, f"Method not allowed: {method}")
+
+    def _question(self, raw_id: str) -> CachedResponse:
+        try:
+            question_id = int(raw_id)
+        except ValueError:
+            raise HTTPError(400, f"Invalid question id: {raw_id}") from None
+
+        cached = self._question_cache.get(question_id)
+        if cached is None:
+            record = self.bank.by_id.get(question_id)
+            if record is None:
+                raise HTTPError(404, f"No question with id {question_id}")
+            cached = self._question_cache[question_id] = CachedResponse(record)
+        return cached
+
+    def _check_answer(self, body: dict) -> dict:
+        question_id = _int_field(body, "question_id")
+        record = self.bank.by_id.get(question_id)
+        if record is None:
+            raise HTTPError(404, f"No question with id {question_id}")
+
+        question = QuizQuestion.from_dict(record)
+        return {
+            "correct": question.is_correct(str(body.get("selected", ""))),
+            "correct_letter": question.correct,
+            "explanation": question.explanation,
+        }
+
+    # --------------------------------------------------------------
+    # Connection handling
+    # --------------------------------------------------------------
+
+    async def serve_connection(self, reader, writer):
+        """Serve requests on one keep-alive connection."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT
+                    )
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError,
+                        asyncio.LimitOverrunError, ConnectionError):
+                    return
+
+                keep_alive = await self._serve_request(head, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    async def _serve_request(self, head: bytes, reader, writer) -> bool:
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            self._write(writer, 400, {"error": "Malformed request line"}, keep_alive=False)
+            return False
+
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+
+        try:
+            length = self._content_length(headers)
+        except HTTPError as exc:
+            # The declared body is still unread: the next request can't be found
+            self._write(writer, exc.status, {"error": str(exc)}, keep_alive=False)
+            return False
+
+        try:
+            body = await self._read_body(length, reader)
+            path = target.split("?", 1)[0]
+            response = await self.handle(method, path, body)
+        except HTTPError as exc:
+            self._write(writer, exc.status, {"error": str(exc)}, keep_alive)
+            return keep_alive
+        except Exception:  # keep serving other requests; details stay in the server log
+            traceback.print_exc()
+            self._write(writer, 500, {"error": "Internal server error"}, keep_alive=False)
+            return False
+
+        if isinstance(response, CachedResponse):
+            if headers.get("if-none-match") == response.etag:
+                self._write_raw(writer, 304, b"", keep_alive, response.etag)
+            else:
+                self._write_raw(writer, 200, response.body, keep_alive, response.etag)
+        else:
+            self._write(writer, 200, response, keep_alive)
+        return keep_alive
+
+    @staticmethod
+    def _content_length(headers: dict) -> int:
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise HTTPError(400, "Invalid Content-Length") from None
+        if length < 0:
+            raise HTTPError(400, "Invalid Content-Length")
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(413, "Request body too large")
+        return length
+
+    @staticmethod
+    async def _read_body(length: int, reader) -> dict | None:
+        if not length:
+            return None
+        try:
+            body = json.loads(await reader.readexactly(length))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise HTTPError(400, "Body is not valid JSON") from None
+        if not isinstance(body, dict):
+            raise HTTPError(400, "Body must be a JSON object")
+        return body
+
+    def _write(self, writer, status: int, payload, keep_alive: bool):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._write_raw(writer, status, body, keep_alive)
+
+    @staticmethod
+    def _write_raw(writer, status: int, body: bytes, keep_alive: bool, etag: str | None = None):
+        head = [
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if etag:
+            head.append(f"ETag: {etag}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+
+def _int_field(body: dict, name: str, default: int | None = None,
+               minimum: int | None = None) -> int:
+    value = body.get(name, default)
+    try:
+        number = int(value)
+    except (TypeError, ValueError, OverflowError):
+        raise HTTPError(400, f"Field '{name}' must be an integer") from None
+    if minimum is not None and number < minimum:
+        raise HTTPError(400, f"Field '{name}' must be at least {minimum}")
+    return number
+
+
+# ======================================================================
+# ENTRY POINT
+# ======================================================================
+
+async def serve(host: str, port: int, db_path: str, pool_size: int):
+    ScoreStore.create_schema(db_path)
+    pool = SQLitePool(db_path, size=pool_size)
+    service = QuizService(QuestionBank.load(), ScoreStore(pool))
+
+    server = await asyncio.start_server(
+        service.serve_connection, host, port,
+        limit=MAX_HEADER_BYTES, backlog=1024,
+    )
+    print(f"Quiz service on http://{host}:{port} "
+          f"({len(service.bank.by_id)} questions, {len(service.bank.flashcard_records)} flashcards)")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        pool.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local quiz HTTP service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--db", default="scores.sqlite3", help="SQLite file for best scores")
+    parser.add_argument("--pool-size", type=int, default=4, help="SQLite connections")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.db, args.pool_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,26 @@
 import os
 from openai import OpenAI
 from dotenv import load_dotenv
+from diagnostics.instrumentation import timed
 from models.flashcards_questions import OpenQuestion
 
 # Load .env file if it exists
 load_dotenv()
 
-# Read API key safely
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Created on first use, so importing this module (e.g. for parsing)
+# does not require an API key
+client = None
 
+
+def _get_client() -> OpenAI:
+    """Return the shared OpenAI client, reading the API key safely."""
+    global client
+    if client is None:
+        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return client
+
+
+@timed("ai.generate_flashcards")
 def generate_ai_flashcards(prompt: str, amount: int = 10):
     """
     Generate flashcards using GPT-4.1-mini.
@@ -31,7 +43,7 @@ def generate_ai_flashcards(prompt: str, amount: int = 10):
 
     user_prompt = f"Generate {amount} flashcards about: {prompt}"
 
-    response = client.chat.completions.create(
+    response = _get_client().chat.completions.create(
         model="gpt-4.1-mini",
         temperature=0.2,
         messages=[
@@ -41,6 +53,14 @@ def generate_ai_flashcards(prompt: str, amount: int = 10):
     )
 
     text = response.choices[0].message.content
+    return parse_flashcards(text)
+
+
+def parse_flashcards(text: str):
+    """
+    Parse a model response in the "- question: / - answer:" format.
+    Returns a list of OpenQuestion objects.
+    """
     blocks = text.split("- question:")
     cards = []
 
@@ -0,0 +1,273 @@
+"""
+Synthetic question-bank generator for scale testing.
+
+Emits schema-valid quiz_questions.json / flashcards.json files of any
+size, deterministically seeded, with a configurable topic distribution
+and text length.
+
+Topic distributions:
+    shipped    - same topic proportions as the shipped banks
+                 (e.g. 16 vs 1 questions between the biggest and
+                 smallest quiz topics)
+    uniform    - every topic equally likely
+    zipf:<s>   - Zipf-like skew with exponent s (e.g. zipf:1.2)
+
+Usage (from the project root):
+    python -m data.bank_generator --quiz 100000 --flashcards 50000 --out-dir /tmp/bank
+    python -m data.bank_generator --quiz 1000000 --topic-dist zipf:1.1 --seed 7 \\
+        --question-words 8-40 --explanation-words 10-120
+    python -m data.bank_generator --quiz 100000 --format pack --out-dir /tmp/bank
+"""
+
+import argparse
+import json
+import os
+import random
+from itertools import accumulate
+
+from data.content_pack import write_pack
+
+
+# ----------------------------------------------------------------------
+# Topics (with the counts found in the shipped banks)
+# ----------------------------------------------------------------------
+
+QUIZ_TOPIC_COUNTS = {
+    "Built-in Functions & Standard Library": 16,
+    "Data Types & Collections": 15,
+    "Operators & Expressions": 7,
+    "Functions & Modules": 6,
+    "Syntax & Structure": 5,
+    "Variables & Identifiers": 4,
+    "History & General": 3,
+    "Control Flow": 2,
+    "OOP (Object-Oriented Programming)": 1,
+    "Other / Advanced Topics": 1,
+}
+
+FLASHCARD_TOPIC_COUNTS = {
+    "Language & Syntax": 10,
+    "Data & Collections": 10,
+    "OOP": 6,
+    "Functions & Modules": 5,
+    "Testing, Docs & Environment": 3,
+    "Control Flow & Iteration": 2,
+}
+
+WORDS = (
+    "python list tuple dict set function module class object method "
+    "return yield lambda import loop range string integer float value "
+    "variable scope global local iterator generator decorator exception "
+    "argument keyword default mutable immutable slice index key hash "
+    "comprehension closure inheritance instance attribute property "
+    "context manager file thread process memory reference copy"
+).split()
+
+CODE_SNIPPETS = [
+    "x = [i * i for i in range(5)]",
+    "def add(a, b):\n    return a + b",
+    "with open('f.txt') as f:\n    data = f.read()",
+    "d = {'a': 1}\nprint(d.get('b', 0))",
+    "nums = sorted(nums, key=abs)",
+]
+
+
+# ======================================================================
+# DISTRIBUTIONS
+# ======================================================================
+
+def topic_weights(spec: str, topic_counts: dict) -> dict:
+    """Return {topic: weight} for a distribution spec (see module doc)."""
+    topics = list(topic_counts)
+
+    if spec == "shipped":
+        return dict(topic_counts)
+    if spec == "uniform":
+        return {topic: 1 for topic in topics}
+    if spec.startswith("zipf:"):
+        exponent = float(spec.split(":", 1)[1])
+        return {topic: 1 / (rank ** exponent) for rank, topic in enumerate(topics, 1)}
+
+    raise ValueError(f"Unknown topic distribution: {spec}")
+
+
+def parse_range(text: str) -> tuple[int, int]:
+    """Parse '8-40' (or a single number) into a (low, high) word range."""
+    low, _, high = text.partition("-")
+    low = int(low)
+    high = int(high) if high else low
+    if low < 1 or high < low:
+        raise ValueError(f"Invalid word range: {text}")
+    return low, high
+
+
+class _TextSource:
+    """Seeded random text of a given word-count range."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def words(self, length: tuple[int, int]) -> str:
+        count = self.rng.randint(*length)
+        return " ".join(self.rng.choices(WORDS, k=count))
+
+    def sentence(self, length: tuple[int, int], end: str = ".") -> str:
+        return self.words(length).capitalize() + end
+
+
+class _TopicSampler:
+    """Draws topics according to a weight table."""
+
+    def __init__(self, rng: random.Random, weights: dict):
+        self.rng = rng
+        self.topics = list(weights)
+        self.cum_weights = list(accumulate(weights.values()))
+
+    def draw(self) -> str:
+        return self.rng.choices(self.topics, cum_weights=self.cum_weights)[0]
+
+
+# ======================================================================
+# RECORD GENERATORS
+# ======================================================================
+
+def generate_quiz_questions(
+    count: int,
+    seed: int = 0,
+    topic_dist: str = "shipped",
+    question_words: tuple[int, int] = (6, 24),
+    option_words: tuple[int, int] = (1, 6),
+    explanation_words: tuple[int, int] = (8, 45),
+    start_id: int = 1,
+):
+    """Yield `count` quiz question dicts in the QuizQuestion schema."""
+    rng = random.Random(f"quiz:{seed}")
+    text = _TextSource(rng)
+    topics = _TopicSampler(rng, topic_weights(topic_dist, QUIZ_TOPIC_COUNTS))
+
+    for question_id in range(start_id, start_id + count):
+        yield {
+            "id": question_id,
+            "topic": topics.draw(),
+            "question": text.sentence(question_words, end="?"),
+            "options": [f"{letter}) {text.words(option_words)}" for letter in "abcd"],
+            "correct": rng.choice("abcd"),
+            "explanation": text.sentence(explanation_words),
+        }
+
+
+def generate_flashcards(
+    count: int,
+    seed: int = 0,
+    topic_dist: str = "shipped",
+    question_words: tuple[int, int] = (6, 20),
+    answer_words: tuple[int, int] = (10, 50),
+    code_ratio: float = 0.2,
+    start_id: int = 1,
+):
+    """
+    Yield `count` flashcard dicts in the flashcards.json schema.
+    About `code_ratio` of the answers end with a short code snippet.
+    """
+    rng = random.Random(f"flashcards:{seed}")
+    text = _TextSource(rng)
+    topics = _TopicSampler(rng, topic_weights(topic_dist, FLASHCARD_TOPIC_COUNTS))
+
+    for card_id in range(start_id, start_id + count):
+        answer = text.sentence(answer_words)
+        if rng.random() < code_ratio:
+            answer += "\n" + rng.choice(CODE_SNIPPETS)
+
+        yield {
+            "id": card_id,
+            "topic": topics.draw(),
+            "question": text.sentence(question_words, end="?"),
+            "answer": answer,
+        }
+
+
+# ======================================================================
+# WRITERS
+# ======================================================================
+
+def write_json(path: str, records):
+    """
+    Stream records into a JSON array without holding them all in memory.
+    Output is compact (one record per line), loadable by load_json().
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i, record in enumerate(records):
+            f.write(",\n" if i else "\n")
+            f.write(json.dumps(record, ensure_ascii=False))
+        f.write("\n]\n")
+    os.replace(tmp_path, path)
+
+
+# Output formats understood by the loader, by name
+WRITERS = {
+    "json": write_json,
+    "pack": write_pack,     # compressed blocks, see data/content_pack.py
+}
+
+
+def write_bank(path: str, records, fmt: str | None = None):
+    """Write records to `path` in the given format (default: from its extension)."""
+    if fmt is None:
+        extension = os.path.splitext(path)[1].lstrip(".")
+        fmt = extension if extension in WRITERS else "json"
+    try:
+        writer = WRITERS[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown bank format: {fmt}") from None
+    writer(path, records)
+
+
+# ======================================================================
+# CLI
+# ======================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic question banks.")
+    parser.add_argument("--quiz", type=int, default=0, help="number of quiz questions")
+    parser.add_argument("--flashcards", type=int, default=0, help="number of flashcards")
+    parser.add_argument("--out-dir", default=".", help="output folder")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--topic-dist", default="shipped",
+                        help="shipped | uniform | zipf:<exponent>")
+    parser.add_argument("--format", default="json", choices=sorted(WRITERS))
+    parser.add_argument("--question-words", type=parse_range, default=(6, 24))
+    parser.add_argument("--answer-words", type=parse_range, default=(10, 50))
+    parser.add_argument("--explanation-words", type=parse_range, default=(8, 45))
+    parser.add_argument("--code-ratio", type=float, default=0.2,
+                        help="share of flashcard answers with a code snippet")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    if args.quiz:
+        path = os.path.join(args.out_dir, f"quiz_questions.{args.format}")
+        write_bank(path, generate_quiz_questions(
+            args.quiz, seed=args.seed, topic_dist=args.topic_dist,
+            question_words=args.question_words,
+            explanation_words=args.explanation_words,
+        ), args.format)
+        print(f"Wrote {args.quiz} quiz questions to {path}")
+
+    if args.flashcards:
+        path = os.path.join(args.out_dir, f"flashcards.{args.format}")
+        write_bank(path, generate_flashcards(
+            args.flashcards, seed=args.seed, topic_dist=args.topic_dist,
+            question_words=args.question_words,
+            answer_words=args.answer_words,
+            code_ratio=args.code_ratio,
+        ), args.format)
+        print(f"Wrote {args.flashcards} flashcards to {path}")
+
+    if not (args.quiz or args.flashcards):
+        parser.error("nothing to generate: pass --quiz and/or --flashcards")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+"""
+Bulk import of external quiz banks (Sanfoundry / InterviewBit dumps,
+spreadsheets, JSON exports) into quiz_questions.json.
+
+Every raw record is normalized into the QuizQuestion schema, validated
+(exactly four options, a correct letter a-d, a question text, no
+repeated source ids) and de-duplicated by content, then merged into the
+bank. Existing questions keep their ids; new ones get max(id)+1, +2, ...
+in input order, so re-running the same import adds nothing.
+
+Parsing and validation fan out over a process pool in chunks. Results
+come back in input order and are streamed straight into the output
+file (via a temporary file + rename), so memory stays bounded apart
+from the existing bank and one content hash per question.
+
+Input formats (picked from the file extension, or --format):
+    text   Sanfoundry-style blocks separated by blank lines:
+               Topic: Operators & Expressions      (optional, sticky)
+
+               1. What is the output of print(2 ** 3)?
+               a) 6
+               b) 8
+               c) 9
+               d) 5
+               Answer: b
+               Explanation: ** is exponentiation.
+    csv    columns topic, question, a, b, c, d (or option_a..option_d,
+           or options separated by '|'), correct (or answer),
+           explanation, id
+    jsonl  one record per line
+    json   an array of records
+
+`correct` may be a letter (a-d, any case, 'c)' or 'Answer: c'), a
+one-based number 1-4, or the full text of the right option.
+
+Usage (from the project root):
+    python -m data.import_bank sanfoundry.txt interviewbit.csv
+    python -m data.import_bank dump.jsonl --dry-run --errors rejects.jsonl
+    python -m data.import_bank big.csv --bank /tmp/bank.json --workers 8
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+from data.bank_generator import write_bank
+from data.question_generator import QUIZ_QUESTIONS_FILE, load_json
+
+
+LETTERS = "abcd"
+CHUNK_SIZE = 5000
+DEFAULT_TOPIC = "Other / Advanced Topics"
+
+FORMATS_BY_EXTENSION = {
+    ".txt": "text",
+    ".text": "text",
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".json": "json",
+}
+
+_OPTION_LINE = re.compile(r"^\s*\(?([a-dA-D])[).]\s+(.*)$")
+_OPTION_PREFIX = re.compile(r"^\s*\(?[a-dA-D][).](?:\s+|$)")
+_QUESTION_NUMBER = re.compile(r"^\s*(?:Q(?:uestion)?\s*)?\d+[.)]\s*", re.IGNORECASE)
+_LABEL = re.compile(r"^\s*(answer|explanation|topic)\s*:\s*(.*)$", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+class ImportStats:
+    """Counters for one import run."""
+
+    def __init__(self):
+        self.read = 0
+        self.imported = 0
+        self.duplicates = 0
+        self.invalid = 0
+
+    def __str__(self):
+        return (f"read {self.read}, imported {self.imported}, "
+                f"duplicates {self.duplicates}, invalid {self.invalid}")
+
+
+# ======================================================================
+# READING (main process)
+# ======================================================================
+
+def detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        return FORMATS_BY_EXTENSION[ext]
+    except KeyError:
+        raise ValueError(f"Cannot guess the format of {path}; pass --format") from None
+
+
+def iter_raw(path: str, fmt: str, default_topic: str = DEFAULT_TOPIC):
+    """
+    Yield (line number, payload) items from a source file. Payloads are
+    raw lines (jsonl), text blocks, CSV rows or records (json); the
+    actual parsing happens in the workers.
+    """
+    if fmt == "text":
+        yield from _iter_text_blocks(path, default_topic)
+    elif fmt == "jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    yield line_no, line
+    elif fmt == "csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+    elif fmt == "json":
+        for index, record in enumerate(load_json(path), 1):
+            yield index, record
+    else:
+        raise ValueError(f"Unknown input format: {fmt}")
+
+
+def _iter_text_blocks(path: str, default_topic: str):
+    """Split a text dump into blank-line separated blocks, tracking 'Topic:' lines."""
+    topic = default_topic
+    block = []
+    start = 0
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(chain(f, [""]), 1):
+            if line.strip():
+                if not block:
+                    start = line_no
+                block.append(line.rstrip())
+                continue
+            if not block:
+                continue
+
+            label = _LABEL.match(block[0])
+            if len(block) == 1 and label and label.group(1).lower() == "topic":
+                topic = label.group(2).strip() or default_topic
+            else:
+                yield start, {"topic": topic, "text": "\n".join(block)}
+            block = []
+
+
+def iter_chunks(items, size: int = CHUNK_SIZE):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ======================================================================
+# PARSING & VALIDATION (worker processes)
+# ======================================================================
+
+def parse_text_block(block: dict) -> dict:
+    """Turn one Sanfoundry-style block into a raw record."""
+    question_lines, options = [], []
+    correct, explanation = None, []
+    section = "question"
+
+    for line in block["text"].split("\n"):
+        label = _LABEL.match(line)
+        option = _OPTION_LINE.match(line) if section in ("question", "options") else None
+
+        if label and label.group(1).lower() == "answer":
+            correct, section = label.group(2), "answer"
+        elif label and label.group(1).lower() == "explanation":
+            explanation, section = [label.group(2)], "explanation"
+        elif option and (section == "options" or question_lines):
+            options.append(option.group(2))
+            section = "options"
+        elif section == "question":
+            question_lines.append(line)
+        elif section == "options":
+            options[-1] += "\n" + line
+        elif section == "explanation":
+            explanation.append(line)
+
+    if question_lines:
+        question_lines[0] = _QUESTION_NUMBER.sub("", question_lines[0], count=1)
+
+    return {
+        "topic": block["topic"],
+        "question": "\n".join(question_lines),
+        "options": options,
+        "correct": correct,
+        "explanation": " ".join(part.strip() for part in explanation) or None,
+    }
+
+
+def _csv_options(row: dict) -> list:
+    if row.get("options"):
+        return row["options"].split("|")
+    for keys in (LETTERS, [f"option_{letter}" for letter in LETTERS]):
+        if any(row.get(key) for key in keys):
+            return [row.get(key) or "" for key in keys]
+    return []
+
+
+def parse_csv_row(row: dict) -> dict:
+    row = {key.strip().lower(): (value or "").strip()
+           for key, value in row.items() if key is not None}
+    return {
+        "id": row.get("id") or None,
+        "topic": row.get("topic"),
+        "question": row.get("question"),
+        "options": _csv_options(row),
+        "correct": row.get("correct") or row.get("answer"),
+        "explanation": row.get("explanation") or None,
+    }
+
+
+def _clean(text) -> str:
+    return str(text or "").strip()
+
+
+def _resolve_correct(value, options: list) -> str:
+    """Map the many ways sources write the answer onto 'a'-'d'."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        value = str(value)
+    text = _clean(value)
+    label = _LABEL.match(text)
+    if label and label.group(1).lower() == "answer":
+        text = label.group(2).strip()
+
+    if text in ("1", "2", "3", "4"):
+        return LETTERS[int(text) - 1]
+    letter = text.strip("().").lower()
+    if len(letter) == 1 and letter in LETTERS:
+        return letter
+
+    # The option text itself (with or without its 'c) ' prefix)
+    target = _WHITESPACE.sub(" ", _OPTION_PREFIX.sub("", text)).lower()
+    for letter, option in zip(LETTERS, options):
+        if _WHITESPACE.sub(" ", option).lower() == target:
+            return letter
+
+    raise ValueError(f"correct answer {value!r} is not a-d, 1-4 or an option's text")
+
+
+def normalize(raw: dict, default_topic: str = DEFAULT_TOPIC) -> dict:
+    """
+    Normalize a raw record into the QuizQuestion schema (without an id).
+    Raises ValueError with a readable message if it is not valid.
+    """
+    question = _clean(raw.get("question"))
+    if not question:
+        raise ValueError("missing question text")
+
+    options = [_OPTION_PREFIX.sub("", _clean(option), count=1) for option in raw.get("options") or []]
+    if len(options) != 4:
+        raise ValueError(f"expected 4 options, got {len(options)}")
+    if not all(options):
+        raise ValueError("empty option text")
+
+    return {
+        "topic": _clean(raw.get("topic")) or default_topic,
+        "question": question,
+        "options": [f"{letter}) {option}" for letter, option in zip(LETTERS, options)],
+        "correct": _resolve_correct(raw.get("correct"), options),
+        "explanation": _clean(raw.get("explanation")) or None,
+    }
+
+
+def content_key(record: dict) -> bytes:
+    """Hash of the question and options, ignoring case and spacing."""
+    text = "\x1f".join([record["question"], *record["options"]])
+    text = _WHITESPACE.sub(" ", text).strip().lower()
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).digest()
+
+
+def _source_id(raw: dict):
+    value = raw.get("id")
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"id {value!r} is not an integer") from None
+
+
+def process_chunk(task: tuple) -> tuple[str, list, list]:
+    """
+    Worker entry point: (source, fmt, default_topic, items) ->
+    (source, [(line, source id, record, content key)], [(source, line, error)]).
+    """
+    source, fmt, default_topic, items = task
+    records, errors = [], []
+
+    for line_no, payload in items:
+        try:
+            if fmt == "text":
+                raw = parse_text_block(payload)
+            elif fmt == "csv":
+                raw = parse_csv_row(payload)
+            elif fmt == "jsonl":
+                raw = json.loads(payload)
+            else:
+                raw = payload
+            if not isinstance(raw, dict):
+                raise ValueError("record is not an object")
+
+            record = normalize(raw, default_topic)
+            records.append((line_no, _source_id(raw), record, content_key(record)))
+        except ValueError as exc:  # includes json.JSONDecodeError
+            errors.append((source, line_no, str(exc)))
+
+    return source, records, errors
+
+
+# ======================================================================
+# PIPELINE
+# ======================================================================
+
+def _ordered_results(fn, tasks, workers: int):
+    """
+    Map fn over tasks in a process pool, yielding results in input order
+    with a bounded number of chunks in flight.
+    """
+    if workers <= 1:
+        yield from map(fn, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(fn, task))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def import_records(sources: list, existing: list, stats: ImportStats, on_error=None,
+                   default_topic: str = DEFAULT_TOPIC, workers: int | None = None,
+                   chunk_size: int = CHUNK_SIZE):
+    """
+    Yield the new, de-duplicated questions from `sources` (a list of
+    (path, fmt) pairs) with ids continuing after the `existing` bank.
+    Invalid records are counted in `stats` and passed to
+    on_error(source, line, message).
+    """
+    workers = workers or os.cpu_count() or 1
+    seen = {content_key(record) for record in existing}
+    next_id = max((record["id"] for record in existing), default=0) + 1
+    source_ids = {path: set() for path, _fmt in sources}
+
+    def tasks():
+        for path, fmt in sources:
+            for chunk in iter_chunks(iter_raw(path, fmt, default_topic), chunk_size):
+                yield path, fmt, default_topic, chunk
+
+    def reject(source, line_no, message):
+        stats.invalid += 1
+        if on_error:
+            on_error(source, line_no, message)
+
+    for source, records, errors in _ordered_results(process_chunk, tasks(), workers):
+        stats.read += len(records) + len(errors)
+        for error in errors:
+            reject(*error)
+
+        for line_no, source_id, record, key in records:
+            if source_id is not None:
+                if source_id in source_ids[source]:
+                    reject(source, line_no, f"duplicate id {source_id}")
+                    continue
+                source_ids[source].add(source_id)
+
+            if key in seen:
+                stats.duplicates += 1
+                continue
+
+            seen.add(key)
+            stats.imported += 1
+            yield {"id": next_id, **record}
+            next_id += 1
+
+
+# ======================================================================
+# CLI
+# ======================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import external quiz banks.")
+    parser.add_argument("inputs", nargs="+", help="source files")
+    parser.add_argument("--format", choices=["text", "csv", "jsonl", "json"],
+                        help="input format (default: from the file extension)")
+    parser.add_argument("--bank", default=QUIZ_QUESTIONS_FILE, help="bank to merge into")
+    parser.add_argument("--out", help="output file (default: overwrite --bank)")
+    parser.add_argument("--default-topic", default=DEFAULT_TOPIC)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--errors", help="write rejected records to this JSON-lines file")
+    parser.add_argument("--dry-run", action="store_true", help="validate only, write nothing")
+    args = parser.parse_args(argv)
+
+    try:
+        sources = [(path, args.format or detect_format(path)) for path in args.inputs]
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    existing = load_json(args.bank) if os.path.exists(args.bank) else []
+    stats = ImportStats()
+
+    error_file = open(args.errors, "w", encoding="utf-8") if args.errors else None
+
+    def on_error(source, line_no, message):
+        if error_file:
+            error_file.write(json.dumps({"source": source, "line": line_no, "error": message}) + "\n")
+        elif stats.invalid <= 20:
+            print(f"{source}:{line_no}: {message}", file=sys.stderr)
+
+    start = time.perf_counter()
+    try:
+        new_records = import_records(
+            sources, existing, stats, on_error,
+            default_topic=args.default_topic,
+            workers=args.workers, chunk_size=args.chunk_size,
+        )
+        if args.dry_run:
+            for _ in new_records:
+                pass
+        else:
+            write_bank(args.out or args.bank, chain(existing, new_records))
+    finally:
+        if error_file:
+            error_file.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"{stats} in {elapsed:.1f} s"
+          + ("" if args.dry_run else f" -> {args.out or args.bank}"))
+    return 1 if stats.invalid and not stats.imported else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
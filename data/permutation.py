@@ -0,0 +1,124 @@
+"""
+Seeded pseudo-random permutations that never materialize the order.
+
+FeistelPermutation(size, seed)[i] is the i-th element of a shuffled
+range(size), computed in O(1) (a 4-round Feistel network over the next
+even power of two, with cycle walking back into range). A Rotation
+walks that order with a cursor, so "deal k items without repeats
+until everything has been dealt" costs O(k) and four small integers
+of state, whatever the pool size.
+"""
+
+import random
+
+
+_MASK64 = (1 << 64) - 1
+
+
+class FeistelPermutation:
+    """A bijection on range(size), fixed by `seed`."""
+
+    ROUNDS = 4
+
+    def __init__(self, size: int, seed):
+        if size < 1:
+            raise ValueError("Permutation size must be at least 1")
+
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        bits += bits & 1                 # balanced halves
+        self.half_bits = bits // 2
+        self.half_mask = (1 << self.half_bits) - 1
+
+        rng = random.Random(seed)
+        self.keys = [rng.getrandbits(64) for _ in range(self.ROUNDS)]
+
+    def _round(self, value: int, key: int) -> int:
+        # splitmix64-style mixing
+        x = (value * 0x9E3779B97F4A7C15 + key) & _MASK64
+        x ^= x >> 29
+        x = (x * 0xBF58476D1CE4E5B9) & _MASK64
+        x ^= x >> 32
+        return x & self.half_mask
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> self.half_bits, value & self.half_mask
+        for key in self.keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self.half_bits) | right
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError("permutation index out of range")
+
+        # The domain is at most 4x size, so this loops ~4 times at worst on average
+        value = self._encrypt(index)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+
+class Rotation:
+    """
+    Cursor over successive permutations ("epochs") of range(size).
+    Every index comes up once per epoch; state is
+    (seed, epoch, cursor, size).
+    """
+
+    __slots__ = ("seed", "epoch", "cursor", "size", "_perm")
+
+    def __init__(self, seed: int, epoch: int = 0, cursor: int = 0, size: int = 0):
+        self.seed = seed
+        self.epoch = epoch
+        self.cursor = cursor
+        self.size = size
+        self._perm = None
+
+    @classmethod
+    def new(cls, size: int) -> "Rotation":
+        return cls(random.getrandbits(32), 0, 0, size)
+
+    def resize(self, size: int):
+        """Start a fresh epoch if the pool size changed."""
+        if size != self.size:
+            self.size = size
+            self._next_epoch()
+
+    def _next_epoch(self):
+        self.epoch += 1
+        self.cursor = 0
+        self._perm = None
+
+    def _permutation(self) -> FeistelPermutation:
+        if self._perm is None:
+            self._perm = FeistelPermutation(self.size, f"{self.seed}:{self.epoch}")
+        return self._perm
+
+    def take(self, count: int) -> list:
+        """
+        The next `count` indices. When an epoch ends mid-deal, indices
+        already dealt in this call are skipped so one deal has no
+        duplicates (as long as count <= size).
+        """
+        taken, seen = [], set()
+        while len(taken) < count and self.size:
+            if self.cursor >= self.size:
+                self._next_epoch()
+            index = self._permutation()[self.cursor]
+            self.cursor += 1
+
+            if index in seen and len(seen) < self.size:
+                continue
+            seen.add(index)
+            taken.append(index)
+        return taken
+
+    def to_list(self) -> list:
+        return [self.seed, self.epoch, self.cursor, self.size]
+
+    @classmethod
+    def from_list(cls, values: list) -> "Rotation":
+        return cls(*values)
@@ -3,14 +3,25 @@ Utility functions for loading and generating:
 - flashcards (OpenQuestion)
 - multiple-choice quiz questions (QuizQuestion)
 
-Supports optional topic filtering and ensures quiz questions
-do not repeat until the full pool is exhausted.
+Supports optional topic filtering (one or several topics) and ensures
+quiz questions do not repeat until the selection is exhausted.
+
+With COACH_SHARED_BANK=1 the pools are SharedBank sequences mapped
+from a file shared by every app process (data/shared_bank.py) instead
+of lists decoded from the JSON in each process. A bank file ending in
+.pack (COACH_QUIZ_BANK / COACH_FLASHCARDS_BANK) is a compressed content
+pack read block by block (data/content_pack.py).
 """
 
 import os
 import json
 import random
+from array import array
 
+from data import content_pack, rotation_manager, shared_bank
+from data.permutation import Rotation
+from data.topic_facets import TopicFacets
+from diagnostics.instrumentation import timed
 from models.flashcards_questions import OpenQuestion
 from models.quiz_question import QuizQuestion
 
@@ -20,15 +31,26 @@ from models.quiz_question import QuizQuestion
 # ----------------------------------------------------------------------
 
 QUESTION_POOL = []      # Loaded once from JSON
-UNUSED_QUESTIONS = []   # Rotates until empty
+FLASHCARD_POOL = []     # Loaded once from JSON
+ROTATIONS = {}          # topic selection -> (questions, unused indexes), rotates until empty
+TOPIC_INDEX = {}        # topic -> questions, built from QUESTION_POOL
+ID_INDEX = {}           # id -> question, built from QUESTION_POOL
+FACETS = None           # TopicFacets, built from QUESTION_POOL
 
 
 # ----------------------------------------------------------------------
 # File paths
 # ----------------------------------------------------------------------
 
-FLASHCARDS_FILE = os.path.join("data", "quiz_flashcards", "flashcards.json")
-QUIZ_QUESTIONS_FILE = os.path.join("data", "quiz_flashcards", "quiz_questions.json")
+FLASHCARDS_FILE = os.getenv("COACH_FLASHCARDS_BANK") or os.path.join(
+    "data", "quiz_flashcards", "flashcards.json"
+)
+QUIZ_QUESTIONS_FILE = os.getenv("COACH_QUIZ_BANK") or os.path.join(
+    "data", "quiz_flashcards", "quiz_questions.json"
+)
+
+# Pools answering the index methods (row_of, topic_rows, select, ...)
+INDEXED_POOLS = (shared_bank.SharedBank, content_pack.ContentPack)
 
 
 # ======================================================================
@@ -36,29 +58,68 @@ QUIZ_QUESTIONS_FILE = os.path.join("data", "quiz_flashcards", "quiz_questions.js
 # ======================================================================
 
 def load_json(path: str) -> list:
-    """Load and return JSON content from a file."""
+    """Load and return JSON content from a file (or every record of a pack)."""
+    if content_pack.is_pack(path):
+        return content_pack.read_records(path)
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def _load_pool(path: str, decode):
+    """The pool of one bank file: a pack, the shared bank, or a decoded list."""
+    if content_pack.is_pack(path):
+        return content_pack.ContentPack(path, decode)
+    if shared_bank.ENABLED:
+        return shared_bank.shared_pool(path, decode, lambda: load_json(path))
+    return [decode(record) for record in load_json(path)]
+
+
 # ======================================================================
 # FLASHCARDS
 # ======================================================================
 
+def load_flashcard_pool() -> list:
+    """Return all flashcards, loading them on first use."""
+    global FLASHCARD_POOL
+
+    if not FLASHCARD_POOL:
+        FLASHCARD_POOL = _load_pool(FLASHCARDS_FILE, OpenQuestion.from_dict)
+
+    return FLASHCARD_POOL
+
+
+@timed("data.generate_flashcard")
 def generate_flashcard(topic: str | None = None) -> OpenQuestion:
     """
     Returns a random flashcard.
     If `topic` is provided, select only cards from that topic.
     """
-    flashcards = load_json(FLASHCARDS_FILE)
+    flashcards = load_flashcard_pool()
 
     # Topic filtering
     if topic:
-        flashcards = [fc for fc in flashcards if fc.get("topic") == topic]
+        flashcards = [fc for fc in flashcards if fc.topic == topic]
         if not flashcards:
             raise ValueError(f"No flashcards found for topic: {topic}")
 
-    return OpenQuestion.from_dict(random.choice(flashcards))
+    return random.choice(flashcards)
+
+
+@timed("data.draw_flashcard_deck")
+def draw_flashcard_deck(size: int = 20, user: str | None = None) -> list:
+    """
+    Returns `size` flashcards without repeats. With a `user`, the deck
+    continues that user's stored rotation, so they see the whole bank
+    before any card comes back. O(size), whatever the bank size.
+    """
+    flashcards = load_flashcard_pool()
+    if user is None:
+        return random.sample(flashcards, min(size, len(flashcards)))
+
+    rotation = rotation_manager.load_rotation(user, len(flashcards))
+    deck = [flashcards[index] for index in rotation.take(size)]
+    rotation_manager.save_rotation(user, rotation)
+    return deck
 
 
 # Alias for naming consistency
@@ -69,40 +130,156 @@ generate_open_question = generate_flashcard
 # QUIZ QUESTIONS
 # ======================================================================
 
-def generate_quiz_question(topic: str | None = None) -> QuizQuestion:
+def load_question_pool() -> list:
+    """Return the full quiz pool, loading it on first use."""
+    global QUESTION_POOL, TOPIC_INDEX, FACETS
+
+    if not QUESTION_POOL:
+        QUESTION_POOL = _load_pool(QUIZ_QUESTIONS_FILE, QuizQuestion.from_dict)
+        TOPIC_INDEX = {}
+        ID_INDEX.clear()
+        FACETS = None
+        ROTATIONS.clear()
+
+    return QUESTION_POOL
+
+
+def questions_by_topic() -> dict:
+    """Return {topic: [QuizQuestion, ...]}, built once per pool."""
+    global TOPIC_INDEX
+
+    pool = load_question_pool()
+    if not TOPIC_INDEX and isinstance(pool, INDEXED_POOLS):
+        TOPIC_INDEX = pool.by_topic()
+    elif not TOPIC_INDEX:
+        index = {}
+        for question in pool:
+            index.setdefault(question.topic, []).append(question)
+        TOPIC_INDEX = index
+
+    return TOPIC_INDEX
+
+
+def question_by_id(question_id) -> QuizQuestion | None:
+    """Look a question up by id (index built once per pool)."""
+    pool = load_question_pool()
+    if isinstance(pool, INDEXED_POOLS):
+        row = pool.row_of(question_id)
+        return None if row is None else pool[row]
+    return _id_index(pool).get(question_id)
+
+
+def _id_index(pool: list) -> dict:
+    if not ID_INDEX:
+        ID_INDEX.update((question.id, question) for question in pool)
+    return ID_INDEX
+
+
+def topic_facets() -> TopicFacets:
+    """Return counts and id bitsets per topic, built once per pool."""
+    global FACETS
+
+    pool = load_question_pool()
+    if FACETS is None and isinstance(pool, INDEXED_POOLS):
+        FACETS = TopicFacets(topic_ids=pool.topic_ids())
+    elif FACETS is None:
+        FACETS = TopicFacets(pool)
+    return FACETS
+
+
+def _selection_key(topic: str | None, topics) -> frozenset | None:
+    """Rotation key: None for all topics, else the set of selected topics."""
+    selected = set(topics or ())
+    if topic:
+        selected.add(topic)
+    return frozenset(selected) if selected else None
+
+
+def _selection_questions(key: frozenset | None) -> list:
+    """
+    The questions of a topic selection: the OR of the topics' id
+    bitsets (topic_facets()), in id order. Questions without an id are
+    in no bitset, so only the all-topics pool (key None) draws them.
+    """
+    pool = load_question_pool()
+    if key is None:
+        return pool
+
+    facets = topic_facets()
+    ids = facets.ids(facets.mask(sorted(key)))
+    if isinstance(pool, INDEXED_POOLS):
+        return shared_bank.BankView(pool, pool.rows_of(ids))
+    return list(map(_id_index(pool).__getitem__, ids.tolist()))
+
+
+@timed("data.generate_quiz_question")
+def generate_quiz_question(topic: str | None = None, topics=None) -> QuizQuestion:
     """
     Returns a random QuizQuestion, ensuring no repeats until the pool is exhausted.
 
-    If topic is provided, uses only questions from that topic,
-    and creates a separate unused list for that subset.
+    `topic` (one topic) and/or `topics` (several) restrict the draw.
+    Every selection keeps its own rotation, so switching topics never
+    serves questions from another selection. Over a content pack the
+    rotation is block-aware: a few consecutive draws share a block.
     """
-    global QUESTION_POOL, UNUSED_QUESTIONS
+    key = _selection_key(topic, topics)
 
-    # Load full question pool once
-    if not QUESTION_POOL:
-        raw = load_json(QUIZ_QUESTIONS_FILE)
-        QUESTION_POOL = [QuizQuestion.from_dict(q) for q in raw]
+    rotation = ROTATIONS.get(key)
+    if rotation is None or not rotation[1]:
+        questions = _selection_questions(key)
+        if isinstance(load_question_pool(), content_pack.ContentPack):
+            unused = content_pack.BlockRotation(questions)
+        else:
+            unused = array("I", range(len(questions)))
+        rotation = ROTATIONS[key] = (questions, unused)
+    questions, unused = rotation
 
-    # If topic is provided, filter pool for that topic
-    if topic:
-        filtered = [q for q in QUESTION_POOL if q.topic == topic]
-        if not filtered:
-            raise ValueError(f"No quiz questions found for topic: {topic}")
+    if isinstance(unused, content_pack.BlockRotation):
+        return questions[unused.pop()]
 
-        # Reset unused list if needed (topic-specific mode)
-        if not UNUSED_QUESTIONS:
-            UNUSED_QUESTIONS = filtered.copy()
+    # Swap the chosen index with the last one and pop: O(1)
+    index = random.randrange(len(unused))
+    unused[index], unused[-1] = unused[-1], unused[index]
+    return questions[unused.pop()]
 
-    else:
-        # No topic → use the full pool
-        if not UNUSED_QUESTIONS:
-            UNUSED_QUESTIONS = QUESTION_POOL.copy()
 
-    # Choose 1 question from unused
-    question = random.choice(UNUSED_QUESTIONS)
-    UNUSED_QUESTIONS.remove(question)
+class QuestionStream:
+    """
+    Endless source of quiz questions (from `topics`, or all); call it
+    for the next question (a QuizEngine draw_question).
+
+    Each epoch is a fresh seeded permutation of the selection, walked
+    one index at a time: no repeats within an epoch, and starting a
+    new epoch costs O(1) instead of copying and reshuffling the pool.
+    state() is a few integers, enough to continue the stream later.
+    """
 
-    return question
+    def __init__(self, topics=None, state: list | None = None):
+        self.topics = list(topics) if topics else None
+        self.questions = _selection_questions(_selection_key(None, self.topics))
+        if not self.questions:
+            raise ValueError("No quiz questions to draw from")
+
+        if state:
+            self.rotation = Rotation.from_list(state[:4])
+            self.rotation.resize(len(self.questions))
+            self.previous = state[4]
+        else:
+            self.rotation = Rotation.new(len(self.questions))
+            self.previous = None
+
+    def __call__(self) -> QuizQuestion:
+        while True:
+            index = self.rotation.take(1)[0]
+            # Never the same question twice in a row across an epoch seam
+            if index != self.previous or len(self.questions) == 1:
+                break
+        self.previous = index
+        return self.questions[index]
+
+    def state(self) -> list:
+        """[seed, epoch, cursor, size, previous index]"""
+        return self.rotation.to_list() + [self.previous]
 
 
 # ======================================================================
@@ -0,0 +1,38 @@
+import json
+import os
+
+from data.permutation import Rotation
+
+ROTATION_FILE = os.path.join("data", "quiz_flashcards", "flashcard_rotation.json")
+
+
+def _load_all() -> dict:
+    if not os.path.exists(ROTATION_FILE):
+        return {}
+    try:
+        with open(ROTATION_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("users", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def load_rotation(user: str, size: int) -> Rotation:
+    """The user's flashcard rotation (a new one if none is stored)."""
+    values = _load_all().get(user)
+    if not values:
+        return Rotation.new(size)
+
+    rotation = Rotation.from_list(values)
+    rotation.resize(size)
+    return rotation
+
+
+def save_rotation(user: str, rotation: Rotation):
+    """Store the rotation as [seed, epoch, cursor, size] (tmp file + rename)."""
+    users = _load_all()
+    users[user] = rotation.to_list()
+
+    tmp_path = ROTATION_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"users": users}, f, separators=(",", ":"))
+    os.replace(tmp_path, ROTATION_FILE)
@@ -4,17 +4,24 @@ import os
 BEST_SCORE_FILE = os.path.join("data", "quiz_flashcards", "quiz_best_score.json")
 
 
-def load_best_score() -> int:
+def _load_scores() -> dict:
     if not os.path.exists(BEST_SCORE_FILE):
-        return 0
+        return {}
     try:
         with open(BEST_SCORE_FILE, "r", encoding="utf-8") as f:
             data = json.load(f)
-            return data.get("best_score", 0)
+            return data if isinstance(data, dict) else {}
     except:
-        return 0
+        return {}
 
 
-def save_best_score(score: int):
+def load_best_score(key: str = "best_score") -> int:
+    """Best score for a mode: "best_score" (20-question quiz) or "marathon_best"."""
+    return _load_scores().get(key, 0)
+
+
+def save_best_score(score: int, key: str = "best_score"):
+    scores = _load_scores()
+    scores[key] = score
     with open(BEST_SCORE_FILE, "w", encoding="utf-8") as f:
-        json.dump({"best_score": score}, f, indent=4)
\ No newline at end of file
+        json.dump(scores, f, indent=4)
\ No newline at end of file
@@ -0,0 +1,260 @@
+"""
+Question banks shared between app processes on one host.
+
+Kiosks run several copies of main.py side by side. Without this
+module, each one parses the JSON banks and keeps its own decoded
+pool. With COACH_SHARED_BANK=1:
+
+- The first process parses the JSON once and publishes it as a binary
+  bank file in SHARED_DIR (tmp file + rename).
+- Every process, including the first, maps that file read-only. The
+  pages live in the OS page cache once for all processes, and a
+  question is decoded only when it is accessed.
+- Later processes find the file and map it without parsing anything.
+
+A bank file is named after its JSON source (path, size and mtime), so
+editing the JSON publishes a new bank and stale ones are ignored.
+
+Layout (little-endian, sections 8-byte aligned):
+    header    magic, version, count, 5 section offsets
+    records   compact JSON of every record, back to back
+    offsets   u64[count + 1]  record i is records[offsets[i]:offsets[i + 1]]
+    ids       i64[count]      record ids (-1 for none)
+    by_id     u32[count]      rows sorted by id (binary search)
+    by_topic  u32[count]      rows grouped by topic, bank order within a topic
+    meta      JSON            {"source": ..., "topics": [[name, start, count], ...]}
+
+A file mapped read-only rather than multiprocessing.shared_memory:
+a shared memory block is unlinked when its creator exits, a file
+outlives any one process.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+
+import numpy as np
+
+
+ENABLED = os.getenv("COACH_SHARED_BANK", "") not in ("", "0")
+SHARED_DIR = os.getenv("COACH_SHARED_BANK_DIR") or os.path.join(
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+    "python-interview-coach"
+)
+
+MAGIC = b"PICBANK1"
+VERSION = 1
+_HEADER = struct.Struct("<8sII5Q")
+
+
+# ======================================================================
+# PUBLISHING
+# ======================================================================
+
+def _source_signature(source: str) -> str:
+    stat = os.stat(source)
+    return f"{os.path.abspath(source)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def bank_path(source: str) -> str:
+    """The bank file for the current version of the JSON file `source`."""
+    name = hashlib.blake2b(os.path.abspath(source).encode("utf-8"), digest_size=8).hexdigest()
+    version = hashlib.blake2b(_source_signature(source).encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(SHARED_DIR, f"{name}-{version}.bank")
+
+
+def _pad(f):
+    f.write(b"\0" * (-f.tell() % 8))
+
+
+def encode_bank(path: str, records: list, source: str = ""):
+    """Encode `records` (bank dicts) into a bank file (tmp file + rename)."""
+    count = len(records)
+    ids = array("q", (-1 if record.get("id") is None else record["id"] for record in records))
+
+    topics = {}
+    for row, record in enumerate(records):
+        topics.setdefault(record.get("topic"), []).append(row)
+    by_topic = array("I")
+    topic_table = []
+    for topic, rows in topics.items():
+        topic_table.append([topic, len(by_topic), len(rows)])
+        by_topic.extend(rows)
+
+    by_id = array("I", sorted(range(count), key=ids.__getitem__))
+    meta = json.dumps({"source": source, "topics": topic_table}).encode("utf-8")
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+
+        offsets = array("Q", [0])
+        records_pos = f.tell()
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            offsets.append(f.tell() - records_pos)
+
+        sections = []
+        for table in (offsets, ids, by_id, by_topic):
+            _pad(f)
+            sections.append(f.tell())
+            f.write(table.tobytes())
+        _pad(f)
+        sections.append(f.tell())
+        f.write(meta)
+
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, count, *sections))
+    os.replace(tmp_path, path)
+
+
+def _remove_stale(path: str):
+    """Delete older versions of the same source (may be mapped elsewhere: best effort)."""
+    prefix = os.path.basename(path).split("-")[0] + "-"
+    for name in os.listdir(SHARED_DIR):
+        if name.startswith(prefix) and name.endswith(".bank") and name != os.path.basename(path):
+            try:
+                os.remove(os.path.join(SHARED_DIR, name))
+            except OSError:
+                pass
+
+
+def shared_pool(source: str, decode, load_records):
+    """
+    The bank of the JSON file `source`, mapped from SHARED_DIR.
+    Publishes it first (load_records() → list of dicts) if no process
+    has yet. `decode` turns a record dict into a model object.
+    """
+    path = bank_path(source)
+    try:
+        return SharedBank(path, decode)
+    except (OSError, ValueError):
+        pass
+
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    encode_bank(path, load_records(), _source_signature(source))
+    _remove_stale(path)
+    return SharedBank(path, decode)
+
+
+# ======================================================================
+# READING
+# ======================================================================
+
+class SharedBank(Sequence):
+    """
+    Read-only sequence over a mapped bank file. Indexing decodes one
+    record; nothing is decoded up front.
+    """
+
+    def __init__(self, path: str, decode):
+        self.path = path
+        self.decode = decode
+
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, *sections = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"Not a bank file: {path}")
+
+        offsets_pos, ids_pos, by_id_pos, by_topic_pos, meta_pos = sections
+        view = memoryview(self._map)
+        self._count = count
+        self._records = view[_HEADER.size:]
+        self._offsets = view[offsets_pos:offsets_pos + 8 * (count + 1)].cast("Q")
+        self._ids = view[ids_pos:ids_pos + 8 * count].cast("q")
+        self._by_id = view[by_id_pos:by_id_pos + 4 * count].cast("I")
+        self._by_topic = view[by_topic_pos:by_topic_pos + 4 * count].cast("I")
+
+        meta = json.loads(bytes(view[meta_pos:]))
+        self.source = meta["source"]
+        self.topic_slices = {
+            topic: (start, size) for topic, start, size in meta["topics"]
+        }
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(self._count))]
+        if row < 0:
+            row += self._count
+        if not 0 <= row < self._count:
+            raise IndexError("bank index out of range")
+        start, end = self._offsets[row], self._offsets[row + 1]
+        return self.decode(json.loads(bytes(self._records[start:end])))
+
+    # --- Indexes (no decoding) --------------------------------------------
+
+    def id_at(self, row: int) -> int | None:
+        value = self._ids[row]
+        return None if value == -1 else value
+
+    def row_of(self, record_id) -> int | None:
+        """Row of the record with `record_id` (binary search), or None."""
+        index = bisect_left(self._by_id, record_id, key=self._ids.__getitem__)
+        if index < self._count and self._ids[self._by_id[index]] == record_id:
+            return self._by_id[index]
+        return None
+
+    def rows_of(self, record_ids) -> array:
+        """Rows of many ids (ascending, all in the bank) in one vectorized search."""
+        return rows_of_ids(self._ids, self._by_id, record_ids)
+
+    def topic_rows(self, topic):
+        """Rows of `topic`, in bank order (a slice of the mapped index)."""
+        start, size = self.topic_slices[topic]
+        return self._by_topic[start:start + size]
+
+    def select(self, topics) -> "BankView":
+        """The records of several topics, as one lazy sequence."""
+        rows = array("I")
+        for topic in topics:
+            rows.extend(self.topic_rows(topic))
+        return BankView(self, rows)
+
+    def by_topic(self) -> dict:
+        """{topic: BankView} (the shared counterpart of questions_by_topic())."""
+        return {topic: BankView(self, self.topic_rows(topic)) for topic in self.topic_slices}
+
+    def topic_ids(self):
+        """(topic, id) for every record, from the indexes alone."""
+        for topic in self.topic_slices:
+            for row in self.topic_rows(topic):
+                yield topic, self._ids[row]
+
+
+def rows_of_ids(ids, by_id, record_ids) -> array:
+    """
+    Rows of `record_ids` from a bank's id column and its rows sorted by
+    id (SharedBank, ContentPack): np.searchsorted over the sorted ids.
+    """
+    by_id = np.frombuffer(by_id, np.uint32)
+    sorted_ids = np.frombuffer(ids, np.int64)[by_id]
+    rows = by_id[np.searchsorted(sorted_ids, record_ids)]
+    return array("I", rows.astype(np.uint32).tobytes())
+
+
+class BankView(Sequence):
+    """Lazy sequence of some rows of a SharedBank."""
+
+    def __init__(self, bank: SharedBank, rows):
+        self.bank = bank
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.bank[row] for row in self.rows[index]]
+        return self.bank[self.rows[index]]
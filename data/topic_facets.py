@@ -0,0 +1,80 @@
+"""
+Precomputed topic facets for the quiz pool.
+
+For every topic: the question count and an id bitset (a Python int
+with bit `question.id` set). Built once per pool, so the topic picker
+shows counts instantly and combining topics is plain bitwise math:
+
+    facets = topic_facets()
+    mask = facets.mask(["Control Flow", "Functions & Modules"])
+    facets.count(mask)                          # questions selected
+    facets.count(mask & facets.bitsets["OOP"])  # overlap (0: one topic each)
+    facets.ids(mask)                            # the session's question ids
+
+Questions without an id (None, or -1 in shared banks and packs) can't
+be in a bitset and are left out, counts included.
+"""
+
+import numpy as np
+
+
+class TopicFacets:
+    """Counts and id bitsets per topic."""
+
+    def __init__(self, questions=(), topic_ids=None):
+        """
+        From `questions` (with .topic and .id), or from `topic_ids`,
+        (topic, id) pairs (a shared bank's indexes, nothing decoded).
+        """
+        if topic_ids is None:
+            topic_ids = ((question.topic, question.id) for question in questions)
+
+        # Set bits in a bytearray per topic, convert to ints once
+        # (OR-ing into a growing int would cost O(n) per question)
+        self.counts = {}
+        buffers = {}
+        for topic, question_id in topic_ids:
+            if question_id is None or question_id < 0:
+                continue
+            buffer = buffers.get(topic)
+            if buffer is None:
+                buffer = buffers[topic] = bytearray()
+            byte = question_id >> 3
+            if byte >= len(buffer):
+                buffer.extend(bytes(max(byte + 1 - len(buffer), len(buffer))))
+            buffer[byte] |= 1 << (question_id & 7)
+            self.counts[topic] = self.counts.get(topic, 0) + 1
+
+        self.bitsets = {topic: int.from_bytes(buffer, "little") for topic, buffer in buffers.items()}
+        self.all_ids = 0
+        for bitset in self.bitsets.values():
+            self.all_ids |= bitset
+
+        # Biggest topics first, as shown in the picker
+        self.topics = sorted(self.counts, key=lambda topic: (-self.counts[topic], topic))
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def mask(self, topics=None) -> int:
+        """Bitset of the questions in `topics` (all topics if None)."""
+        if topics is None:
+            return self.all_ids
+
+        mask = 0
+        for topic in topics:
+            try:
+                mask |= self.bitsets[topic]
+            except KeyError:
+                raise ValueError(f"No quiz questions found for topic: {topic}") from None
+        return mask
+
+    @staticmethod
+    def count(mask: int) -> int:
+        return mask.bit_count()
+
+    @staticmethod
+    def ids(mask: int) -> np.ndarray:
+        """Question ids in a bitset, ascending (int64 array)."""
+        data = np.frombuffer(mask.to_bytes((mask.bit_length() + 7) // 8, "little"), np.uint8)
+        return np.flatnonzero(np.unpackbits(data, bitorder="little"))
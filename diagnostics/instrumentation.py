@@ -0,0 +1,242 @@
+"""
+diagnostics/instrumentation.py
+
+Opt-in latency instrumentation for the app's hot paths.
+
+Enable it with an environment variable before starting the app:
+
+    COACH_INSTRUMENT=1 python main.py
+    COACH_INSTRUMENT=1 COACH_INSTRUMENT_OUT=/tmp/run1 python main.py
+
+Instrumented functions are wrapped with @timed("name") at import time.
+When instrumentation is disabled, @timed returns the function itself,
+so there is no wrapper and no per-call cost at all.
+
+Each span name feeds an HDR-style latency histogram. On exit, all
+histograms are written to <COACH_INSTRUMENT_OUT>.json and
+<COACH_INSTRUMENT_OUT>.prom (Prometheus text format). While the app
+runs, Ctrl+Shift+D toggles a debug overlay with live percentiles
+(see pages/ui/debug_overlay.py).
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+
+ENABLED = os.getenv("COACH_INSTRUMENT", "") not in ("", "0")
+OUTPUT_PREFIX = os.getenv("COACH_INSTRUMENT_OUT", "instrumentation")
+
+# Bucket bounds (seconds) used for the Prometheus histogram export
+PROMETHEUS_BOUNDS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+# ======================================================================
+# HISTOGRAM
+# ======================================================================
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of nanosecond latencies.
+
+    Values are bucketed log-linearly: each power of two is split into
+    2**(SUB_BUCKET_BITS - 1) linear sub-buckets, which keeps the relative
+    error under ~1.6% from nanoseconds to minutes with a few hundred
+    sparse buckets at most.
+    """
+
+    SUB_BUCKET_BITS = 7
+
+    def __init__(self):
+        self.counts = {}      # bucket index -> count
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+
+    # --------------------------------------------------------------
+    # Bucketing
+    # --------------------------------------------------------------
+
+    @classmethod
+    def bucket_index(cls, value_ns: int) -> int:
+        bits = cls.SUB_BUCKET_BITS
+        shift = max(0, value_ns.bit_length() - bits)
+        return (shift << bits) | (value_ns >> shift)
+
+    @classmethod
+    def bucket_bounds(cls, index: int) -> tuple[int, int]:
+        """Inclusive (low, high) nanosecond range of a bucket."""
+        bits = cls.SUB_BUCKET_BITS
+        shift = index >> bits
+        mantissa = index & ((1 << bits) - 1)
+        low = mantissa << shift
+        return low, low + (1 << shift) - 1
+
+    # --------------------------------------------------------------
+    # Recording & queries
+    # --------------------------------------------------------------
+
+    def record(self, value_ns: int):
+        index = self.bucket_index(value_ns)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_ns += value_ns
+        if self.min_ns is None or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, pct: float) -> int:
+        """Latency (ns) at the given percentile (0-100)."""
+        if not self.count:
+            return 0
+
+        rank = max(1, round(self.count * pct / 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bucket_bounds(index)[1], self.max_ns)
+        return self.max_ns
+
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def summary(self) -> dict:
+        """Count, mean and the usual percentiles, in milliseconds."""
+        ms = 1e6
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ns() / ms,
+            "min_ms": (self.min_ns or 0) / ms,
+            "p50_ms": self.percentile(50) / ms,
+            "p90_ms": self.percentile(90) / ms,
+            "p99_ms": self.percentile(99) / ms,
+            "p999_ms": self.percentile(99.9) / ms,
+            "max_ms": self.max_ns / ms,
+        }
+
+
+# ======================================================================
+# SPANS
+# ======================================================================
+
+_histograms = {}
+_lock = threading.Lock()
+
+
+def record(name: str, duration_ns: int):
+    """Add one measurement to the histogram `name`."""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = LatencyHistogram()
+        histogram.record(duration_ns)
+
+
+def timed(name: str):
+    """
+    Decorator measuring every call of the wrapped function as span `name`.
+    Returns the function unchanged when instrumentation is disabled.
+    """
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter_ns() - start)
+
+        return wrapper
+    return decorate
+
+
+class span:
+    """
+    Context manager for timing a block as span `name`:
+
+        with span("quiz.render"):
+            ...
+    """
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns() if ENABLED else 0
+        return self
+
+    def __exit__(self, *_exc):
+        if ENABLED:
+            record(self.name, time.perf_counter_ns() - self.start)
+
+
+def histograms() -> dict:
+    """A copy of {span name: LatencyHistogram}."""
+    with _lock:
+        return dict(_histograms)
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+# ======================================================================
+# EXPORT
+# ======================================================================
+
+def to_json() -> dict:
+    return {name: h.summary() for name, h in sorted(histograms().items())}
+
+
+def to_prometheus() -> str:
+    """Prometheus text exposition of all spans as one histogram metric."""
+    lines = [
+        "# HELP coach_span_seconds Latency of instrumented app operations.",
+        "# TYPE coach_span_seconds histogram",
+    ]
+
+    for name, h in sorted(histograms().items()):
+        label = name.replace("\\", "\\\\").replace('"', '\\"')
+        buckets = sorted(h.counts.items())
+
+        for bound in PROMETHEUS_BOUNDS:
+            bound_ns = bound * 1e9
+            # A bucket counts towards `le` once its upper edge is within it
+            cumulative = sum(
+                count for index, count in buckets
+                if LatencyHistogram.bucket_bounds(index)[1] <= bound_ns
+            )
+            lines.append(f'coach_span_seconds_bucket{{span="{label}",le="{bound:g}"}} {cumulative}')
+
+        lines.append(f'coach_span_seconds_bucket{{span="{label}",le="+Inf"}} {h.count}')
+        lines.append(f'coach_span_seconds_sum{{span="{label}"}} {h.total_ns / 1e9:.9f}')
+        lines.append(f'coach_span_seconds_count{{span="{label}"}} {h.count}')
+
+    return "\n".join(lines) + "\n"
+
+
+def export(prefix: str = OUTPUT_PREFIX):
+    """Write <prefix>.json and <prefix>.prom."""
+    with open(prefix + ".json", "w", encoding="utf-8") as f:
+        json.dump(to_json(), f, indent=2)
+    with open(prefix + ".prom", "w", encoding="utf-8") as f:
+        f.write(to_prometheus())
+
+
+if ENABLED:
+    atexit.register(export)
@@ -0,0 +1,148 @@
+"""
+diagnostics/leaks.py
+
+Leak detector for navigation cycles (screen → ... → main menu).
+
+At the end of every cycle it collects garbage, flushes Qt's deferred
+deletions and samples:
+- live QWidgets per class (QApplication.allWidgets()),
+- top-level windows,
+- Python objects tracked by gc,
+- memory traced by tracemalloc (plus the allocation sites that grew).
+
+A class whose widget count keeps growing from cycle to cycle is a
+leaked screen (or a leaked child of one).
+
+Enable it for a run:
+
+    COACH_LEAKS=1 python main.py
+    COACH_LEAKS=1 COACH_LEAKS_LOG=leaks.jsonl python main.py
+
+or drive it headlessly with the soak test (benchmarks/soak.py).
+"""
+
+import gc
+import json
+import logging
+import os
+import tracemalloc
+from collections import Counter
+
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QApplication
+
+
+ENABLED = os.getenv("COACH_LEAKS", "") not in ("", "0")
+LOG_PATH = os.getenv("COACH_LEAKS_LOG", "")
+TOP_SITES = 5
+
+logger = logging.getLogger("coach.leaks")
+
+
+class Sample:
+    """Object counts and traced memory at one point in time."""
+
+    def __init__(self, widgets: Counter, top_level: int, py_objects: int,
+                 traced_bytes: int, snapshot=None):
+        self.widgets = widgets
+        self.top_level = top_level
+        self.py_objects = py_objects
+        self.traced_bytes = traced_bytes
+        self.snapshot = snapshot
+
+
+def flush_deletions():
+    """Run pending deleteLater() calls and a full garbage collection."""
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    gc.collect()
+
+
+def take_sample(with_snapshot: bool = False) -> Sample:
+    flush_deletions()
+
+    widgets = Counter(type(widget).__name__ for widget in QApplication.allWidgets())
+    top_level = sum(1 for widget in QApplication.topLevelWidgets() if not widget.parent())
+    traced = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+    snapshot = tracemalloc.take_snapshot() if with_snapshot and tracemalloc.is_tracing() else None
+
+    return Sample(widgets, top_level, len(gc.get_objects()), traced, snapshot)
+
+
+def compare(before: Sample, after: Sample) -> dict:
+    """What grew between two samples (only growing widget classes listed)."""
+    grown = {
+        name: after.widgets[name] - before.widgets.get(name, 0)
+        for name in after.widgets
+        if after.widgets[name] > before.widgets.get(name, 0)
+    }
+
+    report = {
+        "widgets": sum(after.widgets.values()),
+        "widgets_delta": sum(after.widgets.values()) - sum(before.widgets.values()),
+        "grown_classes": grown,
+        "top_level": after.top_level,
+        "top_level_delta": after.top_level - before.top_level,
+        "py_objects_delta": after.py_objects - before.py_objects,
+        "traced_kb_delta": round((after.traced_bytes - before.traced_bytes) / 1024, 1),
+    }
+
+    if before.snapshot is not None and after.snapshot is not None:
+        sites = after.snapshot.compare_to(before.snapshot, "lineno")[:TOP_SITES]
+        report["top_sites"] = [
+            f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} {stat.size_diff / 1024:+.1f} KiB"
+            for stat in sites if stat.size_diff > 0
+        ]
+
+    return report
+
+
+class LeakTracker:
+    """
+    Samples at the end of every navigation cycle and reports the
+    difference with the previous cycle.
+    """
+
+    def __init__(self, snapshots: bool = False, log_path: str = ""):
+        self.snapshots = snapshots
+        self.log_path = log_path
+        self.cycle = 0
+        self.first = None
+        self.previous = None
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def end_cycle(self) -> dict | None:
+        """Close a cycle; returns its report (None for the baseline cycle)."""
+        sample = take_sample(self.snapshots)
+        self.cycle += 1
+
+        report = None
+        if self.previous is not None:
+            report = {"cycle": self.cycle, **compare(self.previous, sample)}
+            if report["grown_classes"] or report["top_level_delta"] > 0:
+                logger.warning("cycle %d: widgets grew %s", self.cycle, report["grown_classes"])
+            if self.log_path:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(report) + "\n")
+        else:
+            self.first = sample
+
+        self.previous = sample
+        return report
+
+    def total(self) -> dict:
+        """Growth from the first cycle to the latest one."""
+        return compare(self.first, self.previous)
+
+
+_tracker = None
+
+
+def end_cycle() -> dict | None:
+    """Called by the view manager whenever the main menu is shown again."""
+    global _tracker
+
+    if _tracker is None:
+        _tracker = LeakTracker(snapshots=True, log_path=LOG_PATH)
+    return _tracker.end_cycle()
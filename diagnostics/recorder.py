@@ -0,0 +1,106 @@
+"""
+diagnostics/recorder.py
+
+Records quiz and flashcard sessions so they can be replayed
+deterministically (diagnostics/replay.py).
+
+A recording holds:
+- the screen ("quiz", "flashcards", "flashcards_ai"), its options
+  and the user,
+- the random seed the session ran with (the global random module and
+  the adaptive sampler are seeded with it),
+- the timestamped events, [ms since start, kind, *args]:
+      quiz:        draw <id>, answer <index>, continue, dismiss,
+                   timeout, end
+      flashcards:  deck [<card>, ...], flip, next, end
+      AI cards:    generate <topic>, ai_cards [<card>, ...] <ms waited>,
+                   ai_error <message>, flip, next, end
+- the drawn questions themselves ({id: question dict}), so a replay
+  does not depend on the bank it was recorded against.
+
+Enable it for a run:
+
+    COACH_RECORD=1 python main.py
+    COACH_RECORD=1 COACH_RECORD_DIR=/tmp/sessions python main.py
+
+One JSON file per screen visit is written when the screen closes.
+"""
+
+import json
+import os
+import random
+import time
+
+
+ENABLED = os.getenv("COACH_RECORD", "") not in ("", "0")
+RECORD_DIR = os.getenv("COACH_RECORD_DIR", "recordings")
+VERSION = 1
+
+
+class SessionRecorder:
+    """Collects the events of one screen visit."""
+
+    def __init__(self, kind: str, user: str, options: dict | None = None, seed: int | None = None):
+        self.kind = kind
+        self.user = user
+        self.options = options or {}
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+        self.events = []
+        self.questions = {}
+        self.path = None
+        self._start = time.perf_counter()
+
+        # Everything drawn from the global random module follows the seed
+        random.seed(self.seed)
+
+    def record(self, kind: str, *args):
+        elapsed_ms = round((time.perf_counter() - self._start) * 1000, 1)
+        self.events.append([elapsed_ms, kind, *args])
+
+    def record_draw(self, question):
+        """A quiz question was drawn (kept whole for the replay)."""
+        self.questions.setdefault(str(question.id), question.to_dict())
+        self.record("draw", question.id)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": VERSION,
+            "kind": self.kind,
+            "user": self.user,
+            "options": self.options,
+            "seed": self.seed,
+            "events": self.events,
+            "questions": self.questions,
+        }
+
+    def save(self) -> str | None:
+        """Write the recording once (tmp file + rename); returns its path."""
+        if self.path is not None or not self.events:
+            return self.path
+
+        os.makedirs(RECORD_DIR, exist_ok=True)
+        name = f"{self.kind}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{id(self) & 0xffff:04x}.json"
+        path = os.path.join(RECORD_DIR, name)
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+        self.path = path
+        return path
+
+
+def start(kind: str, user: str, options: dict | None = None) -> SessionRecorder | None:
+    """A recorder for a new screen visit, or None when recording is off."""
+    if not ENABLED:
+        return None
+    return SessionRecorder(kind, user, options)
+
+
+def load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        recording = json.load(f)
+    if recording.get("version") != VERSION:
+        raise ValueError(f"Unsupported recording version in {path}")
+    return recording
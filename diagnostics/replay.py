@@ -0,0 +1,273 @@
+"""
+Headless replay of recorded sessions (diagnostics/recorder.py).
+
+Replays a recording against the real screens, as fast as possible:
+the quiz draws the recorded questions in the recorded order, the
+flashcard screens get the recorded deck / AI response (no service
+call), and every input event is fed back in order. The recorded
+timestamps are ignored; each step is timed instead (the call plus the
+events it queued), so a recording doubles as a regression benchmark.
+
+Usage (from the project root):
+    python -m diagnostics.replay recordings/quiz-*.json
+    python -m diagnostics.replay rec.json --repeat 20 --out replay.json
+    python -m benchmarks.compare old-replay.json replay.json
+
+--out writes the benchmarks.run format (one result per recording and
+event type), so benchmarks.compare flags regressions between commits.
+Data files are redirected to a temporary folder: replays never touch
+scores, analytics or checkpoints.
+"""
+
+import os
+
+# Must be set before Qt is imported anywhere
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QApplication, QWidget
+
+from benchmarks.run import BankContext, _git_commit
+from diagnostics import recorder
+from models.flashcards_questions import OpenQuestion
+from models.quiz_question import QuizQuestion
+from pages import view_manager
+
+
+SLOWEST_SHOWN = 5
+
+
+class _MainMenuStub(QWidget):
+    """Stands in for MainMenuView; screens only show/hide it."""
+
+    def __init__(self, username: str):
+        super().__init__()
+        self.username = username
+        self.quiz_options = {}
+
+
+def _settle():
+    QCoreApplication.processEvents()
+
+
+# ======================================================================
+# SESSIONS
+# ======================================================================
+
+def _recorded_draw(recording: dict):
+    """draw_question() handing out the recorded questions, in order."""
+    draws = iter([
+        QuizQuestion.from_dict(recording["questions"][str(args[0])])
+        for _, kind, *args in recording["events"] if kind == "draw"
+    ])
+    return lambda: next(draws)
+
+
+def _open_quiz(recording: dict, menu):
+    from pages.play_quiz_view import PlayQuizView
+    return PlayQuizView(menu, draw_question=_recorded_draw(recording), **recording["options"])
+
+
+def _quiz_step(view, kind: str, args: list) -> bool:
+    if kind == "answer":
+        view.check_answer(args[0])
+    elif kind == "continue":
+        view._continue_after_wait()
+    elif kind == "dismiss":
+        view.overlay._finish()
+    elif kind == "timeout":
+        view.time_out()
+    elif kind == "end":
+        if view.endless:
+            view.end_marathon()
+        else:
+            view.return_to_menu()
+    else:
+        return False
+    return True
+
+
+def _open_flashcards(recording: dict, menu):
+    from pages.flashcards_view import FlashcardsView
+    deck = next(args[0] for _, kind, *args in recording["events"] if kind == "deck")
+    return FlashcardsView(menu, cards=[OpenQuestion.from_dict(card) for card in deck])
+
+
+def _flip(card):
+    card.flip()
+    card._cancel_snapshot_flip()    # no 300 ms animation: jump to the other side
+
+
+def _flashcards_step(view, kind: str, args: list) -> bool:
+    if kind == "flip":
+        _flip(view.card)
+    elif kind == "next":
+        view.next_card()
+    elif kind == "end":
+        view.return_to_menu()
+    else:
+        return False
+    return True
+
+
+def _open_flashcards_ai(_recording: dict, menu):
+    from pages.flashcards_ai_view import FlashcardsAIView
+    return FlashcardsAIView(menu)
+
+
+def _flashcards_ai_step(view, kind: str, args: list) -> bool:
+    if kind == "generate":
+        view.topic_input.setText(args[0])
+    elif kind == "ai_cards":
+        view.on_flashcards_ready([OpenQuestion.from_dict(card) for card in args[0]])
+    elif kind == "flip":
+        _flip(view.flashcard)
+    elif kind == "next":
+        view.next_card()
+    elif kind == "end":
+        view.return_to_menu()
+    else:
+        # ai_error would open a modal message box
+        return False
+    return True
+
+
+SESSIONS = {
+    "quiz": (_open_quiz, _quiz_step),
+    "flashcards": (_open_flashcards, _flashcards_step),
+    "flashcards_ai": (_open_flashcards_ai, _flashcards_ai_step),
+}
+
+
+def replay(recording: dict) -> list:
+    """Replay one recording; returns [(step, kind, ms), ...], the screen opening first."""
+    open_view, step = SESSIONS[recording["kind"]]
+    menu = view_manager.keep_view(_MainMenuStub(recording["user"]))
+    view_manager.navigate(None, menu)
+    random.seed(recording["seed"])
+
+    timings = []
+    start = time.perf_counter_ns()
+    view = view_manager.navigate(menu, open_view(recording, menu))
+    _settle()
+    timings.append((0, "open", (time.perf_counter_ns() - start) / 1e6))
+
+    for number, (_, kind, *args) in enumerate(recording["events"], start=1):
+        start = time.perf_counter_ns()
+        if not step(view, kind, args):
+            continue
+        _settle()
+        timings.append((number, kind, (time.perf_counter_ns() - start) / 1e6))
+
+    # Close whatever the session ended on (game over screen, the view itself)
+    current = view_manager.current_view()
+    if current is not menu:
+        view_manager.navigate(current, menu)
+    view_manager.release_all()
+    menu.deleteLater()
+    _settle()
+    return timings
+
+
+# ======================================================================
+# REPORTING
+# ======================================================================
+
+def _percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(name: str, runs: list) -> list:
+    """One benchmarks.run-style result per event type, over all runs."""
+    by_kind = {}
+    for timings in runs:
+        for _, kind, ms in timings:
+            by_kind.setdefault(kind, []).append(ms)
+
+    steps = len(runs[0])
+    return [
+        {
+            "name": f"replay.{name}.{kind}",
+            "size": steps,
+            "repeat": len(runs),
+            "ops": len(samples) // len(runs),
+            "min_ms": min(samples),
+            "median_ms": statistics.median(samples),
+            "mean_ms": statistics.fmean(samples),
+            "p95_ms": _percentile(samples, 0.95),
+            "max_ms": max(samples),
+        }
+        for kind, samples in by_kind.items()
+    ]
+
+
+def _print_report(name: str, results: list, runs: list):
+    print(f"{name}  ({results[0]['size']} steps × {len(runs)} runs)")
+    for result in results:
+        print(
+            f"  {result['name'].rsplit('.', 1)[1]:<10} n={result['ops']:<5} "
+            f"median={result['median_ms']:8.3f} ms  p95={result['p95_ms']:8.3f} ms  "
+            f"max={result['max_ms']:8.3f} ms"
+        )
+
+    slowest = sorted(
+        (ms, number, kind) for timings in runs for number, kind, ms in timings
+    )[-SLOWEST_SHOWN:]
+    print("  slowest: " + ", ".join(
+        f"#{number} {kind} {ms:.2f} ms" for ms, number, kind in reversed(slowest)
+    ))
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("recordings", nargs="+", help="recording files")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--size", type=int, default=1000,
+                        help="synthetic bank size (endless and adaptive sessions load it)")
+    parser.add_argument("--out", help="write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    recorder.ENABLED = False    # a replay is not a new recording
+
+    results = []
+    with BankContext(args.size):
+        for path in args.recordings:
+            recording = recorder.load(path)
+            name = os.path.splitext(os.path.basename(path))[0]
+            runs = [replay(recording) for _ in range(args.repeat)]
+            summary = summarize(name, runs)
+            _print_report(name, summary, runs)
+            results += summary
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "recordings": args.recordings,
+        },
+        "results": results,
+    }
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.out}")
+
+    del app
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+diagnostics/watchdog.py
+
+Qt event-loop stall detector.
+
+A QTimer on the GUI thread records a heartbeat every few milliseconds.
+A background thread watches the heartbeat; when it is late beyond the
+threshold, the GUI thread is blocked, so the watchdog captures the
+main thread's Python stack (via sys._current_frames()) right then.
+When the heartbeat resumes, the stall's duration is known and the
+stall is logged and appended to a JSON-lines file.
+
+Enable it for a run:
+
+    COACH_WATCHDOG=1 python main.py
+    COACH_WATCHDOG=1 COACH_WATCHDOG_MS=100 COACH_WATCHDOG_LOG=stalls.jsonl python main.py
+
+Summarize one or more runs (worst stalls per view):
+
+    python -m diagnostics.watchdog report stalls.jsonl --top 3
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+
+ENABLED = os.getenv("COACH_WATCHDOG", "") not in ("", "0")
+THRESHOLD_MS = int(os.getenv("COACH_WATCHDOG_MS", "200"))
+LOG_PATH = os.getenv("COACH_WATCHDOG_LOG", "stalls.jsonl")
+
+logger = logging.getLogger("coach.watchdog")
+
+
+class StallWatchdog(QObject):
+    """
+    Detects GUI-thread stalls longer than `threshold_ms`.
+
+    Must be created on the GUI thread. Stalls are kept in `self.stalls`
+    (dicts with duration, view and stack) and, if `log_path` is given,
+    appended to that JSON-lines file.
+    """
+
+    def __init__(self, threshold_ms: int = THRESHOLD_MS, heartbeat_ms: int = 20,
+                 log_path: str | None = None, parent=None):
+        super().__init__(parent)
+
+        self.threshold = threshold_ms / 1000
+        self.heartbeat_ms = heartbeat_ms
+        self.log_path = log_path
+        self.stalls = []
+
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._pending = None      # stall captured, waiting for the loop to resume
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+
+    # ======================================================================
+    # LIFECYCLE
+    # ======================================================================
+
+    def start(self):
+        self._last_beat = time.perf_counter()
+        self._timer.start()
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="stall-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # ======================================================================
+    # GUI THREAD
+    # ======================================================================
+
+    def _beat(self):
+        """Heartbeat; also closes a pending stall once the loop is back."""
+        now = time.perf_counter()
+        pending = self._pending
+
+        if pending is not None:
+            self._pending = None
+            expected = self._last_beat + self.heartbeat_ms / 1000
+            duration = now - expected
+
+            # The watcher may race a beat that was only just late
+            if duration >= self.threshold:
+                pending["duration_ms"] = round(duration * 1000, 1)
+                if pending["view"] is None:
+                    pending["view"] = self._active_view_name()
+                self._report(pending)
+
+        self._last_beat = now
+
+    @staticmethod
+    def _active_view_name() -> str:
+        from PySide6.QtWidgets import QApplication
+        window = QApplication.activeWindow()
+        return type(window).__name__ if window is not None else "unknown"
+
+    def _report(self, stall: dict):
+        self.stalls.append(stall)
+        logger.warning(
+            "GUI thread stalled for %.1f ms in %s\n%s",
+            stall["duration_ms"], stall["view"], "".join(stall["stack"])
+        )
+        if self.log_path:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(stall) + "\n")
+
+    # ======================================================================
+    # WATCHER THREAD
+    # ======================================================================
+
+    def _watch(self):
+        poll = max(self.threshold / 4, 0.005)
+
+        while not self._stop.wait(poll):
+            if self._pending is not None:
+                continue  # already captured this stall
+
+            late = time.perf_counter() - self._last_beat
+            if late > self.threshold:
+                self._pending = self._capture(late)
+
+    def _capture(self, late: float) -> dict | None:
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return None
+
+        return {
+            "timestamp": time.time(),
+            "detected_after_ms": round(late * 1000, 1),
+            "duration_ms": None,
+            "view": _view_from_stack(frame),
+            "stack": traceback.format_stack(frame),
+        }
+
+
+def _view_from_stack(frame) -> str | None:
+    """
+    Name of the innermost screen (a class from pages/, not pages/ui/)
+    running on the stack, e.g. 'PlayQuizGameOverView'.
+    """
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        module = type(owner).__module__ if owner is not None else ""
+        if module.startswith("pages.") and not module.startswith("pages.ui."):
+            return type(owner).__name__
+        frame = frame.f_back
+    return None
+
+
+def install(app, log_path: str = LOG_PATH) -> StallWatchdog:
+    """Start a watchdog for the app (reference kept on the app)."""
+    app.stall_watchdog = StallWatchdog(log_path=log_path, parent=app)
+    app.stall_watchdog.start()
+    return app.stall_watchdog
+
+
+# ======================================================================
+# REPORT
+# ======================================================================
+
+def load_stalls(paths) -> list:
+    stalls = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            stalls.extend(json.loads(line) for line in f if line.strip())
+    return stalls
+
+
+def summarize(stalls: list, top: int = 3) -> dict:
+    """
+    Group stalls per view: count, total and worst duration, and the
+    `top` worst stalls (with the innermost stack frames).
+    """
+    per_view = {}
+    for stall in stalls:
+        if stall.get("duration_ms") is None:
+            continue
+        per_view.setdefault(stall.get("view") or "unknown", []).append(stall)
+
+    summary = {}
+    for view, items in per_view.items():
+        items.sort(key=lambda s: s["duration_ms"], reverse=True)
+        summary[view] = {
+            "count": len(items),
+            "total_ms": round(sum(s["duration_ms"] for s in items), 1),
+            "worst_ms": items[0]["duration_ms"],
+            "worst": [
+                {"duration_ms": s["duration_ms"], "stack": s["stack"][-3:]}
+                for s in items[:top]
+            ],
+        }
+
+    return dict(sorted(summary.items(), key=lambda kv: kv[1]["worst_ms"], reverse=True))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stall watchdog tools.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    report = sub.add_parser("report", help="summarize worst stalls per view")
+    report.add_argument("logs", nargs="+", help="stalls.jsonl file(s)")
+    report.add_argument("--top", type=int, default=3)
+    report.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args(argv)
+
+    summary = summarize(load_stalls(args.logs), top=args.top)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+
+    for view, info in summary.items():
+        print(f"{view}: {info['count']} stall(s), worst {info['worst_ms']} ms, "
+              f"total {info['total_ms']} ms")
+        for stall in info["worst"]:
+            print(f"  {stall['duration_ms']:>8} ms")
+            for line in stall["stack"]:
+                print("    " + line.rstrip().replace("\n", "\n    "))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,15 @@
 import sys
 from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QSize, QTimer
 
+from coach import analytics
+from diagnostics import instrumentation, watchdog
 from pages.entrance_window import EntranceWindow
 from pages.main_menu_view import MainMenuView
+from pages.view_manager import keep_view, navigate
+from pages.ui.asset_manager import preload_assets
+from pages.ui.big_level_button import GradientCardButton
+from pages.ui.code_highlight import start_precompute
 
 
 def main():
@@ -12,6 +19,25 @@ def main():
     """
     app = QApplication(sys.argv)
 
+    # Decode + scale menu icons while the user types their name
+    icon_size = GradientCardButton.ICON_SIZE
+    preload_assets([QSize(icon_size, icon_size)], app.devicePixelRatio())
+
+    # Highlight the code in every flashcard before the first deck opens
+    start_precompute()
+
+    # Per-topic stats, read once per app instead of by every quiz screen
+    analytics.preload()
+
+    # Ctrl+Shift+D debug overlay (only with COACH_INSTRUMENT=1)
+    if instrumentation.ENABLED:
+        from pages.ui.debug_overlay import install_debug_overlay
+        install_debug_overlay(app)
+
+    # GUI-thread stall detector (only with COACH_WATCHDOG=1)
+    if watchdog.ENABLED:
+        watchdog.install(app)
+
     entrance = EntranceWindow()
     entrance.show()
 
@@ -19,11 +45,12 @@ def main():
         """Move from entrance screen → main menu."""
         username = entrance.name_input.text().strip() or "User"
 
-        # Keep a strong reference to prevent garbage collection
-        app.main_menu = MainMenuView(username=username)
-        app.main_menu.show()
+        # The view manager owns the menu (recycled) and every other screen
+        main_menu = keep_view(MainMenuView(username=username))
+        navigate(entrance, main_menu)
 
-        entrance.close()
+        # A quiz cut short last time (crash, closed window) can be resumed
+        QTimer.singleShot(0, main_menu.offer_resume)
 
     # Connect continue button
     entrance.btn_continue.clicked.connect(on_continue)
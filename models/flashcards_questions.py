@@ -4,24 +4,33 @@ class OpenQuestion:
     used for flashcards or written-response quizzes.
     """
 
-    def __init__(self, question: str, answer: str):
+    def __init__(self, question: str, answer: str, topic: str | None = None, id: int | None = None):
+        self.id = id            # None for AI-generated cards
         self.question = question
         self.answer = answer
+        self.topic = topic
 
     @classmethod
     def from_dict(cls, data: dict) -> "OpenQuestion":
         """Create an OpenQuestion from a dictionary."""
         return cls(
             question=data["question"],
-            answer=data.get("answer", "")
+            answer=data.get("answer", ""),
+            topic=data.get("topic"),
+            id=data.get("id")
         )
 
     def to_dict(self) -> dict:
         """Serialize the question to a dictionary."""
-        return {
+        data = {
             "question": self.question,
             "answer": self.answer,
         }
+        if self.id is not None:
+            data = {"id": self.id, **data}
+        if self.topic is not None:
+            data["topic"] = self.topic
+        return data
 
     def __str__(self):
         return f"OpenQuestion(question='{self.question}')"
\ No newline at end of file
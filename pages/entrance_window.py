@@ -5,6 +5,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPalette, QColor
 
+from diagnostics.instrumentation import timed
+
 
 class EntranceWindow(QWidget):
     """
@@ -12,6 +14,7 @@ class EntranceWindow(QWidget):
     Welcomes the user and collects their name inside a centered card.
     """
 
+    @timed("view.EntranceWindow")
     def __init__(self):
         super().__init__()
 
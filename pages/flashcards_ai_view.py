@@ -1,13 +1,19 @@
+import time
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QMessageBox, QSpacerItem, QSizePolicy
 )
 from PySide6.QtCore import Qt, QThread
 
+from diagnostics import recorder
+from diagnostics.instrumentation import timed
+from coach.engine import FlashcardEngine
 from pages.flashcards_game_over_view import FlashcardsGameOverView
 from pages.ui.flashcard_worker import FlashcardWorker
 from pages.ui.flashcard_widget import FlashcardWidget
 from pages.ui.animated_border_button import AnimatedBorderButton
+from pages.view_manager import keep_until_finished, navigate
 
 
 class FlashcardsAIView(QWidget):
@@ -18,13 +24,15 @@ class FlashcardsAIView(QWidget):
     Step 3: User flips through cards similarly to premade mode.
     """
 
+    @timed("view.FlashcardsAIView")
     def __init__(self, main_menu):
         super().__init__()
 
         self.thread = None
         self.main_menu = main_menu
-        self.cards = []
-        self.current_index = 0
+        self.deck = FlashcardEngine([])
+        self.recording = recorder.start("flashcards_ai", main_menu.username)
+        self._requested = None
 
         self.setWindowTitle("AI Flashcards")
         self.setFixedSize(360, 640)
@@ -105,6 +113,7 @@ class FlashcardsAIView(QWidget):
         # Flashcard Display -------------------------------------------------
         self.flashcard = FlashcardWidget()
         self.flashcard.face.setFixedSize(300, 280)
+        self.flashcard.flipped.connect(lambda: self._record("flip"))
         self.flashcard.hide()
         root.addWidget(self.flashcard, alignment=Qt.AlignCenter)
 
@@ -212,11 +221,13 @@ class FlashcardsAIView(QWidget):
     # ------------------------------------------------------------------
     # HELPERS
     # ------------------------------------------------------------------
+    def _record(self, kind: str, *args):
+        if self.recording is not None:
+            self.recording.record(kind, *args)
+
     def _counter_text(self) -> str:
         """Return text like '3/10'. If no cards yet, show '0/0'."""
-        if not self.cards:
-            return "0/0"
-        return f"{self.current_index + 1}/{len(self.cards)}"
+        return self.deck.counter_text()
 
     # ------------------------------------------------------------------
     # LOGIC
@@ -229,6 +240,8 @@ class FlashcardsAIView(QWidget):
 
         self.btn_generate.setEnabled(False)
         self.btn_generate.setLoading(True)
+        self._record("generate", topic)
+        self._requested = time.perf_counter()
 
         self.thread = QThread()
         self.worker = FlashcardWorker(topic)
@@ -237,56 +250,63 @@ class FlashcardsAIView(QWidget):
         self.thread.started.connect(self.worker.run)
         self.worker.finished.connect(self.on_flashcards_ready)
         self.worker.error.connect(self.on_flashcards_error)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
+        for done in (self.worker.finished, self.worker.error):
+            done.connect(self.thread.quit)
+            done.connect(self.worker.deleteLater)
         self.thread.finished.connect(self.thread.deleteLater)
 
         self.thread.start()
 
     def on_flashcards_ready(self, cards):
-        self.cards = cards
+        # The AI response is recorded: replays never call the service
+        if self._requested is not None:
+            waited_ms = round((time.perf_counter() - self._requested) * 1000, 1)
+            self._record("ai_cards", [card.to_dict() for card in cards], waited_ms)
+        self.deck = FlashcardEngine(cards)
         self.btn_generate.setEnabled(True)
         self.btn_generate.setLoading(False)
 
-        if not self.cards:
+        if not cards:
             QMessageBox.warning(self, "No cards", "The AI did not return any flashcards.")
             self.counter_label.setText(self._counter_text())
             return
 
-        self.current_index = 0
         self.show_card()
         self.flashcard.show()
         self.btn_next.show()
 
     def on_flashcards_error(self, message):
+        self._record("ai_error", message)
         self.btn_generate.setEnabled(True)
         self.btn_generate.setLoading(False)
         QMessageBox.critical(self, "Error", message)
 
     def show_card(self):
-        card = self.cards[self.current_index]
-        self.flashcard.set_front_text(card.question)
-        self.flashcard.set_back_text(card.answer)
+        self.flashcard.set_card(self.deck.current)
         self.flashcard.show_front()
 
         # Update counter at top
         self.counter_label.setText(self._counter_text())
 
     def next_card(self):
-        self.current_index += 1
-
-        if self.current_index >= len(self.cards):
+        self._record("next")
+        if not self.deck.advance():
             # Reuse existing Game Over UI
-            self.game_over = FlashcardsGameOverView(self.main_menu)
-            self.game_over.show()
-            self.close()
+            navigate(self, FlashcardsGameOverView(self.main_menu))
             return
 
         self.show_card()
 
     def return_to_menu(self):
-        self.main_menu.show()
-        self.close()
+        self._record("end")
+        navigate(self, self.main_menu)
+
+    def closeEvent(self, event):
+        """A generation still running must outlive this (deleted) screen."""
+        keep_until_finished(self.thread, getattr(self, "worker", None))
+        if self.recording is not None:
+            self.recording.save()
+        super().closeEvent(event)
 
 
 
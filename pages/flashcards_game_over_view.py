@@ -3,6 +3,9 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
+from diagnostics.instrumentation import timed
+from pages.view_manager import navigate
+
 
 class FlashcardsGameOverView(QWidget):
     """
@@ -10,6 +13,7 @@ class FlashcardsGameOverView(QWidget):
     Matches the style of other screens (top bar + gradient).
     """
 
+    @timed("view.FlashcardsGameOverView")
     def __init__(self, main_menu):
         super().__init__()
 
@@ -116,5 +120,4 @@ class FlashcardsGameOverView(QWidget):
     # NAVIGATION
     # ======================================================
     def return_to_menu(self):
-        self.main_menu.show()
-        self.close()
\ No newline at end of file
+        navigate(self, self.main_menu)
\ No newline at end of file
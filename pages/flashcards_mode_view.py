@@ -3,6 +3,9 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
+from diagnostics.instrumentation import timed
+from pages.view_manager import navigate
+
 
 class FlashcardsModeView(QWidget):
     """
@@ -12,6 +15,7 @@ class FlashcardsModeView(QWidget):
         - AI-generated flashcards (future feature)
     """
 
+    @timed("view.FlashcardsModeView")
     def __init__(self, main_menu):
         super().__init__()
 
@@ -155,18 +159,13 @@ class FlashcardsModeView(QWidget):
     # ======================================================
 
     def return_to_menu(self):
-        self.main_menu.show()
-        self.close()
+        navigate(self, self.main_menu)
 
     def open_premade(self):
         """Opens the standard flashcards view."""
         from .flashcards_view import FlashcardsView
-        self.flashcards = FlashcardsView(main_menu=self.main_menu)
-        self.flashcards.show()
-        self.close()
+        navigate(self, FlashcardsView(main_menu=self.main_menu))
 
     def open_ai_flashcards(self):
         from .flashcards_ai_view import FlashcardsAIView
-        self.ai_view = FlashcardsAIView(main_menu=self.main_menu)
-        self.ai_view.show()
-        self.close()
\ No newline at end of file
+        navigate(self, FlashcardsAIView(main_menu=self.main_menu))
\ No newline at end of file
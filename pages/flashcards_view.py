@@ -4,23 +4,32 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-from data.question_generator import generate_flashcard
+from coach.client import flashcard_deck
+from coach.engine import FlashcardEngine
+from diagnostics import recorder
+from diagnostics.instrumentation import timed
 from pages.ui.flashcard_widget import FlashcardWidget
 from pages.flashcards_game_over_view import FlashcardsGameOverView
+from pages.view_manager import navigate
 
 
 class FlashcardsView(QWidget):
     """
     Flashcards study screen.
     Displays one card at a time with flip animation to reveal answers.
+    `cards` replaces the drawn deck (replays).
     """
 
-    def __init__(self, main_menu):
+    @timed("view.FlashcardsView")
+    def __init__(self, main_menu, cards=None):
         super().__init__()
         self.main_menu = main_menu
 
-        self.cards = [generate_flashcard() for _ in range(20)]
-        self.current_index = 0
+        self.recording = recorder.start("flashcards", main_menu.username)
+        if cards is None:
+            cards = flashcard_deck(20, main_menu.username)
+        self.deck = FlashcardEngine(cards)
+        self._record("deck", [card.to_dict() for card in cards])
 
         self._configure_window()
         self._build_ui()
@@ -91,6 +100,7 @@ class FlashcardsView(QWidget):
         # ------------------------------------------------------------------
         self.card = FlashcardWidget()
         self.card.face.setFixedSize(320, 340)
+        self.card.flipped.connect(lambda: self._record("flip"))
 
         root.addSpacerItem(QSpacerItem(0, 70, QSizePolicy.Minimum, QSizePolicy.Fixed))
         root.addWidget(self.card, alignment=Qt.AlignCenter)
@@ -195,33 +205,30 @@ class FlashcardsView(QWidget):
     # LOGIC
     # ======================================================================
 
+    def _record(self, kind: str, *args):
+        if self.recording is not None:
+            self.recording.record(kind, *args)
+
     def _counter_text(self):
         """Returns text like '3/20'."""
-        return f"{self.current_index + 1}/{len(self.cards)}"
+        return self.deck.counter_text()
 
     def show_card(self):
         """Loads the current card into the UI."""
-        card_data = self.cards[self.current_index]
-        question = card_data.question.strip()
-
-        # Capitalize first letter
-        formatted_question = question[0].upper() + question[1:] if question else question
-
-        self.card.set_front_text(formatted_question)
-        self.card.set_back_text(card_data.answer)
+        # Capitalized question, highlighted code (memoized per card)
+        self.card.set_card(self.deck.current)
         self.card.show_front()
 
         # Title: "Question 5"
-        self.card.title_label.setText(f"Question {self.current_index + 1}")
+        self.card.title_label.setText(f"Question {self.deck.current_index + 1}")
 
         # Update counter at top-right
         self.counter_label.setText(self._counter_text())
 
     def next_card(self):
         """Moves to the next flashcard or opens Game Over window."""
-        self.current_index += 1
-
-        if self.current_index >= len(self.cards):
+        self._record("next")
+        if not self.deck.advance():
             self.open_game_over()
             return
 
@@ -229,11 +236,14 @@ class FlashcardsView(QWidget):
 
     def open_game_over(self):
         """Open the game over UI."""
-        self.game_over_window = FlashcardsGameOverView(main_menu=self.main_menu)
-        self.game_over_window.show()
-        self.close()
+        navigate(self, FlashcardsGameOverView(main_menu=self.main_menu))
 
     def return_to_menu(self):
         """Return to main menu."""
-        self.main_menu.show()
-        self.close()
\ No newline at end of file
+        self._record("end")
+        navigate(self, self.main_menu)
+
+    def closeEvent(self, event):
+        if self.recording is not None:
+            self.recording.save()
+        super().closeEvent(event)
\ No newline at end of file
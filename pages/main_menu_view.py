@@ -1,9 +1,12 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QMessageBox
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPalette, QColor
 
+from coach.checkpoint import SessionCheckpoint
+from diagnostics.instrumentation import timed
 from pages.ui.big_level_button import GradientCardButton
-from .play_quiz_view import PlayQuizView
+from pages.view_manager import navigate
+from .quiz_setup_view import QuizSetupView
 from .flashcards_view import FlashcardsView
 
 
@@ -13,9 +16,11 @@ class MainMenuView(QWidget):
     Displays greeting and navigation choices for quiz or flashcards.
     """
 
+    @timed("view.MainMenuView")
     def __init__(self, username: str):
         super().__init__()
         self.username = username
+        self.quiz_options = {}      # last quiz settings (QuizSetupView)
 
         self._configure_window()
         self._build_ui()
@@ -112,19 +117,34 @@ class MainMenuView(QWidget):
     # ======================================================================
 
     def open_play_quiz(self):
-        """Open the Quiz window and hide the menu."""
-        self.play_quiz_window = PlayQuizView(main_menu=self)
-        self.play_quiz_window.show()
-        self.hide()
+        """Open the quiz setup (topics, mode) and hide the menu."""
+        navigate(self, QuizSetupView(main_menu=self))
+
+    def offer_resume(self):
+        """If the user has an unfinished quiz (crash, closed window), offer to resume it."""
+        checkpoint = SessionCheckpoint.load(self.username)
+        if checkpoint is None:
+            return
+
+        state = checkpoint.state
+        answer = QMessageBox.question(
+            self,
+            "Unfinished quiz",
+            f"You have an unfinished quiz (question {state['counter']}, "
+            f"score {state['correct']}/{state['total']}).\nResume it?"
+        )
+        if answer != QMessageBox.Yes:
+            checkpoint.clear()
+            return
+
+        from .play_quiz_view import PlayQuizView
+        self.quiz_options = dict(state["options"])
+        navigate(self, PlayQuizView.resume(self, checkpoint))
 
     def open_flashcards(self):
         """Open the Flashcards window and hide the menu."""
-        self.flashcards_window = FlashcardsView(main_menu=self)
-        self.flashcards_window.show()
-        self.hide()
+        navigate(self, FlashcardsView(main_menu=self))
 
     def open_flashcards_mode(self):
         from .flashcards_mode_view import FlashcardsModeView
-        self.flashcards_mode = FlashcardsModeView(main_menu=self)
-        self.flashcards_mode.show()
-        self.hide()
\ No newline at end of file
+        navigate(self, FlashcardsModeView(main_menu=self))
\ No newline at end of file
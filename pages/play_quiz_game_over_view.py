@@ -1,9 +1,11 @@
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel,
+    QPushButton, QFrame
 )
 from PySide6.QtCore import Qt
-from data.score_manager import load_best_score, save_best_score
+from PySide6.QtGui import QFontMetrics
+from diagnostics.instrumentation import timed
+from pages.view_manager import navigate
 
 
 class PlayQuizGameOverView(QWidget):
@@ -11,15 +13,35 @@ class PlayQuizGameOverView(QWidget):
     Screen shown when the quiz is finished.
     Shows final score, congratulation message,
     score comparison vs previous attempts,
+    per-topic stats for the topics in this quiz,
     and a button to restart the quiz.
     """
 
-    def __init__(self, main_menu, score_correct, score_total):
+    TOPIC_ROWS = 4
+    TOPIC_NAME_WIDTH = 160
+
+    SCORE_MESSAGES = {
+        "improved": "You improved your score! 🎉",
+        "matched": "You matched your best score! 💪",
+        "decreased": "Your score decreased — try again! 🔁",
+    }
+
+    @timed("view.PlayQuizGameOverView")
+    def __init__(self, main_menu, result, analytics=None, session_topics=(), quiz_options=None):
+        """
+        `result` is the QuizResult returned by QuizEngine.finish();
+        `analytics` (an AnalyticsStore) fills the topic panel;
+        `quiz_options` are the PlayQuizView settings reused by Play Again.
+        """
         super().__init__()
 
         self.main_menu = main_menu
-        self.score_correct = score_correct
-        self.score_total = score_total
+        self.result = result
+        self.analytics = analytics
+        self.session_topics = session_topics
+        self.quiz_options = quiz_options or {}
+        self.score_correct = result.correct
+        self.score_total = result.total
 
         self.setWindowTitle("Quiz Completed")
         self.setFixedSize(360, 640)
@@ -58,8 +80,8 @@ class PlayQuizGameOverView(QWidget):
         content.setObjectName("Root")
 
         root = QVBoxLayout(content)
-        root.setContentsMargins(20, 60, 20, 20)
-        root.setSpacing(20)
+        root.setContentsMargins(20, 30 if analytics else 60, 20, 20)
+        root.setSpacing(16 if analytics else 20)
 
         outer.addWidget(content)
 
@@ -86,23 +108,22 @@ class PlayQuizGameOverView(QWidget):
         root.addWidget(score_text)
 
         # ======================================================
-        # SCORE COMPARISON LOGIC
+        # SCORE COMPARISON (decided by QuizEngine.finish)
         # ======================================================
-        self.previous_best = load_best_score()
-
-        if self.score_correct > self.previous_best:
-            self.score_message = "You improved your score! 🎉"
-            save_best_score(self.score_correct)
-        elif self.score_correct == self.previous_best:
-            self.score_message = "You matched your best score! 💪"
-        else:
-            self.score_message = "Your score decreased — try again! 🔁"
+        self.previous_best = result.previous_best
+        self.score_message = self.SCORE_MESSAGES[result.outcome]
 
         comparison = QLabel(self.score_message)
         comparison.setAlignment(Qt.AlignCenter)
         comparison.setStyleSheet("color: white; font-size: 18px; font-weight: 600;")
         root.addWidget(comparison)
 
+        # ======================================================
+        # TOPIC STATS
+        # ======================================================
+        if analytics is not None and session_topics:
+            root.addWidget(self._build_topic_panel())
+
         # ======================================================
         # RESTART BUTTON
         # ======================================================
@@ -166,19 +187,78 @@ class PlayQuizGameOverView(QWidget):
             QPushButton#ActionBtn:hover {
                 background: #f2f2f2;
             }
+
+            QFrame#TopicPanel {
+                background: rgba(255, 255, 255, 0.16);
+                border-radius: 14px;
+            }
+
+            QFrame#TopicPanel QLabel {
+                color: white;
+                font-size: 13px;
+            }
+
+            QFrame#TopicPanel QLabel#TopicHeader {
+                font-weight: 700;
+            }
         """)
 
+    # ======================================================
+    # TOPIC PANEL
+    # ======================================================
+
+    def _build_topic_panel(self) -> QFrame:
+        """
+        All-time accuracy, mean answer time and best streak for the
+        topics of this quiz, weakest first.
+        """
+        panel = QFrame()
+        panel.setObjectName("TopicPanel")
+
+        grid = QGridLayout(panel)
+        grid.setContentsMargins(12, 8, 12, 8)
+        grid.setHorizontalSpacing(10)
+        grid.setVerticalSpacing(4)
+
+        for col, text in enumerate(("Your topics", "Acc.", "Time", "Best")):
+            header = QLabel(text)
+            header.setObjectName("TopicHeader")
+            grid.addWidget(header, 0, col, alignment=Qt.AlignRight if col else Qt.AlignLeft)
+
+        user = self.main_menu.username
+        stats = self.analytics.topics(user)
+        rows = sorted(
+            (topic for topic in self.session_topics if topic in stats),
+            key=lambda topic: stats[topic].accuracy
+        )[:self.TOPIC_ROWS]
+
+        metrics = QFontMetrics(panel.font())
+        for row, topic in enumerate(rows, start=1):
+            topic_stats = stats[topic]
+            mean_ms = topic_stats.mean_latency_ms
+
+            name = QLabel(metrics.elidedText(topic, Qt.ElideRight, self.TOPIC_NAME_WIDTH))
+            name.setToolTip(topic)
+            name.setFixedWidth(self.TOPIC_NAME_WIDTH)
+            grid.addWidget(name, row, 0)
+
+            for col, text in enumerate((
+                f"{topic_stats.accuracy:.0%}",
+                f"{mean_ms / 1000:.1f}s" if mean_ms is not None else "–",
+                str(topic_stats.best_streak),
+            ), start=1):
+                grid.addWidget(QLabel(text), row, col, alignment=Qt.AlignRight)
+
+        return panel
+
     # ======================================================
     # NAVIGATION
     # ======================================================
 
     def return_to_menu(self):
-        self.main_menu.show()
-        self.close()
+        navigate(self, self.main_menu)
 
     def restart_quiz(self):
         """Restart the quiz from the beginning."""
         from .play_quiz_view import PlayQuizView
-        self.new_quiz = PlayQuizView(main_menu=self.main_menu)
-        self.new_quiz.show()
-        self.close()
\ No newline at end of file
+        navigate(self, PlayQuizView(main_menu=self.main_menu, **self.quiz_options))
\ No newline at end of file
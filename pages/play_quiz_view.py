@@ -1,47 +1,166 @@
+import random
+from functools import partial
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QSpacerItem, QSizePolicy
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QStackedWidget
 )
-from PySide6.QtCore import Qt, QEvent
-
-from data.question_generator import generate_quiz_question
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
+
+from coach.adaptive import AdaptiveSampler
+from coach.analytics import shared_store
+from coach import attempt_log
+from coach.attempt_log import AttemptLog
+from coach.checkpoint import SessionCheckpoint
+from coach.client import quiz_engine_options
+from coach.engine import Attempt, QuizEngine
+from data.question_generator import generate_quiz_question, question_by_id, QuestionStream
+from data.score_manager import load_best_score, save_best_score
+from diagnostics import recorder
+from diagnostics.instrumentation import timed
 from pages.ui.feedback_overlay import FeedbackOverlay
-from pages.ui.answer_button import AnswerButton
+from pages.ui.question_page import QuestionPage
 from pages.play_quiz_game_over_view import PlayQuizGameOverView
+from pages.view_manager import navigate
 
 class PlayQuizView(QWidget):
     """
     Quiz gameplay screen.
-    Handles question display, answer checking, scoring,
-    and user interaction flow.
+    Handles question display and user interaction flow;
+    sequencing, answer checking and scoring live in QuizEngine.
+
+    `topics` restricts the quiz to those topics (all if None); with
+    `adaptive=True`, questions favour the user's weakest topics
+    (see coach/adaptive.py). With `speed=True` (speed round) every
+    question has a SPEED_ROUND_MS countdown. With `endless=True`
+    (marathon) questions keep coming until the user ends the session;
+    only the last ATTEMPT_WINDOW attempts stay in memory.
+
+    Answers can be given with the keys 1-4 or A-D. Local sessions are
+    checkpointed after every draw and answer (coach/checkpoint.py);
+    PlayQuizView.resume() continues one after a crash.
+
+    With COACH_RECORD=1 the session is recorded (diagnostics/recorder.py);
+    a replay passes the recorded questions as `draw_question`.
     """
 
-    def __init__(self, main_menu):
+    TOTAL_QUESTIONS = 20
+    SPEED_ROUND_MS = 10_000
+    COUNTDOWN_INTERVAL_MS = 100
+    ATTEMPT_WINDOW = 200
+
+    # key → answer index
+    ANSWER_KEYS = {"1": 0, "2": 1, "3": 2, "4": 3, "A": 0, "B": 1, "C": 2, "D": 3}
+
+    @timed("view.PlayQuizView")
+    def __init__(self, main_menu, adaptive=False, topics=None, speed=False, endless=False,
+                 resume: SessionCheckpoint | None = None, draw_question=None):
         super().__init__()
         self.main_menu = main_menu
+        self.adaptive = adaptive
+        self.topics = list(topics) if topics else None
+        self.speed = speed
+        self.endless = endless
 
         # Window setup
         self.setWindowTitle("Play Quiz")
         self.setFixedSize(360, 640)
 
         # --- Quiz State ---
-        self.correct_count = 0
-        self.total_count = 0
-        self.current_question = None
-        self.question_counter = 0
-        self.total_questions = 20
+        self.username = main_menu.username
+        self.analytics = shared_store()
+        self.session_topics = set()
+        self.recording = recorder.start("quiz", self.username, self.settings())
+
+        options = quiz_engine_options(self.username, self.TOTAL_QUESTIONS, self.topics)
+        remote = bool(options)
+        self.sampler = None
+        self.stream = None
+        if adaptive and not remote:
+            rng = random.Random(self.recording.seed) if self.recording is not None else None
+            self.sampler = AdaptiveSampler.for_user(
+                self.username, self.analytics, rng=rng, topics=self.topics
+            )
+            options["draw_question"] = self.sampler
+        elif endless and not remote:
+            # Epochs come from a permutation: no pool copy at each boundary
+            self.stream = QuestionStream(self.topics, resume.state["stream"] if resume else None)
+            options["draw_question"] = self.stream
+        elif self.topics and not remote:
+            options["draw_question"] = partial(generate_quiz_question, topics=self.topics)
+        if draw_question is not None:
+            options["draw_question"] = draw_question
+
+        # Crash-safe checkpoints (local bank only: remote questions live on the server)
+        self.checkpoint = None
+        if not remote:
+            self.checkpoint = resume or SessionCheckpoint.start(
+                self.username, self.settings(), self.ATTEMPT_WINDOW if endless else None
+            )
+            draw = options.get("draw_question", generate_quiz_question)
+            # A restored stream continues its exact permutation: nothing to skip
+            restored = resume is not None and draw is self.stream
+            options["draw_question"] = self._checkpointed_draw(
+                draw, resume.state["drawn"] if resume and not restored else ()
+            )
+
+        if self.recording is not None:
+            options["draw_question"] = self._recorded_draw(
+                options.get("draw_question", generate_quiz_question)
+            )
+
+        if endless:
+            # Marathon sessions keep their own best score and a bounded history
+            options["load_best"] = partial(load_best_score, key="marathon_best")
+            options["save_best"] = partial(save_best_score, key="marathon_best")
+            options["attempts"] = AttemptLog(self.ATTEMPT_WINDOW, user=self.username)
+        else:
+            # Written out when the session ends, latencies included
+            options["attempts"] = AttemptLog(
+                self.ATTEMPT_WINDOW, user=self.username, path=attempt_log.ATTEMPT_LOG_FILE
+            )
+
+        self.engine = QuizEngine(
+            total_questions=None if endless else self.TOTAL_QUESTIONS,
+            record_attempt=self._record_attempt,
+            time_limit_ms=self.SPEED_ROUND_MS if speed else None,
+            **options
+        )
 
         # Used when a correct answer is selected
         # and the system waits for key/click to continue
         self.waiting_for_next = False
-        self.installEventFilter(self)
+
+        # Speed round: one timer refreshes the countdown; the time left
+        # always comes from the engine's clock, never from tick counting
+        self.countdown_timer = QTimer(self)
+        self.countdown_timer.setInterval(self.COUNTDOWN_INTERVAL_MS)
+        self.countdown_timer.timeout.connect(self._tick_countdown)
+
+        # Next question, already laid out on the hidden page
+        self._prepared = None
 
         # --- UI Setup ---
         self._build_ui()
         self._apply_styles()
 
-        # Load first question
-        self.show_question()
+        # Load first question (or the one a resumed session was on)
+        if resume is not None:
+            self._restore(resume)
+        if self.engine.state == QuizEngine.ASKING:
+            self._display(self.engine.current_question)
+        else:
+            self.show_question()
+
+    @classmethod
+    def resume(cls, main_menu, checkpoint: SessionCheckpoint) -> "PlayQuizView":
+        """Continue the session stored in `checkpoint` exactly where it stopped."""
+        return cls(main_menu, resume=checkpoint, **checkpoint.state["options"])
+
+    def settings(self) -> dict:
+        """The options this quiz was started with (reused by Play Again)."""
+        return {"adaptive": self.adaptive, "topics": self.topics,
+                "speed": self.speed, "endless": self.endless}
 
     # ======================================================================
     # UI BUILDING
@@ -60,16 +179,22 @@ class PlayQuizView(QWidget):
         top_layout = QHBoxLayout(top_row)
         top_layout.setContentsMargins(16, 12, 16, 12)
 
-        self.btn_back = QPushButton("Return to Menu")
+        self.btn_back = QPushButton("End Marathon" if self.endless else "Return to Menu")
         self.btn_back.setObjectName("BackBtn")
-        self.btn_back.clicked.connect(self.return_to_menu)
+        self.btn_back.clicked.connect(self.end_marathon if self.endless else self.return_to_menu)
         self.btn_back.setCursor(Qt.PointingHandCursor)
 
         self.score_label = QLabel(self._score_text())
         self.score_label.setObjectName("Score")
 
+        self.countdown_label = QLabel("")
+        self.countdown_label.setObjectName("Countdown")
+        self.countdown_label.setVisible(self.speed)
+
         top_layout.addWidget(self.btn_back)
         top_layout.addStretch()
+        top_layout.addWidget(self.countdown_label)
+        top_layout.addSpacing(10)
         top_layout.addWidget(self.score_label)
 
         outer.addWidget(top_row)
@@ -87,46 +212,24 @@ class PlayQuizView(QWidget):
         # --- Feedback overlay (wrong answers) ------------------------------
         self.overlay = FeedbackOverlay(self)
 
-        # --- Question metadata + text --------------------------------------
-        meta = QVBoxLayout()
-        meta.setSpacing(6)
-
-        self.meta_label = QLabel("")
-        self.meta_label.setObjectName("Tiny")
-
-        self.question_label = QLabel()
-        self.question_label.setObjectName("Question")
-        self.question_label.setWordWrap(True)
-        self.question_label.setSizePolicy(
-            QSizePolicy.Preferred, QSizePolicy.Expanding
-        )
-
-        meta.addWidget(self.meta_label)
-        meta.addWidget(self.question_label)
-        root.addLayout(meta)
-
-        # --- Space before answer buttons -----------------------------------
-        root.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
-
-        # --- "Press any key" hint ------------------------------------------
-        self.continue_label = QLabel("")
-        self._style_continue_hint()
-        self.continue_label.hide()
-
-        root.addWidget(self.continue_label)
-
-        # --- Answer buttons ------------------------------------------------
-        self.option_buttons = []
-        self.answers_box = QVBoxLayout()
-        self.answers_box.setSpacing(8)
-
-        for i in range(4):
-            btn = AnswerButton()
-            btn.clicked.connect(lambda index=i: self.check_answer(index))
-            self.answers_box.addWidget(btn)
-            self.option_buttons.append(btn)
-
-        root.addLayout(self.answers_box)
+        # --- Question pages (front + back buffer) --------------------------
+        # The hidden page is filled with the next question while the
+        # current one is answered (see _prefetch_next)
+        self.pages = QStackedWidget()
+        for _ in range(2):
+            page = QuestionPage()
+            page.answer_clicked.connect(self.check_answer)
+            page.rendered.connect(self._on_question_rendered)
+            self.pages.addWidget(page)
+
+        root.addWidget(self.pages)
+
+        # --- Answer shortcuts (only enabled while a question is asked) -----
+        self.answer_shortcuts = []
+        for key, index in self.ANSWER_KEYS.items():
+            shortcut = QShortcut(QKeySequence(key), self)
+            shortcut.activated.connect(lambda index=index: self.check_answer(index))
+            self.answer_shortcuts.append(shortcut)
 
     # ======================================================================
     # STYLING HELPERS
@@ -149,6 +252,11 @@ class PlayQuizView(QWidget):
                 font-weight: bold;
                 font-size: 16px;
             }
+            QLabel#Countdown {
+                color: #D95968;
+                font-weight: bold;
+                font-size: 16px;
+            }
             QLabel#Tiny  {
                 color: rgba(255,255,255,0.9);
                 font-size: 16px;
@@ -180,113 +288,223 @@ class PlayQuizView(QWidget):
             }
         """)
 
-    def _style_continue_hint(self):
-        """Styles the subtle 'press any key' label."""
-        self.continue_label.setAlignment(Qt.AlignCenter)
-        self.continue_label.setStyleSheet(
-            "color: rgba(255,255,255,0.65); font-size: 13px; font-weight: 400;"
-        )
-
     # ======================================================================
     # QUIZ HELPERS
     # ======================================================================
 
     def _score_text(self):
-        return f"Score: {self.correct_count}/{self.total_count}"
+        return self.engine.score_text()
 
     def _update_top(self):
         """Refreshes score display."""
         self.score_label.setText(self._score_text())
 
+    @property
+    def page(self) -> QuestionPage:
+        """The question page on screen."""
+        return self.pages.currentWidget()
+
+    @property
+    def option_buttons(self):
+        return self.page.option_buttons
+
     def disable_all_buttons(self):
         """Prevents all answer buttons from being clicked."""
         for button in self.option_buttons:
             button.setEnabled(False)
+        self._set_answering(False)
+
+    def _set_answering(self, answering: bool):
+        """Answer shortcuts and countdown run only while a question is asked."""
+        for shortcut in self.answer_shortcuts:
+            shortcut.setEnabled(answering)
+
+        if not self.speed:
+            return
+        if answering:
+            self._tick_countdown()
+            self.countdown_timer.start()
+        else:
+            self.countdown_timer.stop()
 
     def _advance_after_correct(self):
         """Resets UI and loads the next question, or game over."""
         # If finished, show end screen
-        if self.question_counter >= self.total_questions:
+        if self.engine.is_finished:
             self.open_game_over()
             return
 
-        # Otherwise continue normally
-        for btn in self.option_buttons:
-            btn.setState(None)
-            btn.setSelected(False)
-            btn.setEnabled(True)
-
         self.show_question()
 
     # ======================================================================
     # MAIN GAME FLOW
     # ======================================================================
 
+    @timed("quiz.show_question")
     def show_question(self):
         """Loads and displays a new quiz question."""
-        # Check if finished BEFORE loading new question
-        if self.question_counter >= self.total_questions:
+        # Returns None once all questions have been asked
+        question = self.engine.next_question()
+        if question is None:
             self.open_game_over()
             return
 
-        # Then continue normally
-        self.question_counter += 1
+        self._display(question)
+
+    def _display(self, question):
+        """Puts the engine's current question on screen."""
+        if question is self._prepared:
+            # Already laid out on the hidden page: just switch pages
+            self.pages.setCurrentIndex(1 - self.pages.currentIndex())
+        else:
+            self.page.load(self.engine.question_counter, question)
+        self._prepared = None
+
         self._update_top()
+        self._set_answering(True)
 
-        question = generate_quiz_question()
-        self.current_question = question
+    def _on_question_rendered(self):
+        """The question is on screen: latency and countdown start now."""
+        self.engine.mark_rendered()
+        if self.speed:
+            self._tick_countdown()
 
-        self.meta_label.setText(f"Question {self.question_counter}")
+    @timed("quiz.prefetch")
+    def _prefetch_next(self):
+        """
+        Draw the next question and lay it out on the hidden page.
+        Runs right after an answer, while the user reads the feedback.
+        """
+        if self.engine.state != QuizEngine.ANSWERED or self._prepared is not None:
+            return
 
-        text = question.question.strip()
-        self.question_label.setText(
-            text[0].upper() + text[1:] if text else text
-        )
+        question = self.engine.prefetch()
+        if question is None:
+            return
 
-        for i, btn in enumerate(self.option_buttons):
-            btn.setText(question.options[i])
-            btn.setSelected(False)
-            btn.setState(None)
-            btn.setEnabled(True)
+        back = self.pages.widget(1 - self.pages.currentIndex())
+        back.load(self.engine.question_counter + 1, question)
+        back.prepare(self.page.size())
+        self._prepared = question
+
+    def _record_attempt(self, attempt):
+        if self.checkpoint is not None:
+            self.checkpoint.record_answer(attempt)
+        self._observe(attempt)
+
+    def _observe(self, attempt):
+        self.session_topics.add(attempt.topic)
+        self.analytics.record_attempt(self.username, attempt)
+        if self.sampler is not None:
+            self.sampler.observe(attempt)
+
+    # ======================================================================
+    # CHECKPOINTS
+    # ======================================================================
+
+    def _checkpointed_draw(self, draw, drawn_ids=()):
+        """
+        Wraps a draw_question source so every draw is checkpointed.
+        On resume, `drawn_ids` (questions the session already had) are
+        skipped: the process-wide rotations restart empty after a crash.
+        A restored QuestionStream passes none.
+        """
+        skip = set(drawn_ids)
+
+        def draw_question():
+            question = draw()
+            for _ in range(len(skip)):
+                if question.id not in skip:
+                    break
+                question = draw()
+
+            if self.checkpoint is not None:
+                stream_state = self.stream.state() if self.stream is not None else None
+                self.checkpoint.record_draw(question.id, stream_state)
+            return question
+
+        return draw_question
+
+    def _recorded_draw(self, draw):
+        def draw_question():
+            question = draw()
+            self.recording.record_draw(question)
+            return question
+
+        return draw_question
+
+    def _record(self, kind: str, *args):
+        if self.recording is not None:
+            self.recording.record(kind, *args)
+
+    def _restore(self, checkpoint: SessionCheckpoint):
+        """Rebuilds engine, analytics and sampler state from a checkpoint."""
+        state = checkpoint.state
+        checkpoint.compact()     # continue from a clean snapshot
+
+        attempts = []
+        for question_id, selected, correct, latency_ns, timed_out in state["answers"]:
+            question = question_by_id(question_id)
+            topic = question.topic if question is not None else None
+            attempt = Attempt(question_id, topic, selected, bool(correct), latency_ns, bool(timed_out))
+            # Unsaved before the crash: analytics and sampler catch up here
+            self._observe(attempt)
+            attempts.append(attempt)
+
+        current = question_by_id(state["current"]) if state["current"] is not None else None
+        self.engine.restore(state["counter"], state["correct"], state["total"], attempts, current)
+
+    def _end_session(self):
+        """The quiz ended or was abandoned: no resume offer for it."""
+        self.countdown_timer.stop()
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+            self.checkpoint = None
+        self.engine.attempts.close()
+        self.analytics.save_in_background()
 
     def open_game_over(self):
-        self.game_over_window = PlayQuizGameOverView(
+        self._end_session()
+        result = self.engine.finish()
+
+        navigate(self, PlayQuizGameOverView(
             main_menu=self.main_menu,
-            score_correct=self.correct_count,
-            score_total=self.total_count
-        )
-        self.game_over_window.show()
-        self.close()
+            result=result,
+            analytics=self.analytics,
+            session_topics=self.session_topics,
+            quiz_options=self.settings()
+        ))
 
+    @timed("quiz.check_answer")
     def check_answer(self, selected_index):
-        """Handles a button click and determines correctness."""
-        if not self.current_question:
+        """Handles a button click or answer key and determines correctness."""
+        # Read the clock first: this is the input event's timestamp
+        at_ns = self.engine.clock()
+        if self.engine.state != QuizEngine.ASKING:
             return
+        self._record("answer", selected_index)
 
         # Highlight selected button
         for i, btn in enumerate(self.option_buttons):
             btn.setSelected(i == selected_index)
 
-        question = self.current_question
-        selected_letter = "abcd"[selected_index]
-
-        self.total_count += 1
-        is_correct = question.is_correct(selected_letter)
+        question = self.engine.current_question
+        result = self.engine.answer(selected_index, at_ns)
 
         # Lock answer buttons
         self.disable_all_buttons()
+        self._update_top()
 
-        if is_correct:
-            # Mark answer as correct visually
-            self.correct_count += 1
-            self._update_top()
+        # Prepare the next question once this feedback has been painted
+        QTimer.singleShot(0, self._prefetch_next)
 
+        if result.is_correct:
+            # Mark answer as correct visually
             if hasattr(self.option_buttons[selected_index], "setState"):
                 self.option_buttons[selected_index].setState("correct")
 
             # Show hint + wait for user interaction
-            self.continue_label.setText("Press any key to continue…")
-            self.continue_label.show()
+            self.page.show_hint("Press any key to continue…")
 
             self.waiting_for_next = True
             return
@@ -296,48 +514,94 @@ class PlayQuizView(QWidget):
             self.option_buttons[selected_index].setState("wrong")
 
         # Highlight correct choice
-        try:
-            correct_index = "abcd".index(question.correct.lower())
-            if hasattr(self.option_buttons[correct_index], "setState"):
-                self.option_buttons[correct_index].setState("correct")
-        except Exception:
-            pass
+        if result.correct_index is not None:
+            self.option_buttons[result.correct_index].setState("correct")
 
         # Show explanation overlay
         msg = f"Correct answer: {question.correct}.\n{question.explanation}"
         self.overlay.show_message("Incorrect", msg, on_close=self._after_wrong_answer, state="wrong")
 
+    # ======================================================================
+    # SPEED ROUND
+    # ======================================================================
+
+    def _tick_countdown(self):
+        remaining = self.engine.remaining_ms()
+        if remaining is None:
+            return
+
+        self.countdown_label.setText(f"⏱ {remaining / 1000:.1f}s")
+        if remaining <= 0:
+            self.time_out()
+
+    def time_out(self):
+        """The countdown ran out: show the answer like a wrong one."""
+        if self.engine.state != QuizEngine.ASKING:
+            return
+        self._record("timeout")
+
+        question = self.engine.current_question
+        result = self.engine.time_out()
+
+        self.disable_all_buttons()
+        self._update_top()
+        QTimer.singleShot(0, self._prefetch_next)
+
+        if result.correct_index is not None:
+            self.option_buttons[result.correct_index].setState("correct")
+
+        msg = f"Correct answer: {question.correct}.\n{question.explanation}"
+        self.overlay.show_message("Time's up", msg, on_close=self._after_wrong_answer, state="wrong")
+
     # ======================================================================
     # NAVIGATION + EVENT HANDLING
     # ======================================================================
 
-    def eventFilter(self, obj, event):
-        """
-        Captures mouse clicks or key presses when the quiz
-        is waiting for the user to continue after a correct answer.
-        """
+    def keyPressEvent(self, event):
+        """Any key continues after a correct answer."""
         if self.waiting_for_next:
-            if event.type() in (QEvent.MouseButtonPress, QEvent.KeyPress):
-                self._continue_after_wait()
-                return True
+            self._continue_after_wait()
+            return
+        super().keyPressEvent(event)
 
-        return super().eventFilter(obj, event)
+    def mousePressEvent(self, event):
+        """Any click continues after a correct answer."""
+        if self.waiting_for_next:
+            self._continue_after_wait()
+            return
+        super().mousePressEvent(event)
 
     def _continue_after_wait(self):
         """Clears hint and advances to next question."""
+        self._record("continue")
         self.waiting_for_next = False
-        self.continue_label.hide()
+        self.page.hide_hint()
         self._advance_after_correct()
 
     def _after_wrong_answer(self):
         """Handles flow after wrong answer."""
-        if self.question_counter >= self.total_questions:
+        self._record("dismiss")
+        if self.engine.is_finished:
             self.open_game_over()
             return
 
         self.show_question()
 
+    def end_marathon(self):
+        """Ends an endless session: game over once something was answered."""
+        if self.engine.total_count == 0:
+            self.return_to_menu()
+            return
+        self._record("end")
+        self.open_game_over()
+
     def return_to_menu(self):
         """Returns to the main menu."""
-        self.main_menu.show()
-        self.close()
\ No newline at end of file
+        self._record("end")
+        self._end_session()
+        navigate(self, self.main_menu)
+
+    def closeEvent(self, event):
+        if self.recording is not None:
+            self.recording.save()
+        super().closeEvent(event)
\ No newline at end of file
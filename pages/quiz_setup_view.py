@@ -0,0 +1,290 @@
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QCheckBox, QScrollArea, QFrame
+)
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QFontMetrics
+
+from coach.client import topic_counts
+from data.question_generator import topic_facets
+from diagnostics.instrumentation import timed
+from pages.play_quiz_view import PlayQuizView
+from pages.view_manager import navigate
+
+
+class QuizSetupView(QWidget):
+    """
+    Window shown between the Main Menu and the Quiz gameplay.
+    Lets the user choose:
+        - which topics to play (all by default)
+        - adaptive mode (favour weak topics)
+        - speed round (a countdown per question)
+        - marathon (endless questions)
+    The choice is remembered on the main menu for the next quiz.
+    """
+
+    TOPIC_TEXT_WIDTH = 220
+
+    @timed("view.QuizSetupView")
+    def __init__(self, main_menu):
+        super().__init__()
+
+        self.main_menu = main_menu
+        options = getattr(main_menu, "quiz_options", {})
+
+        # Counts + bitsets are precomputed once per bank
+        remote_counts = topic_counts()
+        self.facets = None if remote_counts is not None else topic_facets()
+        self.counts = remote_counts if remote_counts is not None else self.facets.counts
+        self.topics = sorted(self.counts, key=lambda topic: (-self.counts[topic], topic))
+
+        self.setWindowTitle("Choose Topics")
+        self.setFixedSize(360, 640)
+
+        # ======================================================
+        # OUTER LAYOUT
+        # ======================================================
+        outer = QVBoxLayout(self)
+        outer.setContentsMargins(0, 0, 0, 0)
+        outer.setSpacing(0)
+
+        # ======================================================
+        # TOP BAR (same as all screens)
+        # ======================================================
+        top_row = QWidget()
+        top_row.setObjectName("TopRow")
+        top_row.setFixedHeight(60)
+
+        top_layout = QHBoxLayout(top_row)
+        top_layout.setContentsMargins(16, 12, 16, 12)
+
+        btn_back = QPushButton("Return to Menu")
+        btn_back.setObjectName("BackBtn")
+        btn_back.setCursor(Qt.PointingHandCursor)
+        btn_back.clicked.connect(self.return_to_menu)
+
+        top_layout.addWidget(btn_back)
+        top_layout.addStretch()
+
+        outer.addWidget(top_row)
+
+        # ======================================================
+        # CONTENT AREA — GRADIENT BACKGROUND
+        # ======================================================
+        content = QWidget()
+        content.setObjectName("Root")
+
+        root = QVBoxLayout(content)
+        root.setContentsMargins(20, 24, 20, 20)
+        root.setSpacing(12)
+
+        outer.addWidget(content)
+
+        # ======================================================
+        # TITLE
+        # ======================================================
+        title = QLabel("Choose Topics")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("color: white; font-size: 34px; font-weight: 800;")
+        root.addWidget(title)
+
+        self.selected_label = QLabel()
+        self.selected_label.setAlignment(Qt.AlignCenter)
+        self.selected_label.setStyleSheet("color: white; font-size: 16px; font-weight: 600;")
+        root.addWidget(self.selected_label)
+
+        # ======================================================
+        # TOPIC LIST
+        # ======================================================
+        self.all_box = QCheckBox(f"All topics ({sum(self.counts.values())})")
+        self.all_box.setObjectName("AllTopics")
+        self.all_box.setCursor(Qt.PointingHandCursor)
+        self.all_box.toggled.connect(self._toggle_all)
+        root.addWidget(self.all_box)
+
+        topic_list = QWidget()
+        topic_list.setObjectName("TopicList")
+        list_layout = QVBoxLayout(topic_list)
+        list_layout.setContentsMargins(12, 8, 12, 8)
+        list_layout.setSpacing(6)
+
+        chosen = set(options.get("topics") or self.topics)
+        font = QFont(self.font())
+        font.setPixelSize(13)
+        font.setWeight(QFont.DemiBold)
+        metrics = QFontMetrics(font)
+
+        self.topic_boxes = {}
+        for topic in self.topics:
+            name = metrics.elidedText(topic, Qt.ElideRight, self.TOPIC_TEXT_WIDTH)
+            box = QCheckBox(f"{name} ({self.counts[topic]})".replace("&", "&&"))
+            box.setToolTip(topic)
+            box.setCursor(Qt.PointingHandCursor)
+            box.setChecked(topic in chosen)
+            box.toggled.connect(self._update_selection)
+            list_layout.addWidget(box)
+            self.topic_boxes[topic] = box
+        list_layout.addStretch()
+
+        scroll = QScrollArea()
+        scroll.setObjectName("TopicScroll")
+        scroll.setFrameShape(QFrame.NoFrame)
+        scroll.setWidgetResizable(True)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        scroll.setWidget(topic_list)
+        root.addWidget(scroll, stretch=1)
+
+        # ======================================================
+        # OPTIONS + START
+        # ======================================================
+        self.adaptive_box = QCheckBox("Focus on my weak topics")
+        self.adaptive_box.setCursor(Qt.PointingHandCursor)
+        self.adaptive_box.setChecked(options.get("adaptive", False))
+        root.addWidget(self.adaptive_box)
+
+        seconds = PlayQuizView.SPEED_ROUND_MS // 1000
+        self.speed_box = QCheckBox(f"Speed round ({seconds} s per question)")
+        self.speed_box.setCursor(Qt.PointingHandCursor)
+        self.speed_box.setChecked(options.get("speed", False))
+        root.addWidget(self.speed_box)
+
+        self.endless_box = QCheckBox("Marathon (no question limit)")
+        self.endless_box.setCursor(Qt.PointingHandCursor)
+        self.endless_box.setChecked(options.get("endless", False))
+        root.addWidget(self.endless_box)
+
+        self.btn_start = QPushButton("Start Quiz")
+        self.btn_start.setObjectName("ActionBtn")
+        self.btn_start.setCursor(Qt.PointingHandCursor)
+        self.btn_start.setFixedHeight(60)
+        self.btn_start.clicked.connect(self.start_quiz)
+        root.addWidget(self.btn_start)
+
+        self._update_selection()
+
+        # ======================================================
+        # STYLESHEET (same as Game Over)
+        # ======================================================
+        self.setStyleSheet("""
+            QWidget#TopRow {
+                background: white;
+            }
+
+            QWidget#Root {
+                background: qlineargradient(
+                    x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #D959A8,
+                    stop:1 #D95968
+                );
+            }
+
+            QScrollArea#TopicScroll, QWidget#TopicList {
+                background: transparent;
+            }
+
+            QWidget#TopicList {
+                background: rgba(255, 255, 255, 0.16);
+                border-radius: 14px;
+            }
+
+            QCheckBox {
+                color: white;
+                font-size: 13px;
+                font-weight: 600;
+            }
+
+            QCheckBox#AllTopics {
+                font-size: 16px;
+            }
+
+            QPushButton#BackBtn {
+                background: qlineargradient(
+                    x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #fff7b1,
+                    stop:1 #ffd84d
+                );
+                color: #3a3500;
+                border: none;
+                border-radius: 18px;
+                padding: 10px;
+                font-size: 16px;
+                font-weight: 600;
+            }
+
+            QPushButton#BackBtn:hover {
+                background: qlineargradient(
+                    x1:0,y1:0,x2:1,y2:0,
+                    stop:0 #ffe066, stop:1 #ffd84d
+                );
+            }
+
+            QPushButton#ActionBtn {
+                background: white;
+                color: #222;
+                border: none;
+                border-radius: 22px;
+                padding: 12px;
+                font-size: 20px;
+                font-weight: 600;
+            }
+
+            QPushButton#ActionBtn:hover {
+                background: #f1f1f1;
+            }
+
+            QPushButton#ActionBtn:disabled {
+                background: rgba(255, 255, 255, 0.5);
+                color: #777;
+            }
+        """)
+
+    # ======================================================
+    # SELECTION
+    # ======================================================
+
+    def selected_topics(self) -> list:
+        return [topic for topic, box in self.topic_boxes.items() if box.isChecked()]
+
+    def selected_count(self) -> int:
+        topics = self.selected_topics()
+        if self.facets is None:
+            return sum(self.counts[topic] for topic in topics)
+        return self.facets.count(self.facets.mask(topics))
+
+    def _toggle_all(self, checked):
+        for box in self.topic_boxes.values():
+            box.blockSignals(True)
+            box.setChecked(checked)
+            box.blockSignals(False)
+        self._update_selection()
+
+    def _update_selection(self):
+        topics = self.selected_topics()
+
+        self.all_box.blockSignals(True)
+        self.all_box.setChecked(len(topics) == len(self.topic_boxes))
+        self.all_box.blockSignals(False)
+
+        count = self.selected_count()
+        self.selected_label.setText(f"{count} question{'s' if count != 1 else ''} selected")
+        self.btn_start.setEnabled(bool(topics))
+
+    # ======================================================
+    # BUTTON LOGIC
+    # ======================================================
+
+    def return_to_menu(self):
+        navigate(self, self.main_menu)
+
+    def start_quiz(self):
+        """Open the quiz with the chosen settings (remembered on the menu)."""
+        topics = self.selected_topics()
+        self.main_menu.quiz_options = {
+            # All topics → no filter (and the shared all-topics rotation)
+            "topics": None if len(topics) == len(self.topic_boxes) else topics,
+            "adaptive": self.adaptive_box.isChecked(),
+            "speed": self.speed_box.isChecked(),
+            "endless": self.endless_box.isChecked(),
+        }
+
+        navigate(self, PlayQuizView(main_menu=self.main_menu, **self.main_menu.quiz_options))
@@ -1,24 +1,32 @@
 # pages/ui/animated_border_button.py
 
 from PySide6.QtWidgets import QPushButton
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QPainter, QPen, QColor, QConicalGradient, QBrush
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPainter, QPen, QColor, QConicalGradient, QBrush, QRegion
+
+from pages.ui.animation_driver import AnimationDriver
 
 
 class AnimatedBorderButton(QPushButton):
     """
     QPushButton with an animated pastel border along its own outline
     when loading is True.
+
+    The border only repaints its own outline, and the animation pauses
+    while the button is hidden or its window is minimized.
     """
 
+    BORDER_WIDTH = 3
+    BORDER_RADIUS = 22  # matches the QSS border-radius
+    ROTATION_MS = 3600  # one full turn of the gradient
+
     def __init__(self, text: str = "", parent=None):
         super().__init__(text, parent)
         self._loading = False
-        self._phase = 0.0
+        self._phase = 0.0  # gradient angle in degrees
 
-        self._timer = QTimer(self)
-        self._timer.setInterval(40)  # animation speed
-        self._timer.timeout.connect(self._on_timeout)
+        self._driver = AnimationDriver(self, duration=self.ROTATION_MS, loop=True)
+        self._driver.frame.connect(self._on_frame)
 
     # ------------------------------------------------------------------ #
     # Public API
@@ -28,21 +36,37 @@ class AnimatedBorderButton(QPushButton):
         self._loading = loading
         if loading:
             self._phase = 0.0
-            self._timer.start()
+            self._driver.start()
         else:
-            self._timer.stop()
+            self._driver.stop()
             self._phase = 0.0
-            self.update()
+            self.update(self._border_region())
 
     # ------------------------------------------------------------------ #
     # Internal
     # ------------------------------------------------------------------ #
-    def _on_timeout(self):
+    def _on_frame(self, progress: float):
         # Rotate the gradient for motion effect
-        self._phase += 2.0
-        if self._phase > 1000:
-            self._phase = 0.0
-        self.update()
+        self._phase = progress * 360.0
+        self.update(self._border_region())
+
+    def _border_rect(self):
+        # Slightly inside the button rect so the border isn't clipped
+        return self.rect().adjusted(1, 1, -1, -1)
+
+    def _border_region(self) -> QRegion:
+        """
+        Only the ring under the border needs repainting each frame.
+        The corner squares are kept whole because the rounded corners
+        curve further into the button than the straight edges.
+        """
+        outer = self.rect()
+        inset = self.BORDER_WIDTH + 2
+        corner = self.BORDER_RADIUS + inset
+
+        inner = QRegion(outer.adjusted(inset, corner, -inset, -corner))
+        inner = inner.united(QRegion(outer.adjusted(corner, inset, -corner, -inset)))
+        return QRegion(outer).subtracted(inner)
 
     def paintEvent(self, event):
         # First paint normal button (background + text, styled by QSS)
@@ -54,11 +78,10 @@ class AnimatedBorderButton(QPushButton):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        # Slightly inside the button rect so the border isn't clipped
-        rect = self.rect().adjusted(1, 1, -1, -1)
+        rect = self._border_rect()
 
         # Pastel "rainbow" gradient that rotates with _phase
-        grad = QConicalGradient(rect.center(), self._phase * 2.0)
+        grad = QConicalGradient(rect.center(), self._phase)
         grad.setColorAt(0.00, QColor(255, 179, 186))  # soft pink
         grad.setColorAt(0.20, QColor(255, 223, 186))  # peach
         grad.setColorAt(0.40, QColor(255, 255, 186))  # light yellow
@@ -68,11 +91,11 @@ class AnimatedBorderButton(QPushButton):
 
         brush = QBrush(grad)
 
-        pen = QPen(brush, 3)
+        pen = QPen(brush, self.BORDER_WIDTH)
         pen.setStyle(Qt.SolidLine)  # full continuous line, no gaps
 
         painter.setPen(pen)
         painter.setBrush(Qt.NoBrush)
 
         # Match your QSS border-radius (22)
-        painter.drawRoundedRect(rect, 22, 22)
\ No newline at end of file
+        painter.drawRoundedRect(rect, self.BORDER_RADIUS, self.BORDER_RADIUS)
\ No newline at end of file
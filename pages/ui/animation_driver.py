@@ -0,0 +1,191 @@
+# pages/ui/animation_driver.py
+"""
+A small, reusable driver for custom-painted widget animations.
+
+Instead of a free-running QTimer, frames come from Qt's unified
+animation timer (via QVariantAnimation), so ticks line up with the
+rest of Qt's animations and the screen refresh.
+
+The driver:
+  - only emits frames while its widget is actually visible
+    (pauses on hide / minimize, resumes on show / restore)
+  - lowers its frame rate automatically when ticks start arriving
+    late (CPU pressure) and raises it again once things calm down
+  - supports both looping (loading border) and one-shot
+    (card flip) animations
+"""
+
+from PySide6.QtCore import (
+    QObject, QEvent, QElapsedTimer, QVariantAnimation,
+    QAbstractAnimation, QEasingCurve, Signal
+)
+
+
+class AnimationDriver(QObject):
+    """
+    Emits `frame(progress)` with a progress value in [0.0, 1.0].
+
+    Connect `frame` to whatever updates the widget state, and
+    invalidate only the region that actually changed.
+    """
+
+    frame = Signal(float)
+    finished = Signal()
+
+    # Ticks later than this factor × frame interval count as "late"
+    LATE_FACTOR = 1.8
+    # Consecutive late ticks before the frame rate is lowered
+    LATE_TICKS_TO_THROTTLE = 3
+    # Consecutive on-time frames before the frame rate is raised again
+    ON_TIME_FRAMES_TO_RECOVER = 90
+
+    def __init__(
+        self,
+        widget,
+        duration: int = 1000,
+        loop: bool = False,
+        max_fps: int = 60,
+        min_fps: int = 12,
+        easing: QEasingCurve.Type = QEasingCurve.Linear,
+    ):
+        super().__init__(widget)
+
+        self._widget = widget
+        self._window = None
+        self._loop = loop
+        self._wanted = False      # True between start() and stop()/finish
+
+        self.max_fps = max_fps
+        self.min_fps = min_fps
+        self.fps = max_fps
+
+        self._clock = QElapsedTimer()
+        self._last_tick = 0
+        self._last_frame = 0
+        self._late_ticks = 0
+        self._on_time_frames = 0
+
+        self._anim = QVariantAnimation(self)
+        self._anim.setStartValue(0.0)
+        self._anim.setEndValue(1.0)
+        self._anim.setDuration(duration)
+        self._anim.setEasingCurve(easing)
+        self._anim.setLoopCount(-1 if loop else 1)
+        self._anim.valueChanged.connect(self._on_tick)
+        self._anim.finished.connect(self._on_finished)
+
+        widget.installEventFilter(self)
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+    def setDuration(self, duration: int):
+        self._anim.setDuration(duration)
+
+    def isRunning(self) -> bool:
+        """True while the animation is wanted (even if currently paused)."""
+        return self._wanted
+
+    def start(self):
+        """Start from progress 0.0. Pauses right away if the widget is hidden."""
+        self._wanted = True
+        self.fps = self.max_fps
+        self._late_ticks = 0
+        self._on_time_frames = 0
+        self._watch_window()
+
+        self._clock.start()
+        self._last_tick = 0
+        self._last_frame = -10 ** 6   # first tick always paints
+
+        self._anim.stop()
+        self._anim.start()
+        if not self._can_run():
+            self._anim.pause()
+
+    def stop(self):
+        """Stop without emitting `finished`."""
+        self._wanted = False
+        self._anim.stop()
+
+    # ------------------------------------------------------------------ #
+    # Visibility handling
+    # ------------------------------------------------------------------ #
+    def _watch_window(self):
+        """Track the top-level window too, to notice minimize/restore."""
+        window = self._widget.window()
+        if window is self._window:
+            return
+        if self._window is not None:
+            self._window.removeEventFilter(self)
+        self._window = window
+        if window is not self._widget:
+            window.installEventFilter(self)
+
+    def _can_run(self) -> bool:
+        window = self._widget.window()
+        return self._widget.isVisible() and not window.isMinimized()
+
+    def _sync_running_state(self):
+        if not self._wanted:
+            return
+
+        state = self._anim.state()
+        if self._can_run():
+            if state == QAbstractAnimation.Paused:
+                # Avoid counting the pause as one giant late tick
+                self._last_tick = self._clock.elapsed()
+                self._anim.resume()
+        elif state == QAbstractAnimation.Running:
+            self._anim.pause()
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange):
+            self._sync_running_state()
+        elif event.type() == QEvent.ParentChange and obj is self._widget:
+            self._watch_window()
+        return False
+
+    # ------------------------------------------------------------------ #
+    # Frame pacing
+    # ------------------------------------------------------------------ #
+    def _frame_interval(self) -> float:
+        return 1000.0 / self.fps
+
+    def _on_tick(self, value):
+        now = self._clock.elapsed()
+        tick_gap = now - self._last_tick
+        self._last_tick = now
+
+        self._adapt_frame_rate(tick_gap)
+
+        if now - self._last_frame < self._frame_interval():
+            return  # skip this tick, we're throttled
+
+        self._last_frame = now
+        self.frame.emit(float(value))
+
+    def _adapt_frame_rate(self, tick_gap: int):
+        """
+        Late ticks mean the GUI thread is busy: halve the frame rate
+        after a few in a row. Recover gradually once ticks are on time.
+        """
+        if tick_gap > self._frame_interval() * self.LATE_FACTOR:
+            self._late_ticks += 1
+            self._on_time_frames = 0
+            if self._late_ticks >= self.LATE_TICKS_TO_THROTTLE:
+                self.fps = max(self.min_fps, self.fps // 2)
+                self._late_ticks = 0
+            return
+
+        self._late_ticks = 0
+        self._on_time_frames += 1
+        if self._on_time_frames >= self.ON_TIME_FRAMES_TO_RECOVER:
+            self.fps = min(self.max_fps, int(self.fps * 1.5))
+            self._on_time_frames = 0
+
+    def _on_finished(self):
+        self._wanted = False
+        # Always land exactly on the final frame, even if throttled
+        self.frame.emit(1.0)
+        self.finished.emit()
@@ -1,7 +1,9 @@
 # pages/ui/answer_button.py
-from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel
+from PySide6.QtWidgets import QFrame, QHBoxLayout
 from PySide6.QtCore import Qt, Signal
 
+from pages.ui.fit_text_label import FitTextLabel
+
 
 class AnswerButton(QFrame):
     """
@@ -37,9 +39,10 @@ class AnswerButton(QFrame):
         layout.setContentsMargins(16, 12, 16, 12)
         layout.setAlignment(Qt.AlignVCenter)
 
-        self.label = QLabel(text, self)
+        # Up to three lines at full size; longer answers shrink to fit
+        self.label = FitTextLabel(text, self, min_pixel_size=11)
         self.label.setObjectName("AnswerText")
-        self.label.setWordWrap(True)
+        self.label.setMaximumHeight(60)
         layout.addWidget(self.label)
 
     # ======================================================================
@@ -0,0 +1,151 @@
+"""
+pages/ui/asset_manager.py
+
+Process-wide access to the images in data/images.
+
+- The data/images folder is located once per process.
+- Scaled pixmaps live in QPixmapCache, keyed by (name, size, device
+  pixel ratio), so rebuilding a menu reuses the already scaled icons.
+- preload_assets() decodes and scales every image on a background
+  thread at startup. Only QImage is used off the GUI thread; the
+  cheap QImage → QPixmap conversion happens on first use.
+"""
+
+import threading
+from pathlib import Path
+
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".gif"}
+
+_images_root = None
+_resolved_paths = {}     # name -> resolved path string
+
+_preloaded = {}          # cache key -> scaled QImage from the preload thread
+_preloaded_lock = threading.Lock()
+
+
+# ======================================================================
+# PATH RESOLUTION
+# ======================================================================
+
+def images_root() -> Path:
+    """
+    Locate the data/images folder (resolved only once per process).
+
+    Priority:
+      1. data/images next to this file
+      2. Walk up parents to find 'data/images'
+      3. CWD/data/images
+    """
+    global _images_root
+
+    if _images_root is None:
+        here = Path(__file__).resolve().parent
+        candidates = [here / "data" / "images"]
+        candidates += [parent / "data" / "images" for parent in here.parents]
+        candidates.append(Path.cwd() / "data" / "images")
+
+        _images_root = next((c for c in candidates if c.is_dir()), candidates[-1])
+
+    return _images_root
+
+
+def resolve_image_path(image_path: str) -> str:
+    """
+    Resolve an image name (e.g. "brain.png") or an absolute path.
+    Falls back to the name itself, which QPixmap treats as CWD-relative.
+    """
+    resolved = _resolved_paths.get(image_path)
+    if resolved is not None:
+        return resolved
+
+    p = Path(image_path)
+    if p.is_absolute():
+        resolved = str(p)
+    else:
+        candidate = images_root() / image_path
+        resolved = str(candidate) if candidate.exists() else image_path
+
+    _resolved_paths[image_path] = resolved
+    return resolved
+
+
+# ======================================================================
+# PIXMAPS
+# ======================================================================
+
+def _cache_key(name: str, size: QSize, ratio: float) -> str:
+    return f"asset:{name}:{size.width()}x{size.height()}@{ratio:g}"
+
+
+def _load_scaled_image(path: str, size: QSize, ratio: float) -> QImage:
+    """Decode and scale an image to `size` logical pixels at `ratio`."""
+    image = QImage(path)
+    if image.isNull():
+        return image
+
+    target = QSize(round(size.width() * ratio), round(size.height() * ratio))
+    image = image.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    image.setDevicePixelRatio(ratio)
+    return image
+
+
+def scaled_pixmap(name: str, size: QSize, ratio: float = 1.0) -> QPixmap:
+    """
+    Return the image `name` scaled to fit `size` (keeping aspect ratio),
+    rendered for the given device pixel ratio.
+
+    Returns a null QPixmap if the image cannot be loaded.
+    """
+    key = _cache_key(name, size, ratio)
+
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    with _preloaded_lock:
+        image = _preloaded.pop(key, None)
+
+    if image is None:
+        image = _load_scaled_image(resolve_image_path(name), size, ratio)
+
+    pixmap = QPixmap.fromImage(image)
+    if not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# ======================================================================
+# BACKGROUND PRELOAD
+# ======================================================================
+
+def preload_assets(sizes, ratio: float = 1.0) -> threading.Thread:
+    """
+    Decode and scale every image in data/images for each of `sizes`
+    on a background thread. Returns the (already started) thread.
+    """
+    sizes = list(sizes)
+
+    def run():
+        root = images_root()
+        if not root.is_dir():
+            return
+
+        for path in sorted(root.iterdir()):
+            if path.suffix.lower() not in IMAGE_EXTENSIONS:
+                continue
+
+            _resolved_paths.setdefault(path.name, str(path))
+            for size in sizes:
+                image = _load_scaled_image(str(path), size, ratio)
+                if image.isNull():
+                    continue
+                with _preloaded_lock:
+                    _preloaded.setdefault(_cache_key(path.name, size, ratio), image)
+
+    thread = threading.Thread(target=run, name="asset-preload", daemon=True)
+    thread.start()
+    return thread
@@ -1,12 +1,11 @@
-import os
-from pathlib import Path
-
 from PySide6.QtWidgets import (
     QPushButton, QHBoxLayout, QVBoxLayout, QLabel
 )
-from PySide6.QtGui import QPainter, QBrush, QLinearGradient, QColor, QPixmap
+from PySide6.QtGui import QPainter, QBrush, QLinearGradient, QColor
 from PySide6.QtCore import Qt, QRectF
 
+from pages.ui.asset_manager import scaled_pixmap, resolve_image_path
+
 
 class GradientCardButton(QPushButton):
     """
@@ -19,6 +18,8 @@ class GradientCardButton(QPushButton):
     Used on the main menu as a primary navigation card.
     """
 
+    ICON_SIZE = 60
+
     def __init__(
         self,
         level_text: str,
@@ -90,28 +91,21 @@ class GradientCardButton(QPushButton):
         """Optional small icon on the right side of the card."""
         img_label = QLabel()
         img_label.setStyleSheet("background: transparent;")
-        img_label.setFixedSize(60, 60)
+        img_label.setFixedSize(self.ICON_SIZE, self.ICON_SIZE)
         img_label.setAlignment(Qt.AlignRight | Qt.AlignTop)
 
-        full_path = self._resolve_image_path(image_path)
-        pix = QPixmap(full_path)
-
-        if pix.isNull():
-            # fallback: try original path directly
-            pix = QPixmap(image_path)
+        # Scaled once per (name, size, DPR) and shared by every menu rebuild
+        pix = scaled_pixmap(
+            image_path, img_label.size(), img_label.devicePixelRatioF()
+        )
 
         if pix.isNull():
             # Debug info only, doesn't crash UI
             print(
-                f"[GradientCardButton] Image NOT found: tried '{full_path}' and '{image_path}'"
+                f"[GradientCardButton] Image NOT found: '{resolve_image_path(image_path)}'"
             )
             return
 
-        pix = pix.scaled(
-            img_label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
         img_label.setPixmap(pix)
 
         # Hug the right/top edge
@@ -121,44 +115,6 @@ class GradientCardButton(QPushButton):
             Qt.AlignRight | Qt.AlignTop
         )
 
-    def _resolve_image_path(self, image_path: str) -> str:
-        """
-        Try to robustly resolve an image path.
-
-        Priority:
-          1. Absolute path that exists
-          2. <this_file>/data/images/<image_path>
-          3. Walk up parents to find 'data/images/<image_path>'
-          4. CWD/data/images/<image_path>
-          5. Fallback: <this_file>/data/images/<image_path> (even if missing)
-        """
-        p = Path(image_path)
-
-        # 1) Absolute path
-        if p.is_absolute() and p.exists():
-            return str(p)
-
-        here = Path(__file__).resolve().parent
-
-        # 2) data/images next to this file
-        candidate = here / "data" / "images" / image_path
-        if candidate.exists():
-            return str(candidate)
-
-        # 3) Walk up parents to find data/images
-        for parent in here.parents:
-            candidate = parent / "data" / "images" / image_path
-            if candidate.exists():
-                return str(candidate)
-
-        # 4) CWD/data/images
-        candidate = Path.cwd() / "data" / "images" / image_path
-        if candidate.exists():
-            return str(candidate)
-
-        # 5) Last resort (probably missing, but QPixmap will handle it)
-        return str(here / "data" / "images" / image_path)
-
     # ======================================================================
     # CUSTOM PAINTING
     # ======================================================================
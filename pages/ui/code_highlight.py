@@ -0,0 +1,280 @@
+"""
+pages/ui/code_highlight.py
+
+Python syntax highlighting for flashcard text.
+
+Flashcard answers (and some questions) mix prose with short Python
+snippets: ```fenced blocks```, `inline code`, or whole lines such as
+"print(type(x))". split_code() finds those parts; highlight_python()
+colours them with the stdlib tokenize module and returns HTML for a
+rich-text label (FitTextLabel lays it out as QStaticText).
+
+Results are memoized per card (its id, or a hash of its text for AI
+cards that have none), so flipping or revisiting a card never
+tokenizes again. start_precompute() fills the memo for the whole
+flashcard bank on a background thread at startup; only plain strings
+are built there, the Qt layout still happens on the GUI thread.
+"""
+
+import ast
+import builtins
+import hashlib
+import html
+import io
+import keyword
+import re
+import threading
+import tokenize
+
+from data.question_generator import load_flashcard_pool
+
+
+CODE_FONT = "Menlo, Consolas, 'DejaVu Sans Mono', monospace"
+
+STYLES = {
+    "keyword": "color:#0033b3;font-weight:600",
+    "builtin": "color:#7a3e9d",
+    "definition": "color:#00627a;font-weight:600",
+    "string": "color:#067d17",
+    "number": "color:#1750eb",
+    "comment": "color:#8c8c8c;font-style:italic",
+}
+
+_FENCED = re.compile(r"```[ \t]*(?:python|py)?[ \t]*\n?(.*?)```", re.DOTALL)
+_INLINE = re.compile(r"`([^`\n]+)`")
+_EXAMPLE = re.compile(r"(.*?\b(?:for example|example|e\.g\.)\s*[:,]\s*)(.+)$", re.IGNORECASE)
+_CODE_CHARS = set("()[]=:")
+_BUILTINS = frozenset(dir(builtins))
+
+_cards = {}     # card key -> CardText
+
+
+# ======================================================================
+# DETECTION
+# ======================================================================
+
+def _is_code(line: str) -> bool:
+    """A line that parses as Python and uses code punctuation (not prose)."""
+    line = line.strip()
+    if not line or not _CODE_CHARS & set(line):
+        return False
+    try:
+        tree = ast.parse(line)
+    except (SyntaxError, ValueError):
+        # A block opener ("def f(x):", "for i in x:") needs a body
+        if not line.endswith(":"):
+            return False
+        try:
+            ast.parse(line + " pass")
+        except (SyntaxError, ValueError):
+            return False
+        return True
+
+    # "Output: 5", "Answer: True" parse as annotated names: prose
+    only = tree.body[0] if len(tree.body) == 1 else None
+    return not (isinstance(only, ast.AnnAssign) and isinstance(only.target, ast.Name))
+
+
+def _split_lines(text: str) -> list:
+    """Prose/code parts of text without fences or backticks."""
+    parts = []
+    for line in text.splitlines(keepends=True):
+        body = line.rstrip("\n")
+        block_body = parts and parts[-1][0] and body[:1].isspace() and body.strip()
+        if block_body or _is_code(body):
+            parts.append((True, line))
+            continue
+
+        # "..., for example: num = '5'; convert = int(num)"
+        match = _EXAMPLE.match(body)
+        if match and _is_code(match.group(2)):
+            parts.append((False, match.group(1)))
+            parts.append((True, line[match.end(1):]))
+        else:
+            parts.append((False, line))
+    return parts
+
+
+def split_code(text: str) -> list:
+    """
+    Split `text` into (is_code, part) pairs, in order. Adjacent parts
+    of the same kind are merged. Text with no code gives [(False, text)].
+    """
+    parts = []
+    position = 0
+    for match in _FENCED.finditer(text):
+        parts += _split_inline(text[position:match.start()])
+        parts.append((True, match.group(1).strip("\n")))
+        position = match.end()
+    parts += _split_inline(text[position:])
+
+    merged = []
+    for is_code, part in parts:
+        if not part:
+            continue
+        if merged and merged[-1][0] == is_code:
+            merged[-1] = (is_code, merged[-1][1] + part)
+        else:
+            merged.append((is_code, part))
+    return merged
+
+
+def _split_inline(text: str) -> list:
+    parts = []
+    position = 0
+    for match in _INLINE.finditer(text):
+        parts += _split_lines(text[position:match.start()])
+        parts.append((True, match.group(1)))
+        position = match.end()
+    parts += _split_lines(text[position:])
+    return parts
+
+
+# ======================================================================
+# HIGHLIGHTING
+# ======================================================================
+
+def _escape(text: str, line_start: bool = False) -> str:
+    """HTML-escape, keeping line breaks and indentation."""
+    text = html.escape(text, quote=False)
+    pattern = r"(?m)^ +" if line_start else r"(?<=\n) +"
+    text = re.sub(pattern, lambda m: "&nbsp;" * len(m.group(0)), text)
+    return text.replace("  ", " &nbsp;").replace("\n", "<br>")
+
+
+def _at_line_start(code: str, index: int) -> bool:
+    return index == 0 or code[index - 1] == "\n"
+
+
+def _token_style(token, previous) -> str | None:
+    if token.type == tokenize.NAME:
+        if keyword.iskeyword(token.string):
+            return "keyword"
+        if previous is not None and previous.string in ("def", "class"):
+            return "definition"
+        if token.string in _BUILTINS:
+            return "builtin"
+    elif token.type == tokenize.STRING:
+        return "string"
+    elif token.type == tokenize.NUMBER:
+        return "number"
+    elif token.type == tokenize.COMMENT:
+        return "comment"
+    return None
+
+
+def highlight_python(code: str) -> str:
+    """HTML for `code`, coloured by token type (monospace, line breaks kept)."""
+    lines = code.splitlines(keepends=True)
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+
+    out = []
+    position = 0
+    previous = None
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(code).readline):
+            if token.type in (tokenize.ENDMARKER, tokenize.DEDENT):
+                continue
+            start = offsets[token.start[0] - 1] + token.start[1]
+            end = offsets[token.end[0] - 1] + token.end[1]
+            if start < position:
+                continue
+
+            out.append(_escape(code[position:start], _at_line_start(code, position)))
+            style = _token_style(token, previous)
+            text = _escape(code[start:end], _at_line_start(code, start))
+            out.append(f'<span style="{STYLES[style]}">{text}</span>' if style else text)
+            position = end
+            if token.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.INDENT):
+                previous = token
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        pass    # unfinished snippet: the rest stays plain
+
+    out.append(_escape(code[position:]))
+    return f'<span style="font-family:{CODE_FONT}">{"".join(out)}</span>'
+
+
+def highlight_text(text: str) -> str | None:
+    """Rich text for `text` with its code highlighted, or None if it has no code."""
+    parts = split_code(text)
+    if not any(is_code for is_code, _ in parts):
+        return None
+    return "".join(
+        highlight_python(part) if is_code else _escape(part)
+        for is_code, part in parts
+    )
+
+
+# ======================================================================
+# PER-CARD MEMO
+# ======================================================================
+
+class CardText:
+    """
+    What a flashcard shows on each side: the text, and whether it is
+    rich text (highlighted code) or plain text.
+    """
+
+    __slots__ = ("front", "front_rich", "back", "back_rich")
+
+    def __init__(self, question: str, answer: str):
+        question = question.strip()
+        question = question[0].upper() + question[1:] if question else question
+
+        front_html = highlight_text(question)
+        back_html = highlight_text(answer)
+
+        self.front = front_html if front_html is not None else question
+        self.front_rich = front_html is not None
+        self.back = back_html if back_html is not None else answer
+        self.back_rich = back_html is not None
+
+
+def card_key(card):
+    """The card's id, or a hash of its text for cards without one."""
+    if getattr(card, "id", None) is not None:
+        return card.id
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(card.question.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(card.answer.encode("utf-8"))
+    return "h:" + digest.hexdigest()
+
+
+def card_text(card) -> CardText:
+    """The card's (memoized) display text."""
+    key = card_key(card)
+    text = _cards.get(key)
+    if text is None:
+        text = _cards.setdefault(key, CardText(card.question, card.answer))
+    return text
+
+
+def precompute(cards) -> int:
+    """Highlight every card not memoized yet; returns how many were done."""
+    done = 0
+    for card in cards:
+        key = card_key(card)
+        if key not in _cards:
+            _cards.setdefault(key, CardText(card.question, card.answer))
+            done += 1
+    return done
+
+
+def start_precompute(cards=None) -> threading.Thread:
+    """
+    precompute() on a background thread, for `cards` or the whole
+    flashcard bank. Returns the (already started) thread.
+    """
+    def run():
+        precompute(cards if cards is not None else load_flashcard_pool())
+
+    thread = threading.Thread(target=run, name="card-highlight", daemon=True)
+    thread.start()
+    return thread
+
+
+def clear_cache():
+    _cards.clear()
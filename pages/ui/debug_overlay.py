@@ -0,0 +1,94 @@
+"""
+pages/ui/debug_overlay.py
+
+Hidden debug overlay showing live span latencies from
+diagnostics.instrumentation. Only installed when instrumentation is
+enabled; Ctrl+Shift+D toggles it on the active window.
+"""
+
+from PySide6.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
+from PySide6.QtCore import QObject, QEvent, Qt, QTimer
+
+from diagnostics import instrumentation
+
+
+class DebugOverlay(QWidget):
+    """A translucent panel listing count / p50 / p99 / max per span."""
+
+    REFRESH_MS = 500
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setObjectName("DebugOverlay")
+        self.setStyleSheet("""
+            QWidget#DebugOverlay {
+                background: rgba(0, 0, 0, 170);
+            }
+            QLabel {
+                color: #B8FFB8;
+                font-family: monospace;
+                font-size: 10px;
+                background: transparent;
+            }
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+
+        self.label = QLabel()
+        self.label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        layout.addWidget(self.label)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+        self.hide()
+
+    def toggle(self):
+        if self.isVisible():
+            self._timer.stop()
+            self.hide()
+            return
+
+        self.setGeometry(self.parentWidget().rect())
+        self.refresh()
+        self.show()
+        self.raise_()
+        self._timer.start()
+
+    def refresh(self):
+        rows = [f"{'span':<24}{'n':>6}{'p50':>8}{'p99':>8}{'max':>8}"]
+        for name, stats in instrumentation.to_json().items():
+            rows.append(
+                f"{name[:23]:<24}{stats['count']:>6}"
+                f"{stats['p50_ms']:>8.2f}{stats['p99_ms']:>8.2f}{stats['max_ms']:>8.2f}"
+            )
+        rows.append("(ms)  Ctrl+Shift+D to hide")
+        self.label.setText("\n".join(rows))
+
+
+class _OverlayToggle(QObject):
+    """Application-wide Ctrl+Shift+D handler."""
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.KeyPress and event.key() == Qt.Key_D and (
+            event.modifiers() == (Qt.ControlModifier | Qt.ShiftModifier)
+        ):
+            window = QApplication.activeWindow()
+            if window is not None:
+                overlay = window.findChild(DebugOverlay)
+                if overlay is None:
+                    overlay = DebugOverlay(window)
+                overlay.toggle()
+                return True
+        return False
+
+
+def install_debug_overlay(app: QApplication):
+    """Install the Ctrl+Shift+D toggle (keeps a reference on the app)."""
+    app.debug_overlay_toggle = _OverlayToggle(app)
+    app.installEventFilter(app.debug_overlay_toggle)
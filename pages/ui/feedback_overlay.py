@@ -15,6 +15,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor
 
+from diagnostics.instrumentation import timed
+
 
 class FeedbackOverlay(QWidget):
     """
@@ -143,6 +145,7 @@ class FeedbackOverlay(QWidget):
     # PUBLIC API
     # ======================================================================
 
+    @timed("overlay.show_message")
     def show_message(self, title: str, text: str, on_close=None, state: str | None = None):
         """
         Display the overlay using the given title/body.
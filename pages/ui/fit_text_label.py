@@ -0,0 +1,215 @@
+"""
+pages/ui/fit_text_label.py
+
+Word-wrapped label that shrinks its font until the text fits.
+
+Questions, answer options and flashcard faces go into fixed-size
+surfaces (a 300×240 card, a 360×640 window). A plain word-wrapped
+QLabel either grows and pushes the layout around or gets clipped.
+FitTextLabel keeps its box and picks the largest font size, between
+`min_pixel_size` and the stylesheet's font size, at which the wrapped
+text fits in it (binary search).
+
+Plain text by default; with setTextFormat(Qt.RichText) the text is
+HTML (e.g. highlighted code from code_highlight.py). Layouts are
+QStaticText objects, prepared once and reused for every paint. Two process-wide LRU caches make repeated texts cheap:
+- measured heights, keyed by (text, format, width, font, pixel size)
+- fitted layouts, keyed by (text, format, box size, font, alignment)
+so showing the same card or question again does no text layout at all.
+"""
+
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QPointF, QSize
+from PySide6.QtGui import QFont, QFontInfo, QPainter, QStaticText, QTextOption, QTransform
+from PySide6.QtWidgets import QLabel, QSizePolicy
+
+
+MEASURE_CACHE_SIZE = 4096
+FIT_CACHE_SIZE = 1024
+
+_heights = OrderedDict()   # (text, rich, width, font key, px) -> wrapped height
+_fits = OrderedDict()      # (text, rich, w, h, font key, min px, align) -> (px, QStaticText)
+
+
+def _cached(cache: OrderedDict, key, limit: int, compute):
+    """LRU lookup: most recently used entries are kept, oldest evicted."""
+    try:
+        cache.move_to_end(key)
+        return cache[key]
+    except KeyError:
+        value = cache[key] = compute()
+        if len(cache) > limit:
+            cache.popitem(last=False)
+        return value
+
+
+def _with_pixel_size(font: QFont, px: int) -> QFont:
+    sized = QFont(font)
+    sized.setPixelSize(px)
+    return sized
+
+
+def layout_text(text: str, width: int, font: QFont, align, rich: bool = False) -> QStaticText:
+    """A prepared, word-wrapped layout of `text` (HTML if `rich`) at `width`."""
+    option = QTextOption(align)
+    option.setWrapMode(QTextOption.WrapAtWordBoundaryOrAnywhere)
+
+    static = QStaticText(text)
+    static.setTextFormat(Qt.RichText if rich else Qt.PlainText)
+    static.setTextOption(option)
+    static.setTextWidth(width)
+    static.prepare(QTransform(), font)
+    return static
+
+
+def text_height(text: str, width: int, font: QFont, px: int, rich: bool = False) -> float:
+    """Height of `text` wrapped at `width` in `font` at `px` pixels (cached)."""
+    return _cached(
+        _heights, (text, rich, width, font.key(), px), MEASURE_CACHE_SIZE,
+        lambda: layout_text(
+            text, width, _with_pixel_size(font, px), Qt.AlignLeft, rich
+        ).size().height()
+    )
+
+
+def fit_pixel_size(text: str, size: QSize, font: QFont, min_px: int, max_px: int,
+                   rich: bool = False) -> int:
+    """Largest pixel size in [min_px, max_px] whose wrapped text fits `size`."""
+    if text_height(text, size.width(), font, max_px, rich) <= size.height():
+        return max_px
+
+    low, high = min_px, max_px - 1
+    while low < high:
+        middle = (low + high + 1) // 2
+        if text_height(text, size.width(), font, middle, rich) <= size.height():
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def clear_caches():
+    _heights.clear()
+    _fits.clear()
+
+
+class FitTextLabel(QLabel):
+    """
+    Drop-in for a word-wrapped QLabel (same stylesheet selectors,
+    setText()/text()) whose font shrinks to fit its box instead of
+    the box growing to fit the text.
+
+    The stylesheet font size is the maximum. The size hint is the
+    wrapped height at that size (capped by maximumHeight()) and the
+    minimum one line, so short texts keep their natural size and long
+    ones are scaled down when the layout has no more room.
+    """
+
+    def __init__(self, text: str = "", parent=None, min_pixel_size: int = 11):
+        super().__init__(parent)
+        self.min_pixel_size = min_pixel_size
+        self._static = None
+        self._static_key = None
+
+        self.setWordWrap(True)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        self.setText(text)
+
+    # ======================================================================
+    # TEXT
+    # ======================================================================
+
+    def setText(self, text: str):
+        super().setText(text)
+        self._static_key = None
+        self.updateGeometry()
+        self.update()
+
+    def is_rich(self) -> bool:
+        return self.textFormat() == Qt.RichText
+
+    def max_pixel_size(self) -> int:
+        """The stylesheet's font size (QFontInfo resolves point sizes too)."""
+        return max(QFontInfo(self.font()).pixelSize(), self.min_pixel_size)
+
+    def fitted(self) -> tuple[int, QStaticText]:
+        """(pixel size, prepared layout) for the current text and box."""
+        box = self.contentsRect().size()
+        font = self.font()
+        align = int(self.alignment() & Qt.AlignHorizontal_Mask)
+        rich = self.is_rich()
+        key = (self.text(), rich, box.width(), box.height(), font.key(), self.min_pixel_size, align)
+
+        if key != self._static_key:
+            def compute():
+                px = fit_pixel_size(
+                    self.text(), box, font, self.min_pixel_size, self.max_pixel_size(), rich
+                )
+                static = layout_text(
+                    self.text(), box.width(), _with_pixel_size(font, px),
+                    Qt.AlignmentFlag(align), rich
+                )
+                return px, static
+
+            self._static = _cached(_fits, key, FIT_CACHE_SIZE, compute)
+            self._static_key = key
+        return self._static
+
+    # ======================================================================
+    # SIZE HINTS
+    # ======================================================================
+
+    def hasHeightForWidth(self) -> bool:
+        # QLabel's word-wrap height-for-width would make the layout grow
+        # (or the fixed-size window overflow) to fit the text
+        return False
+
+    def heightForWidth(self, width: int) -> int:
+        margins = self.contentsMargins()
+        inner = width - margins.left() - margins.right()
+        if not self.text() or inner <= 0:
+            return margins.top() + margins.bottom()
+
+        natural = text_height(
+            self.text(), inner, self.font(), self.max_pixel_size(), self.is_rich()
+        )
+        return min(int(natural + 0.999) + margins.top() + margins.bottom(), self.maximumHeight())
+
+    def sizeHint(self) -> QSize:
+        width = max(self.width(), 1)
+        return QSize(width, self.heightForWidth(width))
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(0, self.fontMetrics().height())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if event.size().width() != event.oldSize().width():
+            self.updateGeometry()     # the size hint depends on the width
+
+    # ======================================================================
+    # PAINTING
+    # ======================================================================
+
+    def paintEvent(self, _event):
+        if not self.text():
+            return
+
+        px, static = self.fitted()
+        rect = self.contentsRect()
+
+        # Vertical alignment (QStaticText only aligns horizontally)
+        top = rect.top()
+        slack = rect.height() - static.size().height()
+        if slack > 0:
+            if self.alignment() & Qt.AlignVCenter:
+                top += slack / 2
+            elif self.alignment() & Qt.AlignBottom:
+                top += slack
+
+        painter = QPainter(self)
+        painter.setClipRect(rect)
+        painter.setFont(_with_pixel_size(self.font(), px))
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawStaticText(QPointF(rect.left(), top), static)
@@ -1,5 +1,63 @@
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
-from PySide6.QtCore import Qt, QPropertyAnimation, QSequentialAnimationGroup, QAbstractAnimation
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QSizePolicy
+from PySide6.QtCore import (
+    Qt, QPoint, QPropertyAnimation, QSequentialAnimationGroup, QAbstractAnimation, Signal
+)
+from PySide6.QtGui import QPainter, QPixmap, QRegion
+
+from diagnostics.instrumentation import timed
+from pages.ui.animation_driver import AnimationDriver
+from pages.ui.code_highlight import card_text
+from pages.ui.fit_text_label import FitTextLabel
+
+
+class _FlipCanvas(QWidget):
+    """
+    Stand-in for the card face while a flip is running.
+
+    Paints pre-rendered snapshots of both sides, horizontally scaled
+    around the card's center line, so no layout or text wrapping
+    happens during the animation.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._front = None
+        self._back = None
+        self._progress = 0.0
+        self.hide()
+
+    def set_snapshots(self, front: QPixmap, back: QPixmap):
+        self._front = front
+        self._back = back
+
+    def clear(self):
+        """Drop the snapshots so the pixmap memory is released."""
+        self._front = None
+        self._back = None
+
+    def set_progress(self, progress: float):
+        self._progress = progress
+        self.update()
+
+    def paintEvent(self, _event):
+        if self._front is None or self._back is None:
+            return
+
+        # First half: the old side shrinks. Second half: the new side grows.
+        first_half = self._progress < 0.5
+        pixmap = self._front if first_half else self._back
+        scale = abs(1.0 - 2.0 * self._progress)
+        if scale < 0.01:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        center_x = self.width() / 2
+        painter.translate(center_x, 0)
+        painter.scale(scale, 1.0)
+        painter.translate(-center_x, 0)
+        painter.drawPixmap(0, 0, pixmap)
 
 
 class FlashcardWidget(QWidget):
@@ -7,11 +65,22 @@ class FlashcardWidget(QWidget):
     A single flashcard containing a question on the front
     and an answer on the back. Supports flipping with a width
     shrink/expand animation for a clean card-flip effect.
+
+    Flip modes:
+      - "snapshot" (default): both sides are rendered to pixmaps once
+        and the animation only scales those images.
+      - "resize": the original animation of the face's maximumWidth,
+        which re-lays out the card on every frame.
     """
 
-    def __init__(self, parent=None):
+    FLIP_DURATION = 300  # ms, both halves together
+
+    flipped = Signal()   # a flip started (user tap)
+
+    def __init__(self, parent=None, flip_mode: str = "snapshot"):
         super().__init__(parent)
         self.is_flipped = False  # False = front/question shown
+        self.flip_mode = flip_mode
 
         self._build_ui()
         self._configure_animation()
@@ -33,6 +102,11 @@ class FlashcardWidget(QWidget):
         self.face.setObjectName("Flashcard")
         self.face.setFixedSize(300, 240)
 
+        # Keep the face's space in the layout while the flip canvas covers it
+        policy = self.face.sizePolicy()
+        policy.setRetainSizeWhenHidden(True)
+        self.face.setSizePolicy(policy)
+
         outer.addWidget(self.face, alignment=Qt.AlignHCenter)
 
         # Inside-card layout
@@ -66,12 +140,15 @@ class FlashcardWidget(QWidget):
         # Enable clicking the card to flip it
         self.face.mousePressEvent = self.flip
 
+        # Shown on top of the (hidden) face during snapshot flips
+        self._canvas = _FlipCanvas(self)
+
     def _create_text_label(self):
-        """Creates a centered, word-wrapped label for card text."""
-        label = QLabel()
+        """Creates a centered label for card text, shrunk to fit the card."""
+        label = FitTextLabel(min_pixel_size=11)
         label.setObjectName("FlashcardText")
         label.setAlignment(Qt.AlignCenter)
-        label.setWordWrap(True)
+        label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
         return label
 
     # ======================================================================
@@ -79,8 +156,14 @@ class FlashcardWidget(QWidget):
     # ======================================================================
 
     def _configure_animation(self):
-        """Creates the shrink → swap → expand flip animation."""
+        """Creates the flip animations for both flip modes."""
 
+        # Snapshot mode: one driver, progress 0 → 1 over the whole flip
+        self.flip_driver = AnimationDriver(self, duration=self.FLIP_DURATION)
+        self.flip_driver.frame.connect(self._canvas.set_progress)
+        self.flip_driver.finished.connect(self._finish_snapshot_flip)
+
+        # Resize mode: shrink → swap → expand of the face width
         self.shrink = QPropertyAnimation(self.face, b"maximumWidth", self)
         self.expand = QPropertyAnimation(self.face, b"maximumWidth", self)
 
@@ -95,16 +178,25 @@ class FlashcardWidget(QWidget):
     # PUBLIC SETTERS
     # ======================================================================
 
-    def set_front_text(self, text: str):
-        """Updates the front (question) text."""
+    def set_front_text(self, text: str, rich: bool = False):
+        """Updates the front (question) text (HTML if `rich`)."""
+        self.front_label.setTextFormat(Qt.RichText if rich else Qt.PlainText)
         self.front_label.setText(text)
 
-    def set_back_text(self, text: str):
-        """Updates the back (answer) text."""
+    def set_back_text(self, text: str, rich: bool = False):
+        """Updates the back (answer) text (HTML if `rich`)."""
+        self.back_label.setTextFormat(Qt.RichText if rich else Qt.PlainText)
         self.back_label.setText(text)
 
+    def set_card(self, card):
+        """Shows `card` (an OpenQuestion), its code snippets highlighted."""
+        text = card_text(card)
+        self.set_front_text(text.front, text.front_rich)
+        self.set_back_text(text.back, text.back_rich)
+
     def show_front(self):
         """Switches card to question side."""
+        self._cancel_snapshot_flip()
         self.front_label.show()
         self.back_label.hide()
         self.is_flipped = False
@@ -113,6 +205,7 @@ class FlashcardWidget(QWidget):
 
     def show_back(self):
         """Switches card to answer side."""
+        self._cancel_snapshot_flip()
         self.front_label.hide()
         self.back_label.show()
         self.is_flipped = True
@@ -123,15 +216,72 @@ class FlashcardWidget(QWidget):
     # FLIP LOGIC
     # ======================================================================
 
+    def is_animating(self) -> bool:
+        """True while either flip animation is in progress."""
+        return (
+            self.flip_driver.isRunning()
+            or self.anim_group.state() != QAbstractAnimation.Stopped
+        )
+
+    @timed("flashcard.flip")
     def flip(self, event=None):
         """
         Starts the flip animation if no animation is already running.
-        Shrinks width to zero, swaps side, then expands back.
+        Shrinks the card to zero width, swaps side, then expands back.
         """
 
-        if self.anim_group.state() != QAbstractAnimation.Stopped:
+        if self.is_animating():
             return  # Ignore taps during animation
 
+        self.flipped.emit()
+        if self.flip_mode == "snapshot":
+            self._start_snapshot_flip()
+        else:
+            self._start_resize_flip()
+
+    def _start_snapshot_flip(self):
+        """
+        Render the current side, swap the live widgets to the other side
+        right away (hidden behind the canvas), render that too, then
+        animate the two images.
+        """
+        current_side = self._snapshot_face()
+        self._swap_side()
+        self.face.layout().activate()
+        other_side = self._snapshot_face()
+
+        self._canvas.setGeometry(self.face.geometry())
+        self._canvas.set_snapshots(current_side, other_side)
+        self._canvas.set_progress(0.0)
+        self._canvas.show()
+        self._canvas.raise_()
+        self.face.hide()
+
+        self.flip_driver.start()
+
+    def _finish_snapshot_flip(self):
+        """Put the live face back once the animation lands."""
+        self.face.show()
+        self._canvas.hide()
+        self._canvas.clear()
+
+    def _cancel_snapshot_flip(self):
+        """Abort a running flip, e.g. when the view loads the next card."""
+        if self.flip_driver.isRunning():
+            self.flip_driver.stop()
+            self._finish_snapshot_flip()
+
+    def _snapshot_face(self) -> QPixmap:
+        """Render the card face (with its rounded background) to a pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.face.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        self.face.render(pixmap, QPoint(), QRegion(), QWidget.DrawChildren)
+        return pixmap
+
+    def _start_resize_flip(self):
+        """Legacy flip: animate the face's maximumWidth."""
         full_width = max(self.face.width(), 300)
 
         # Shrink phase
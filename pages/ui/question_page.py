@@ -0,0 +1,133 @@
+# pages/ui/question_page.py
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSpacerItem, QSizePolicy
+from PySide6.QtCore import Qt, Signal
+
+from pages.ui.answer_button import AnswerButton
+from pages.ui.fit_text_label import FitTextLabel
+
+
+class QuestionPage(QWidget):
+    """
+    One quiz question screen:
+    - "Question N" metadata line
+    - Word-wrapped question text
+    - "Press any key" hint
+    - Four answer buttons
+
+    PlayQuizView keeps two of these in a QStackedWidget and fills the
+    hidden one with the next question while the user reads feedback,
+    so moving on is just a page switch.
+    """
+
+    answer_clicked = Signal(int)
+    rendered = Signal()     # first paint after load()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fresh = False
+        self._build_ui()
+
+    # ======================================================================
+    # UI SETUP
+    # ======================================================================
+
+    def _build_ui(self):
+        root = QVBoxLayout(self)
+        root.setContentsMargins(0, 0, 0, 0)
+        root.setSpacing(8)
+
+        # --- Question metadata + text --------------------------------------
+        meta = QVBoxLayout()
+        meta.setSpacing(6)
+
+        self.meta_label = QLabel("")
+        self.meta_label.setObjectName("Tiny")
+
+        # Long questions shrink to fit instead of pushing the answers down
+        self.question_label = FitTextLabel(min_pixel_size=12)
+        self.question_label.setObjectName("Question")
+        self.question_label.setSizePolicy(
+            QSizePolicy.Preferred, QSizePolicy.Expanding
+        )
+
+        meta.addWidget(self.meta_label)
+        meta.addWidget(self.question_label)
+        root.addLayout(meta)
+
+        # --- Space before answer buttons -----------------------------------
+        root.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
+
+        # --- "Press any key" hint ------------------------------------------
+        self.continue_label = QLabel("")
+        self.continue_label.setAlignment(Qt.AlignCenter)
+        self.continue_label.setStyleSheet(
+            "color: rgba(255,255,255,0.65); font-size: 13px; font-weight: 400;"
+        )
+        self.continue_label.hide()
+        root.addWidget(self.continue_label)
+
+        # --- Answer buttons ------------------------------------------------
+        self.option_buttons = []
+        answers_box = QVBoxLayout()
+        answers_box.setSpacing(8)
+
+        for i in range(4):
+            btn = AnswerButton()
+            btn.clicked.connect(lambda index=i: self.answer_clicked.emit(index))
+            answers_box.addWidget(btn)
+            self.option_buttons.append(btn)
+
+        root.addLayout(answers_box)
+
+    # ======================================================================
+    # CONTENT
+    # ======================================================================
+
+    def load(self, number: int, question):
+        """Show `question` as question `number`, with fresh buttons."""
+        self.meta_label.setText(f"Question {number}")
+
+        text = question.question.strip()
+        self.question_label.setText(
+            text[0].upper() + text[1:] if text else text
+        )
+
+        self.continue_label.hide()
+        for i, btn in enumerate(self.option_buttons):
+            btn.setText(question.options[i])
+            btn.setSelected(False)
+            btn.setState(None)
+            btn.setEnabled(True)
+
+        self._fresh = True
+
+    def prepare(self, size):
+        """
+        Polish and lay the page out at `size` while it is hidden, so the
+        word-wrapped text is measured before the page is switched in.
+        """
+        self.resize(size)
+        for widget in self.findChildren(QWidget):
+            widget.ensurePolished()
+        self.layout().activate()
+        self.question_label.fitted()
+        for btn in self.option_buttons:
+            btn.label.fitted()
+
+    def show_hint(self, text: str):
+        self.continue_label.setText(text)
+        self.continue_label.show()
+
+    def hide_hint(self):
+        self.continue_label.hide()
+
+    # ======================================================================
+    # EVENTS
+    # ======================================================================
+
+    def paintEvent(self, event):
+        """Report when a newly loaded question first reaches the screen."""
+        super().paintEvent(event)
+        if self._fresh:
+            self._fresh = False
+            self.rendered.emit()
@@ -0,0 +1,90 @@
+"""
+pages/view_manager.py
+
+Owns the app's top-level screens.
+
+Screens move with navigate(from_view, to_view) instead of keeping a
+reference to the next screen and calling show()/close() themselves:
+
+- The main menu is registered with keep_view() and recycled: it is
+  hidden and shown again, never rebuilt.
+- Every other screen gets WA_DeleteOnClose. When it is navigated away
+  from, Qt deletes it, and the manager drops its only Python reference.
+  Nothing else holds closed screens, so a round trip through the menu
+  leaves nothing behind.
+
+A worker thread still running when its screen closes is kept by
+keep_until_finished() until it ends, so deleting the screen is safe.
+
+With COACH_LEAKS=1, every return to the main menu closes a navigation
+cycle and diagnostics/leaks.py reports what grew during it.
+"""
+
+import shiboken6
+from PySide6.QtCore import Qt, QTimer
+
+from diagnostics import leaks
+
+
+_kept = []          # recycled screens (the main menu)
+_current = None     # the screen on display (the only strong reference)
+_threads = set()    # (thread, worker) pairs outliving their screen
+
+
+def keep_view(view):
+    """Register a screen that is hidden and reshown instead of deleted."""
+    if view not in _kept:
+        _kept.append(view)
+    return view
+
+
+def current_view():
+    return _current
+
+
+def navigate(from_view, to_view):
+    """
+    Show `to_view` in place of `from_view`. Recycled screens are
+    hidden; any other screen is closed and deleted by Qt.
+    """
+    global _current
+
+    if to_view not in _kept:
+        to_view.setAttribute(Qt.WA_DeleteOnClose, True)
+
+    _current = to_view
+    to_view.show()
+
+    if from_view is not None and from_view is not to_view:
+        if from_view in _kept:
+            from_view.hide()
+        else:
+            from_view.close()
+
+    # Sampled from the event loop, once the closed screen is really gone
+    if leaks.ENABLED and to_view in _kept:
+        QTimer.singleShot(0, leaks.end_cycle)
+
+    return to_view
+
+
+def release_all():
+    """Close every managed screen (end of a soak run or of the app)."""
+    global _current
+
+    if _current is not None and _current not in _kept:
+        _current.close()
+    _current = None
+    for view in _kept:
+        view.close()
+    _kept.clear()
+
+
+def keep_until_finished(thread, worker=None):
+    """Keep a running QThread (and its worker) alive after its screen is deleted."""
+    if thread is None or not shiboken6.isValid(thread) or not thread.isRunning():
+        return
+
+    entry = (thread, worker)
+    _threads.add(entry)
+    thread.finished.connect(lambda: _threads.discard(entry))
@@ -0,0 +1,109 @@
+"""
+Run from the project root:
+
+    python -m pytest tests/test_server.py      (or python -m unittest)
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from coach.server import (
+    MAX_BODY_BYTES, QuestionBank, QuizService, ScoreStore, SQLitePool
+)
+
+
+QUESTION = {
+    "id": 1, "topic": "Loops", "question": "?", "options": ["a", "b", "c", "d"],
+    "correct": "a", "explanation": "",
+}
+
+
+async def _read_response(reader) -> tuple:
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    headers = {}
+    for line in head[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers["content-length"]))
+    return int(head[0].split(" ")[1]), headers, body
+
+
+class PipelinedErrorTest(unittest.TestCase):
+    """A request rejected before its body is read must not poison the connection."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self._tmp.name, "scores.sqlite3")
+        ScoreStore.create_schema(db_path)
+        self.pool = SQLitePool(db_path, size=1)
+        self.service = QuizService(QuestionBank([QUESTION], []), ScoreStore(self.pool))
+
+    def tearDown(self):
+        self.pool.close()
+        self._tmp.cleanup()
+
+    def _exchange(self, request: bytes) -> list:
+        """Send `request` on one connection; every response until the server closes it."""
+        async def run():
+            server = await asyncio.start_server(self.service.serve_connection, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(request)
+                await writer.drain()
+                responses = []
+                while not reader.at_eof():
+                    try:
+                        responses.append(await _read_response(reader))
+                    except asyncio.IncompleteReadError:
+                        break
+                writer.close()
+                return responses
+
+        return asyncio.run(asyncio.wait_for(run(), 10))
+
+    def _assert_closed_after(self, responses: list, status: int):
+        self.assertEqual(len(responses), 1, [r[0] for r in responses])
+        got_status, headers, _ = responses[0]
+        self.assertEqual(got_status, status)
+        self.assertEqual(headers["connection"], "close")
+
+    def test_negative_content_length_closes_connection(self):
+        body = b'{"x":1}'
+        request = (
+            b"POST /sessions HTTP/1.1\r\nContent-Length: -5\r\n\r\n" + body
+            + b"GET /topics HTTP/1.1\r\n\r\n"
+        )
+        self._assert_closed_after(self._exchange(request), 400)
+
+    def test_invalid_content_length_closes_connection(self):
+        request = (
+            b"POST /sessions HTTP/1.1\r\nContent-Length: seven\r\n\r\n{\"x\":1}"
+            + b"GET /topics HTTP/1.1\r\n\r\n"
+        )
+        self._assert_closed_after(self._exchange(request), 400)
+
+    def test_oversized_body_closes_connection(self):
+        # Only the start of the body is sent: the server must answer without reading on
+        request = (
+            f"POST /sessions HTTP/1.1\r\nContent-Length: {MAX_BODY_BYTES + 1}\r\n\r\n"
+            "GET /topics HTTP/1.1\r\n\r\n"
+        ).encode("latin-1")
+        self._assert_closed_after(self._exchange(request), 413)
+
+    def test_bad_json_body_keeps_connection(self):
+        # The body was read in full, so the pipelined request is still served
+        request = (
+            b"POST /sessions HTTP/1.1\r\nContent-Length: 5\r\n\r\n{bad}"
+            + b"GET /topics HTTP/1.1\r\nConnection: close\r\n\r\n"
+        )
+        responses = self._exchange(request)
+        self.assertEqual([status for status, _, _ in responses], [400, 200])
+        self.assertEqual(json.loads(responses[1][2]), {"Loops": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()